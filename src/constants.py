@@ -5,6 +5,11 @@ SCREEN_WIDTH = 720
 SCREEN_HEIGHT = 1280
 FPS = 60
 
+# Simulación a paso fijo (independiente de los FPS de render)
+SIMULATION_RATE = 60 # Pasos de simulación por segundo
+SIMULATION_DT = 1.0 / SIMULATION_RATE # Duración de un paso en segundos
+MAX_SIM_STEPS = 5 # Pasos máximos por frame; con más carga el juego se ralentiza en vez de bloquearse
+
 # Colores
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -28,6 +33,17 @@ PLAYER_LIVES = 3
 # Proyectiles
 PROJECTILE_SIZE = 32 # Ajustado para los sprites
 PROJECTILE_SPEED = 10
+PROJECTILE_PIERCING_HITS = 2 # Enemigos que atraviesa un proyectil perforante
+PROJECTILE_ENGINE = "objects" # "objects" (Projectile + ProjectilePool) o "batch" (ProjectileBatch con NumPy)
+
+# Render de la partida: "full" (fill + flip por frame), "dirty" (solo las zonas que cambian, ver DirtyRectRenderer)
+# o "sprites" (grupo pygame.sprite.LayeredDirty, ver utils.sprite_groups)
+RENDER_MODE = "full"
+# Colisiones: "arrays" (find_overlaps con NumPy y rejillas espaciales) o "groups" (pygame.sprite.groupcollide/spritecollide)
+COLLISION_ENGINE = "arrays"
+# Envío de sprites: False = un screen.blit por entidad, True = cola de render por capas con un fblits
+# por capa (utils.render_queue; las barras de vida quedan encima de todos los enemigos)
+SPRITE_BATCHING = False
 
 # Enemigos
 ENEMY_SIZE = 96 # Ajustado para los sprites
@@ -7,17 +7,38 @@ Descripción: Lógica, animaciones y barra de vida de los enemigos del juego.
 """
 import pygame
 import random
-import time
 from constants import *
 from entities.projectile import Projectile
-from utils.image_loader import load_image, load_animation_frames
+from utils.image_loader import load_facing_animation_frames, FACING_RIGHT
 from utils.advanced_logger import get_logger
+from utils.trace import get_channel
+from ui.health_bar import get_health_bar_renderer, HealthBarSprite, BAR_WIDTH, BAR_OFFSET_Y
+from utils.render_queue import LAYER_ENEMIES
 
-class Enemy:
-    def __init__(self, x, y, enemy_type, rarity="NORMAL", logger=None):
+_trace_draw = get_channel("draw")
+
+class Enemy(pygame.sprite.DirtySprite):
+    """Enemigo; como DirtySprite (modo "sprites") lleva su barra de vida como sprite acompañante."""
+
+    _layer = LAYER_ENEMIES
+
+    def __init__(self, x, y, enemy_type, rarity="NORMAL", logger=None, now=0.0):
+        super().__init__()
+        self.dirty = 2  # Se mueve y se anima cada frame
+        self.logger = logger or get_logger("PyGame")
+        self.collision_box = pygame.Rect(x, y, 0, 0)
+        # Sprites que dibuja el grupo LayeredDirty por este enemigo (utils.sprite_groups)
+        self.render_sprites = (self, HealthBarSprite(self))
+        self.reset(x, y, enemy_type, rarity, now)
+
+    def reset(self, x, y, enemy_type, rarity="NORMAL", now=0.0):
+        """
+        Reinicializa el enemigo con un nuevo tipo, rareza, posición y salud.
+        Lo usa el pool de EnemyGenerator para reutilizar instancias en lugar de crear nuevas.
+        now es el reloj de simulación en el momento de aparecer.
+        """
         self.x = x
         self.y = y
-        self.logger = logger or get_logger("PyGame")
         self.enemy_type = enemy_type
         self.rarity = rarity
 
@@ -28,20 +49,21 @@ class Enemy:
         self.base_health = stats["health"]
         self.can_shoot = stats.get("can_shoot", False)
         self.shoot_delay = stats.get("shoot_delay", 2.0)
-        self.last_shot_time = time.time()
+        self.last_shot_time = now
         self.movement_pattern = stats["movement_pattern"]
 
         # Aplicar multiplicadores de rareza
         rarity_stats = ENEMY_RARITIES.get(rarity, ENEMY_RARITIES["NORMAL"])
         self.speed = self.base_speed * rarity_stats["speed_multiplier"]
         self.health = int(self.base_health * rarity_stats["health_multiplier"])
+        self.max_health = self.base_health * rarity_stats["health_multiplier"]
         self.score_value = int(10 * rarity_stats["score_multiplier"]) # Valor de puntuación base 10
 
         # Daño base
         self.base_damage = stats.get("damage", 1)
         self.damage = int(self.base_damage * rarity_stats.get("damage_multiplier", 1.0))
 
-        self.collision_box = pygame.Rect(self.x, self.y, self.size, self.size)
+        self.collision_box.update(self.x, self.y, self.size, self.size)
 
         # Para movimiento zigzag
         self.zigzag_amplitude = 50 # Qué tan lejos se mueve horizontalmente
@@ -51,40 +73,46 @@ class Enemy:
         # Animación
         image_folder = stats["image_folder"]
         self.animation_frames = {}
-        self.animation_frames["idle"] = load_animation_frames(image_folder, "Idle", stats["idle_frames"])
-        self.animation_frames["run"] = load_animation_frames(image_folder, stats.get("run_animation_key", "Run"), stats["run_frames"])
-        self.animation_frames["attack"] = load_animation_frames(image_folder, stats.get("attack_animation_key", "Attack"), stats["attack_frames"])
+        # Frames pre-escalados al tamaño del enemigo (compartidos entre todos los enemigos)
+        self.animation_frames["idle"] = load_facing_animation_frames(image_folder, "Idle", stats["idle_frames"], self.size)
+        self.animation_frames["run"] = load_facing_animation_frames(image_folder, stats.get("run_animation_key", "Run"), stats["run_frames"], self.size)
+        self.animation_frames["attack"] = load_facing_animation_frames(image_folder, stats.get("attack_animation_key", "Attack"), stats["attack_frames"], self.size)
         
         # Usar run si no hay walk para enemigos
         if "walk_frames" in stats:
-            self.animation_frames["walk"] = load_animation_frames(image_folder, "Walk", stats["walk_frames"])
+            self.animation_frames["walk"] = load_facing_animation_frames(image_folder, "Walk", stats["walk_frames"], self.size)
         else:
             self.animation_frames["walk"] = self.animation_frames["run"]
 
         self.current_animation = "idle"
+        self.facing = FACING_RIGHT # Los sprites de enemigos aún no dependen de la dirección
         self.current_frame = 0
         self.animation_speed = 0.1 # Velocidad de cambio de frame
-        self.last_frame_update = time.time()
-
-        # Inicializar barra de vida y marco según rareza (usando Health_03)
-        self.health_frame_image = pygame.image.load("assets/ui/Health_03.png")
-        if rarity == "NORMAL":
-            self.health_bar_image = pygame.image.load("assets/ui/Health_03_Bar01.png")
-        elif rarity == "RARE":
-            self.health_bar_image = pygame.image.load("assets/ui/Health_03_Bar02.png")
-        elif rarity in ("EPIC", "ELITE", "LEGENDARY"):
-            self.health_bar_image = pygame.image.load("assets/ui/Health_03_Bar03.png")
-        else:
-            self.health_bar_image = pygame.image.load("assets/ui/Health_03_Bar01.png")
+        self.last_frame_update = now
+
+        # Tira de la barra de vida (ui.health_bar), recalculada solo cuando cambia la salud
+        self._bar_health = None
+        self._bar_strip = None
 
         # Asignar un frame inicial como imagen base
-        self.image = self.animation_frames["idle"][0] if self.animation_frames["idle"] else None
+        self.image = self.animation_frames["idle"][self.facing][0] if self.animation_frames["idle"] else None
+
+        self.logger.log_debug("Enemigo %s (%s) creado en posición x=%s, y=%s, tamaño=%s, velocidad=%s, salud=%s, can_shoot=%s", "enemy",
+                              enemy_type, rarity, self.x, self.y, self.size, self.speed, self.health, self.can_shoot)
+
+    @property
+    def rect(self):
+        """Área del sprite en pantalla (la de dibujo, no la de colisión)."""
+        return pygame.Rect(self.x, self.y, self.size, self.size)
+
+    @property
+    def visible(self):
+        # Sin frames cargados el enemigo solo se ve en los modos que dibujan el rectángulo de fallback
+        return self.image is not None
 
-        self.logger.log_debug(f"Enemigo {enemy_type} ({rarity}) creado en posición x={self.x}, y={self.y}, tamaño={self.size}, velocidad={self.speed}, salud={self.health}, can_shoot={self.can_shoot}", "enemy")
-        self.logger.log_debug(f"Health frame image: {self.health_frame_image}, Health bar image: {self.health_bar_image}", "enemy")
-        if self.logger:
-            self.logger.log_event(f"Enemigo inicializado en ({self.x},{self.y}) tipo={enemy_type} rareza={rarity}", "enemy")
-        print(f"[DEBUG] Enemigo inicializado: {self}")
+    def get_collision_rect(self):
+        """Retorna el rectángulo de colisión del enemigo."""
+        return self.collision_box
 
     def move(self):
         """Mueve el enemigo según su patrón de movimiento."""
@@ -102,79 +130,72 @@ class Enemy:
         # Actualizar caja de colisión
         self.collision_box.topleft = (self.x, self.y)
 
-    def update(self):
-        """Actualiza el estado del enemigo."""
+    def update(self, now):
+        """Actualiza el estado del enemigo (now: reloj de simulación del paso actual)."""
         self.move()
         
         # Actualizar animación
-        current_time = time.time()
-        if current_time - self.last_frame_update > self.animation_speed:
+        if now - self.last_frame_update > self.animation_speed:
             if self.current_animation in self.animation_frames and self.animation_frames[self.current_animation]:
                 self.current_frame = (self.current_frame + 1) % len(self.animation_frames[self.current_animation])
-                self.image = self.animation_frames[self.current_animation][self.current_frame]
-            self.last_frame_update = current_time
+                self.image = self.animation_frames[self.current_animation][self.facing][self.current_frame]
+            self.last_frame_update = now
 
-    def shoot(self, target_x, target_y):
+    def shoot(self, target_x, target_y, now):
         """Dispara un proyectil hacia el objetivo."""
         if not self.can_shoot:
             return None
             
-        current_time = time.time()
-        if current_time - self.last_shot_time > self.shoot_delay:
+        if now - self.last_shot_time > self.shoot_delay:
             projectile = Projectile(self.x + self.size // 2, self.y + self.size, 
                                     target_x, target_y, size=10, speed=3, 
                                     image_path="assets/objects/proyectiles/aranazo.png", 
                                     piercing=False, logger=self.logger)
-            self.last_shot_time = current_time
-            self.logger.log_debug(f"Enemigo {self.enemy_type} dispara proyectil hacia ({target_x}, {target_y})", "enemy")
+            self.last_shot_time = now
+            self.logger.log_debug("Enemigo %s dispara proyectil hacia (%s, %s)", "enemy", self.enemy_type, target_x, target_y)
             return projectile
         return None
 
     def draw(self, screen):
-        """Dibuja el enemigo y su barra de vida."""
+        """Dibuja el enemigo y su barra de vida; retorna el área dibujada."""
         if self.image:
-            scaled_image = pygame.transform.scale(self.image, (self.size, self.size))
-            screen.blit(scaled_image, (self.x, self.y))
+            # Los frames ya vienen escalados a self.size
+            screen.blit(self.image, (self.x, self.y))
         else:
             # Fallback si no hay imagen
             pygame.draw.rect(screen, RED, (self.x, self.y, self.size, self.size))
-        print(f"[DEBUG] Dibujando enemigo en ({self.x},{self.y})")
+        if _trace_draw.enabled:
+            _trace_draw("Dibujando enemigo en (%s,%s)", self.x, self.y)
 
         # Dibujar barra de vida
-        self.draw_health_bar(screen)
+        return pygame.Rect(self.x, self.y, self.size, self.size).union(self.draw_health_bar(screen))
 
-    def draw_health_bar(self, screen):
-        """Dibuja la barra de vida del enemigo."""
-        bar_width = 50
-        bar_height = 8
-        bar_x = self.x + (self.size - bar_width) // 2
-        bar_y = self.y - 15
-
-        # DEBUG: Dibujar fondo de la barra de vida
-        pygame.draw.rect(screen, (200, 200, 200), (bar_x, bar_y, bar_width, bar_height), border_radius=4)
-
-        # Dibujar marco de la barra de vida
-        screen.blit(self.health_frame_image, (bar_x, bar_y))
-
-        # Calcular el ancho de la barra de vida basado en la salud actual
-        max_health = self.base_health * ENEMY_RARITIES.get(self.rarity, ENEMY_RARITIES["NORMAL"])["health_multiplier"]
-        health_ratio = max(0, self.health / max_health)
-        current_bar_width = int(bar_width * health_ratio)
-
-        print(f"[DEBUG] Enemy health: {self.health}, max_health: {max_health}, ratio: {health_ratio}")
+    def enqueue(self, queue):
+        """Encola el enemigo y su barra de vida en la cola de render; retorna el área que ocupan."""
+        if self.image:
+            queue.blits[LAYER_ENEMIES].append((self.image, (self.x, self.y)))
+        else:
+            queue.add_draw(LAYER_ENEMIES, pygame.draw.rect, RED, (self.x, self.y, self.size, self.size))
+        if _trace_draw.enabled:
+            _trace_draw("Encolando enemigo en (%s,%s)", self.x, self.y)
+        bar_x = self.x + (self.size - BAR_WIDTH) // 2
+        bar = get_health_bar_renderer().enqueue(queue, bar_x, self.y + BAR_OFFSET_Y, self.health_bar_strip())
+        return pygame.Rect(self.x, self.y, self.size, self.size).union(bar)
 
-        if current_bar_width > 0:
-            # Crear una superficie para la barra de vida
-            health_surface = pygame.Surface((current_bar_width, bar_height))
-            health_surface.set_colorkey((0, 0, 0))  # Hacer transparente el fondo negro
-            
-            # Usar subsurface para obtener solo la parte necesaria de la imagen de la barra
-            bar_rect = pygame.Rect(0, 0, current_bar_width, bar_height)
-            health_bar_subsurface = self.health_bar_image.subsurface(bar_rect)
-            health_surface.blit(health_bar_subsurface, (0, 0))
-            
-            # Dibujar la barra de vida
-            screen.blit(health_surface, (bar_x, bar_y))
+    def draw_health_bar(self, screen):
+        """Dibuja la barra de vida del enemigo; retorna el área dibujada (sin recortar a la pantalla)."""
+        bar_x = self.x + (self.size - BAR_WIDTH) // 2
+        return get_health_bar_renderer().draw(screen, bar_x, self.y + BAR_OFFSET_Y, self.health_bar_strip())
+
+    def health_bar_strip(self):
+        """Tira de vida actual (la tira precompuesta solo cambia cuando cambia la salud)."""
+        if self.health != self._bar_health:
+            health_ratio = max(0, self.health / self.max_health)
+            self._bar_strip = get_health_bar_renderer().strip(self.rarity, health_ratio)
+            self._bar_health = self.health
+            if _trace_draw.enabled:
+                _trace_draw("Enemy health: %s, max_health: %s, ratio: %s", self.health, self.max_health, health_ratio)
+        return self._bar_strip
 
     def is_off_screen(self, screen_height):
         return self.y > screen_height
@@ -182,10 +203,11 @@ class Enemy:
     def take_damage(self, damage):
         """Reduce la salud del enemigo."""
         self.health -= damage
-        self.logger.log_debug(f"Enemigo {self.enemy_type} recibe {damage} de daño. Salud restante: {self.health}", "enemy")
+        if self.logger.debug_enabled:
+            self.logger.log_debug("Enemigo %s recibe %s de daño. Salud restante: %s", "enemy", self.enemy_type, damage, self.health)
         
         if self.health <= 0:
-            self.logger.log_event(f"Enemigo {self.enemy_type} ({self.rarity}) eliminado", "enemy")
+            self.logger.log_event("Enemigo %s (%s) eliminado", "enemy", self.enemy_type, self.rarity)
             return True
         return False
 
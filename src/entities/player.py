@@ -7,23 +7,69 @@ Descripción: Lógica, animaciones y gestión de power-ups del jugador principal
 """
 import pygame
 from entities.projectile import Projectile
+from entities.projectile_batch import ProjectileBatch
 import sys
-import time
 import math
 from constants import *
-from utils.image_loader import load_image, load_animation_frames
+from utils.image_loader import load_image, load_facing_animation_frames, FACING_LEFT, FACING_RIGHT
 from utils.advanced_logger import get_logger
+from utils.trace import get_channel
+from utils.render_queue import LAYER_PLAYER
 import os
 
-class Player:
-    def __init__(self, x, y, logger=None, sound_manager=None, character_type="Kava"):
+_trace_draw = get_channel("draw")
+_trace_entity = get_channel("entity")
+
+# Radio -> anillo del escudo ya dibujado (para el modo "sprites")
+_shield_images = {}
+
+
+class ShieldSprite(pygame.sprite.DirtySprite):
+    """Escudo del jugador como DirtySprite: anillo centrado en el jugador, visible mientras tenga escudo."""
+
+    _layer = LAYER_PLAYER
+
+    def __init__(self, player):
+        super().__init__()
+        self.player = player
+        self.dirty = 2  # Se mueve con el jugador: repintar cada frame
+
+    @property
+    def image(self):
+        radius = self.player.size
+        image = _shield_images.get(radius)
+        if image is None:
+            image = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+            pygame.draw.circle(image, BLUE, (radius, radius), radius, 3)
+            _shield_images[radius] = image
+        return image
+
+    @property
+    def rect(self):
+        player = self.player
+        center = (int(player.x + player.size / 2), int(player.y + player.size / 2))
+        return pygame.Rect(center[0] - player.size, center[1] - player.size, 2 * player.size + 1, 2 * player.size + 1)
+
+    @property
+    def visible(self):
+        return self.player.has_shield
+
+
+class Player(pygame.sprite.DirtySprite):
+    _layer = LAYER_PLAYER
+
+    def __init__(self, x, y, logger=None, sound_manager=None, character_type="Kava", projectile_pool=None):
+        super().__init__()
+        self.dirty = 2  # Se mueve y se anima cada frame
         self.x = x
         self.y = y
         self.size = PLAYER_SIZE
-        self.projectiles = []
         self.logger = logger or get_logger("PyGame")
         self.sound_manager = sound_manager
+        self.projectile_pool = projectile_pool  # ProjectilePool o ProjectileBatch opcional (ver acquire)
         self.collision_box = pygame.Rect(self.x, self.y, self.size, self.size)
+        # Sprites que dibuja el grupo LayeredDirty por el jugador (utils.sprite_groups)
+        self.render_sprites = (self, ShieldSprite(self))
 
         # Power-up related attributes
         self.is_fast_shooting = False
@@ -39,8 +85,8 @@ class Player:
         self.current_animation = "idle"
         self.current_frame = 0
         self.animation_speed = 0.1 # Velocidad de cambio de frame
-        self.last_frame_update = time.time()
-        self.facing_left = False # Nueva variable para la dirección
+        self.last_frame_update = 0.0 # Reloj de simulación del último cambio de frame
+        self.facing = FACING_RIGHT # Índice de orientación en los FacingFrames
 
         self.set_character_stats(character_type)
         self.attack_type = "normal" # Default attack type
@@ -48,7 +94,7 @@ class Player:
 
         if self.logger:
             self.logger.log_event(f"Jugador inicializado en ({self.x},{self.y}) tipo={character_type}", "player")
-        print(f"[DEBUG] Jugador inicializado: {self}")
+        _trace_entity("Jugador inicializado: %s", self)
 
     def set_character_stats(self, character_type):
         stats = CHARACTER_STATS.get(character_type, CHARACTER_STATS["Kava"]) # Cambiado a Kava
@@ -56,21 +102,21 @@ class Player:
         self.lives = stats["lives"]
         self.shot_delay = stats["shot_delay"]
         self.original_shot_delay = self.shot_delay # Store original for power-up reset
-        self.last_shot_time = 0 # Reset shot timer when character changes
+        self.last_shot_time = float("-inf") # Reset shot timer when character changes
         self.character_type = character_type # Store character type
 
-        # Cargar animaciones usando la función mejorada
+        # Cargar animaciones pre-escaladas a PLAYER_SIZE, con variante espejada bajo demanda (caché compartida)
         image_folder = stats["image_folder"]
-        self.animation_frames["idle"] = load_animation_frames(image_folder, "Idle", stats["idle_frames"])
-        self.animation_frames["run"] = load_animation_frames(image_folder, "Run", stats["run_frames"])
+        self.animation_frames["idle"] = load_facing_animation_frames(image_folder, "Idle", stats["idle_frames"], self.size)
+        self.animation_frames["run"] = load_facing_animation_frames(image_folder, "Run", stats["run_frames"], self.size)
         
         # Cargar animación de caminar si existe
         if "walk_frames" in stats:
-            self.animation_frames["walk"] = load_animation_frames(image_folder, "Walk", stats["walk_frames"])
+            self.animation_frames["walk"] = load_facing_animation_frames(image_folder, "Walk", stats["walk_frames"], self.size)
         else:
             self.animation_frames["walk"] = self.animation_frames["run"] # Usar run si no hay walk
 
-        self.animation_frames["shoot"] = load_animation_frames(image_folder, stats["attack_animation_key"], stats["attack_frames"])
+        self.animation_frames["shoot"] = load_facing_animation_frames(image_folder, stats["attack_animation_key"], stats["attack_frames"], self.size)
         
         # Asegurarse de que haya al menos un frame para cada animación
         if not self.animation_frames["idle"]:
@@ -79,7 +125,7 @@ class Player:
             self.image = pygame.Surface((self.size, self.size))
             self.image.fill(RED) # Placeholder rojo
         else:
-            self.image = self.animation_frames["idle"][0] # Establecer el primer frame como imagen inicial
+            self.image = self.animation_frames["idle"][self.facing][0] # Establecer el primer frame como imagen inicial
 
         self.logger.log_event(f"Personaje seleccionado: {character_type} con vidas={self.lives}, velocidad={self.speed}, shot_delay={self.shot_delay}", "player")
 
@@ -90,16 +136,24 @@ class Player:
         else:
             self.logger.log_error(f"Tipo de ataque desconocido: {attack_type}", "player")
 
-    def update(self):
-        keys = pygame.key.get_pressed()
+    def update(self, now, keys=None):
+        """
+        Actualiza movimiento, animación y power-ups del jugador.
+
+        Args:
+            now: Reloj de simulación del paso actual (segundos)
+            keys: Estado de teclas (pygame.key.get_pressed() o ReplayKeys); se lee del teclado si es None
+        """
+        if keys is None:
+            keys = pygame.key.get_pressed()
         moving = False
         if keys[pygame.K_a]:
             self.x -= self.speed
-            self.facing_left = True # Mover a la izquierda, mirar a la izquierda
+            self.facing = FACING_LEFT # Mover a la izquierda, mirar a la izquierda
             moving = True
         if keys[pygame.K_d]:
             self.x += self.speed
-            self.facing_left = False # Mover a la derecha, mirar a la derecha
+            self.facing = FACING_RIGHT # Mover a la derecha, mirar a la derecha
             moving = True
         # Limitar el movimiento a la pantalla
         self.x = max(0, min(self.x, SCREEN_WIDTH - self.size))
@@ -111,25 +165,33 @@ class Player:
         else:
             self.current_animation = "idle"
 
-        current_time = time.time()
-        if current_time - self.last_frame_update > self.animation_speed:
-            self.current_frame = (self.current_frame + 1) % len(self.animation_frames[self.current_animation])
-            self.image = self.animation_frames[self.current_animation][self.current_frame]
-            self.last_frame_update = current_time
+        animation = self.animation_frames[self.current_animation]
+        if now - self.last_frame_update > self.animation_speed:
+            self.current_frame = (self.current_frame + 1) % len(animation)
+            self.last_frame_update = now
+        # Elegir el frame según la orientación (sin transformar píxeles)
+        if animation:
+            self.image = animation[self.facing][self.current_frame % len(animation)]
 
         # Update power-up timers
-        if self.is_fast_shooting and time.time() - self.fast_shot_timer > self.fast_shot_duration:
+        if self.is_fast_shooting and now - self.fast_shot_timer > self.fast_shot_duration:
             self.is_fast_shooting = False
             self.shot_delay = self.original_shot_delay # Reset to normal
             self.logger.log_event("Power-up de disparo rápido terminado.", "player")
 
-        if self.has_shield and time.time() - self.shield_timer > self.shield_duration:
+        if self.has_shield and now - self.shield_timer > self.shield_duration:
             self.has_shield = False
             self.logger.log_event("Power-up de escudo terminado.", "player")
 
-    def shoot(self, target_x, target_y):
-        current_time = time.time()
-        if current_time - self.last_shot_time > self.shot_delay:
+    def shoot(self, target_x, target_y, now):
+        """
+        Dispara hacia (target_x, target_y) si ha pasado el tiempo de recarga.
+
+        Returns:
+            Lista con el Projectile creado, que el llamador debe añadir a sus entidades. Vacía si
+            no se disparó o si projectile_pool es un ProjectileBatch (el disparo ya vive en el lote)
+        """
+        if now - self.last_shot_time > self.shot_delay:
             attack_props = ATTACK_TYPES[self.attack_type]
             projectile_size = attack_props["projectile_size"]
             projectile_speed = self.projectile_speed 
@@ -141,32 +203,59 @@ class Player:
             self.current_animation = "shoot"
             self.current_frame = 0 # Reiniciar animación de disparo
 
-            projectile = Projectile(self.x + self.size // 2, self.y, target_x, target_y, 
-                                    size=projectile_size, speed=projectile_speed, 
-                                    image_path=projectile_image_path, piercing=projectile_piercing, 
-                                    damage=projectile_damage, logger=self.logger)
-            self.projectiles.append(projectile)
+            if self.projectile_pool is not None:
+                projectile = self.projectile_pool.acquire(self.attack_type, self.x + self.size // 2, self.y,
+                                                          target_x, target_y, speed=projectile_speed)
+            else:
+                projectile = Projectile(self.x + self.size // 2, self.y, target_x, target_y, 
+                                        size=projectile_size, speed=projectile_speed, 
+                                        image_path=projectile_image_path, piercing=projectile_piercing, 
+                                        damage=projectile_damage, logger=self.logger)
 
-            self.logger.log_debug(f"Jugador disparó proyectil hacia x={target_x}, y={target_y} con ataque {self.attack_type}", "player")
+            self.logger.log_debug("Jugador disparó proyectil hacia x=%s, y=%s con ataque %s", "player", target_x, target_y, self.attack_type)
             if self.sound_manager:
                 self.sound_manager.play_sound("shoot")
-            self.last_shot_time = current_time
+            self.last_shot_time = now
+            if isinstance(self.projectile_pool, ProjectileBatch):
+                return []
             return [projectile]
         return []
 
+    @property
+    def rect(self):
+        """Área del sprite en pantalla (la de dibujo, no la de colisión)."""
+        return self.image.get_rect(topleft=(self.x, self.y))
+
+    def get_collision_rect(self):
+        """Retorna el rectángulo de colisión del jugador."""
+        return self.collision_box
+
     def draw(self, screen):
-        # Dibujar el sprite actual del jugador
-        scaled_image = pygame.transform.scale(self.image, (self.size, self.size))
-        # Voltear la imagen si el jugador está mirando a la izquierda
-        if self.facing_left:
-            scaled_image = pygame.transform.flip(scaled_image, True, False)
-        screen.blit(scaled_image, (self.x, self.y))
-        print(f"[DEBUG] Dibujando jugador en ({self.x},{self.y})")
+        """Dibuja el jugador y su escudo; retorna el área dibujada."""
+        # Dibujar el sprite actual del jugador (ya escalado y orientado en update())
+        screen.blit(self.image, (self.x, self.y))
+        rect = self.image.get_rect(topleft=(self.x, self.y))
+        if _trace_draw.enabled:
+            _trace_draw("Dibujando jugador en (%s,%s)", self.x, self.y)
+
+        if self.has_shield:
+            center = (int(self.x + self.size / 2), int(self.y + self.size / 2))
+            pygame.draw.circle(screen, BLUE, center, self.size, 3) # Dibujar escudo
+            rect.union_ip(pygame.Rect(center[0] - self.size, center[1] - self.size, 2 * self.size + 1, 2 * self.size + 1))
+        return rect
+
+    def enqueue(self, queue):
+        """Encola el jugador y su escudo en la cola de render; retorna el área que ocupan."""
+        queue.blits[LAYER_PLAYER].append((self.image, (self.x, self.y)))
+        rect = self.image.get_rect(topleft=(self.x, self.y))
+        if _trace_draw.enabled:
+            _trace_draw("Encolando jugador en (%s,%s)", self.x, self.y)
 
         if self.has_shield:
-            pygame.draw.circle(screen, BLUE, (int(self.x + self.size / 2), int(self.y + self.size / 2)), self.size, 3) # Dibujar escudo
-        for projectile in self.projectiles:
-            projectile.draw(screen)
+            center = (int(self.x + self.size / 2), int(self.y + self.size / 2))
+            queue.add_draw(LAYER_PLAYER, pygame.draw.circle, BLUE, center, self.size, 3)
+            rect.union_ip(pygame.Rect(center[0] - self.size, center[1] - self.size, 2 * self.size + 1, 2 * self.size + 1))
+        return rect
 
     def lose_life(self, amount=1):
         """Reduce las vidas del jugador o elimina corazones azules si hay escudo."""
@@ -178,21 +267,21 @@ class Player:
             return
         if self.lives > 0:
             self.lives -= amount
-            self.logger.log_event(f"Jugador pierde vida. Vidas restantes: {self.lives}", "player")
+            self.logger.log_event("Jugador pierde vida. Vidas restantes: %s", "player", self.lives)
 
     def take_damage(self, amount=1):
         """Aplica daño al jugador, gestionando escudo y vidas."""
-        self.logger.log_event(f"Jugador recibe daño: {amount}", "player")
+        self.logger.log_event("Jugador recibe daño: %s", "player", amount)
         self.lose_life(amount)
 
-    def activate_powerup(self, powerup_type):
+    def activate_powerup(self, powerup_type, now):
         if powerup_type == "health":
             if self.lives < 3:
                 self.lives += 1
                 self.logger.log_event("Power-up de salud recogido! Vida añadida.", "player")
         elif powerup_type == "fast_shot":
             self.is_fast_shooting = True
-            self.fast_shot_timer = time.time()
+            self.fast_shot_timer = now
             self.shot_delay = 0.1 # Faster shooting
             self.logger.log_event("Power-up de disparo rápido activado!", "player")
         elif powerup_type == "shield":
@@ -200,7 +289,7 @@ class Player:
             if not hasattr(self, 'shield_lives'):
                 self.shield_lives = 0
             self.shield_lives += 1
-            self.shield_timer = time.time()
+            self.shield_timer = now
             self.logger.log_event("Power-up de escudo activado! Corazón azul añadido.", "player")
 
     def get_upgrade_level(self, upgrade_key):
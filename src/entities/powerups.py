@@ -8,9 +8,23 @@ Descripción: Lógica y visualización de los power-ups recogibles en el juego.
 import pygame
 import random
 from utils.advanced_logger import get_logger
+from utils.trace import get_channel
+from utils.render_queue import LAYER_POWERUPS
+
+_trace_draw = get_channel("draw")
+_trace_entity = get_channel("entity")
+
+# (color, tamaño) -> círculo del powerup ya dibujado (para el modo "sprites")
+_powerup_images = {}
+
+
+class PowerUp(pygame.sprite.DirtySprite):
+    _layer = LAYER_POWERUPS
 
-class PowerUp:
     def __init__(self, x, y, powerup_type, logger=None):
+        super().__init__()
+        self.dirty = 2  # Se mueve cada frame
+        self.render_sprites = (self,)
         self.x = x
         self.y = y
         self.type = powerup_type
@@ -28,21 +42,49 @@ class PowerUp:
         self.color = self.colors.get(powerup_type, (255, 255, 255))  # Blanco por defecto
         
         if self.logger:
-            self.logger.log_event(f"PowerUp inicializado en ({self.x},{self.y}) tipo={powerup_type}", "powerup")
-        print(f"[DEBUG] PowerUp inicializado: {self}")
+            self.logger.log_event("PowerUp inicializado en (%s,%s) tipo=%s", "powerup", self.x, self.y, powerup_type)
+        _trace_entity("PowerUp inicializado: %s", self)
     
     def update(self):
         """Actualiza la posición del powerup."""
         self.y += self.speed
     
     def draw(self, screen):
-        """Dibuja el powerup."""
-        print(f"[DEBUG] Dibujando powerup en ({self.x},{self.y})")
+        """Dibuja el powerup; retorna el área dibujada."""
+        if _trace_draw.enabled:
+            _trace_draw("Dibujando powerup en (%s,%s)", self.x, self.y)
         pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.size // 2)
         
         # Dibujar un borde para hacerlo más visible
-        pygame.draw.circle(screen, (255, 255, 255), (int(self.x), int(self.y)), self.size // 2, 2)
+        return pygame.draw.circle(screen, (255, 255, 255), (int(self.x), int(self.y)), self.size // 2, 2)
+
+    def enqueue(self, queue):
+        """Encola el powerup (relleno y borde) en la cola de render; retorna el área que ocupa."""
+        center = (int(self.x), int(self.y))
+        radius = self.size // 2
+        queue.add_draw(LAYER_POWERUPS, pygame.draw.circle, self.color, center, radius)
+        queue.add_draw(LAYER_POWERUPS, pygame.draw.circle, (255, 255, 255), center, radius, 2)
+        return pygame.Rect(center[0] - radius, center[1] - radius, 2 * radius + 1, 2 * radius + 1)
     
+    @property
+    def image(self):
+        """Círculo relleno con borde blanco, igual que draw(), dibujado una vez por color y tamaño."""
+        key = (self.color, self.size)
+        image = _powerup_images.get(key)
+        if image is None:
+            radius = self.size // 2
+            image = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+            pygame.draw.circle(image, self.color, (radius, radius), radius)
+            pygame.draw.circle(image, (255, 255, 255), (radius, radius), radius, 2)
+            _powerup_images[key] = image
+        return image
+
+    @property
+    def rect(self):
+        """Área del sprite en pantalla (centrada en x, y)."""
+        radius = self.size // 2
+        return pygame.Rect(int(self.x) - radius, int(self.y) - radius, 2 * radius + 1, 2 * radius + 1)
+
     def get_collision_rect(self):
         """Retorna el rectángulo de colisión del powerup."""
         return pygame.Rect(self.x - self.size // 2, self.y - self.size // 2, self.size, self.size)
@@ -8,16 +8,56 @@ Descripción: Lógica de movimiento y colisión de proyectiles del jugador y ene
 import pygame
 import math
 from utils.advanced_logger import get_logger
+from utils.image_loader import load_cached_image
+from utils.trace import get_channel
+from utils.render_queue import LAYER_PROJECTILES
+
+_trace_draw = get_channel("draw")
+
+class Projectile(pygame.sprite.DirtySprite):
+    _layer = LAYER_PROJECTILES
+    # Sprites escalados compartidos: (ruta, tamaño) -> Surface (o None si no se pudo cargar)
+    _sprite_cache = {}
 
-class Projectile:
     def __init__(self, x, y, target_x, target_y, size=10, speed=5, image_path=None, piercing=False, damage=1, logger=None):
+        super().__init__()
+        self.dirty = 2  # Se mueve cada frame
+        self.render_sprites = (self,)
+        self.logger = logger or get_logger("PyGame")
+        self.attack_type = None  # Lo asigna ProjectilePool al crear proyectiles de un tipo de ataque
+        self.reset(x, y, target_x, target_y, size, speed, image_path, piercing, damage)
+
+    @classmethod
+    def get_sprite(cls, image_path, size, logger=None):
+        """
+        Retorna el sprite del proyectil cargado, convertido y escalado una sola vez por (ruta, tamaño).
+        Si la imagen no existe se recuerda el fallo y se dibuja un círculo en su lugar.
+        """
+        if not image_path:
+            return None
+        key = (image_path, size)
+        if key not in cls._sprite_cache:
+            try:
+                image = load_cached_image(image_path)
+                cls._sprite_cache[key] = pygame.transform.scale(image, (size, size))
+            except (Exception, SystemExit) as e:
+                # load_image lanza SystemExit si no puede cargar el fichero
+                (logger or get_logger("PyGame")).log_error(f"Error cargando imagen de proyectil {image_path}: {e}", "projectile")
+                cls._sprite_cache[key] = None
+        return cls._sprite_cache[key]
+
+    def reset(self, x, y, target_x, target_y, size=10, speed=5, image_path=None, piercing=False, damage=1):
+        """
+        Reinicializa el proyectil con una nueva posición, objetivo y propiedades.
+        Lo usa ProjectilePool para reutilizar instancias en lugar de crear nuevas.
+        """
         self.x = x
         self.y = y
         self.size = size
         self.speed = speed
         self.piercing = piercing
         self.damage = damage
-        self.logger = logger or get_logger("PyGame")
+        self.piercing_hits = 0  # Enemigos atravesados (proyectiles perforantes)
         
         # Calcular dirección hacia el objetivo
         dx = target_x - x
@@ -31,24 +71,14 @@ class Projectile:
             self.dx = 0
             self.dy = speed  # Movimiento hacia abajo por defecto
         
-        # Cargar imagen si se proporciona
-        if image_path:
-            try:
-                self.image = pygame.image.load(image_path)
-                self.image = pygame.transform.scale(self.image, (size, size))
-            except Exception as e:
-                self.logger.log_error(f"Error cargando imagen de proyectil {image_path}: {e}", "projectile")
-                self.image = None
-        else:
-            self.image = None
+        # Sprite compartido (sin acceso a disco tras el primer disparo de cada tipo)
+        self.image = self.get_sprite(image_path, size, self.logger)
         
         # Color por defecto si no hay imagen
         self.color = (255, 255, 0)  # Amarillo
         
-        self.logger.log_debug(f"Proyectil creado en ({x}, {y}) hacia ({target_x}, {target_y}) con velocidad {speed}", "projectile")
-        if self.logger:
-            self.logger.log_event(f"Proyectil inicializado en ({self.x},{self.y})", "projectile")
-        print(f"[DEBUG] Proyectil inicializado: {self}")
+        if self.logger.debug_enabled:
+            self.logger.log_debug("Proyectil creado en (%s, %s) hacia (%s, %s) con velocidad %s", "projectile", x, y, target_x, target_y, speed)
     
     def update(self):
         """Actualiza la posición del proyectil."""
@@ -56,13 +86,35 @@ class Projectile:
         self.y += self.dy
     
     def draw(self, screen):
-        """Dibuja el proyectil."""
+        """Dibuja el proyectil; retorna el área dibujada."""
         if self.image:
-            screen.blit(self.image, (self.x, self.y))
+            rect = screen.blit(self.image, (self.x, self.y))
         else:
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.size // 2)
-        print(f"[DEBUG] Dibujando proyectil en ({self.x},{self.y})")
+            rect = pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.size // 2)
+        if _trace_draw.enabled:
+            _trace_draw("Dibujando proyectil en (%s,%s)", self.x, self.y)
+        return rect
+
+    def enqueue(self, queue):
+        """Encola el proyectil en la cola de render; retorna el área que ocupa."""
+        if self.image:
+            queue.blits[LAYER_PROJECTILES].append((self.image, (self.x, self.y)))
+            return self.image.get_rect(topleft=(self.x, self.y))
+        center = (int(self.x), int(self.y))
+        radius = self.size // 2
+        queue.add_draw(LAYER_PROJECTILES, pygame.draw.circle, self.color, center, radius)
+        return pygame.Rect(center[0] - radius, center[1] - radius, 2 * radius + 1, 2 * radius + 1)
     
+    @property
+    def rect(self):
+        """Área del sprite en pantalla (la de dibujo)."""
+        return pygame.Rect(self.x, self.y, self.size, self.size)
+
+    @property
+    def visible(self):
+        # Los proyectiles sin sprite (círculo) no se dibujan en modo "sprites"
+        return self.image is not None
+
     def is_off_screen(self, screen_width, screen_height):
         """Verifica si el proyectil está fuera de la pantalla."""
         return (self.x < 0 or self.x > screen_width or 
@@ -70,4 +122,4 @@ class Projectile:
     
     def get_collision_rect(self):
         """Retorna el rectángulo de colisión del proyectil."""
-        return pygame.Rect(self.x, self.y, self.size, self.size)
\ No newline at end of file
+        return pygame.Rect(self.x, self.y, self.size, self.size)
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Lote de proyectiles (struct-of-arrays) para PyGame Shooter
+Autor: Kava
+Fecha: 2024-12-19
+Descripción: Alternativa a una lista de objetos Projectile que guarda posiciones, velocidades,
+daño, impactos de perforación y estado en arrays contiguos de NumPy. Movimiento, descarte
+fuera de pantalla y compactación se hacen en un único paso vectorizado por frame.
+"""
+
+import math
+from typing import Callable, List, Optional
+
+import numpy as np
+import pygame
+
+from constants import ATTACK_TYPES, PROJECTILE_PIERCING_HITS
+from entities.projectile import Projectile
+from utils.advanced_logger import get_logger
+from utils.render_queue import LAYER_PROJECTILES
+
+# Color por defecto si el tipo de proyectil no tiene imagen (igual que Projectile)
+DEFAULT_COLOR = (255, 255, 0)
+
+
+class ProjectileBatch:
+    """
+    Almacén de proyectiles en arrays de NumPy (una posición por proyectil vivo).
+
+    Los proyectiles vivos ocupan siempre los índices 0..count-1; compact() elimina los
+    muertos conservando el orden de disparo. El comportamiento replica el de Projectile:
+    update() suma (dx, dy), is_off_screen() usa los mismos límites y un proyectil
+    perforante desaparece tras PROJECTILE_PIERCING_HITS impactos.
+    """
+
+    # Arrays por proyectil, en el orden en que se redimensionan y compactan
+    _ARRAYS = ("x", "y", "dx", "dy", "size", "damage", "piercing", "piercing_hits", "alive", "kind")
+
+    def __init__(self, screen_width: int, screen_height: int, capacity: int = 256, logger=None):
+        """
+        Inicializa el lote.
+
+        Args:
+            screen_width: Ancho del área de juego (límite de descarte)
+            screen_height: Alto del área de juego (límite de descarte)
+            capacity: Capacidad inicial de los arrays (crece al doble cuando se llena)
+            logger: Instancia del logger para debug (opcional, usa AdvancedLogger por defecto)
+        """
+        self.logger = logger or get_logger("PyGame")
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.count = 0
+        self.capacity = 0
+
+        # Tipos de proyectil: índice -> (sprite o None, tamaño, nombre del tipo de ataque)
+        self._kinds: List[tuple] = []
+        self._kind_ids = {}
+
+        self.x = np.empty(0, dtype=np.float64)
+        self.y = np.empty(0, dtype=np.float64)
+        self.dx = np.empty(0, dtype=np.float64)
+        self.dy = np.empty(0, dtype=np.float64)
+        self.size = np.empty(0, dtype=np.int32)
+        self.damage = np.empty(0, dtype=np.int32)
+        self.piercing = np.empty(0, dtype=np.bool_)
+        self.piercing_hits = np.empty(0, dtype=np.int32)
+        self.alive = np.empty(0, dtype=np.bool_)
+        self.kind = np.empty(0, dtype=np.int16)
+        self._grow(capacity)
+
+        self.logger.log_event(f"ProjectileBatch inicializado (capacidad {self.capacity})", "projectile_batch")
+
+    def _grow(self, capacity: int) -> None:
+        """Amplía todos los arrays a la capacidad indicada conservando los proyectiles vivos."""
+        for name in self._ARRAYS:
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.capacity = capacity
+
+    def _kind_id(self, image_path: Optional[str], size: int, attack_type: Optional[str]) -> int:
+        """Retorna el índice del tipo de proyectil (sprite compartido por imagen y tamaño)."""
+        key = (image_path, size)
+        kind_id = self._kind_ids.get(key)
+        if kind_id is None:
+            kind_id = len(self._kinds)
+            self._kinds.append((Projectile.get_sprite(image_path, size, self.logger), size, attack_type))
+            self._kind_ids[key] = kind_id
+        return kind_id
+
+    def spawn(self, x, y, target_x, target_y, size=10, speed=5, image_path=None, piercing=False,
+              damage=1, attack_type=None) -> int:
+        """
+        Añade un proyectil con los mismos parámetros que Projectile.
+
+        Returns:
+            Índice del proyectil (válido hasta la siguiente compactación)
+        """
+        if self.count == self.capacity:
+            self._grow(self.capacity * 2)
+
+        # Calcular dirección hacia el objetivo (igual que Projectile.reset)
+        dx = target_x - x
+        dy = target_y - y
+        distance = math.sqrt(dx**2 + dy**2)
+        if distance > 0:
+            vx = (dx / distance) * speed
+            vy = (dy / distance) * speed
+        else:
+            vx = 0
+            vy = speed  # Movimiento hacia abajo por defecto
+
+        index = self.count
+        self.x[index] = x
+        self.y[index] = y
+        self.dx[index] = vx
+        self.dy[index] = vy
+        self.size[index] = size
+        self.damage[index] = damage
+        self.piercing[index] = piercing
+        self.piercing_hits[index] = 0
+        self.alive[index] = True
+        self.kind[index] = self._kind_id(image_path, size, attack_type)
+        self.count += 1
+        return index
+
+    def acquire(self, attack_type, x, y, target_x, target_y, speed=None) -> int:
+        """
+        Dispara un proyectil de un tipo de ataque de ATTACK_TYPES.
+        Misma firma que ProjectilePool.acquire, así Player puede usar cualquiera de los dos.
+        """
+        attack_props = ATTACK_TYPES[attack_type]
+        if speed is None:
+            speed = attack_props["projectile_speed"]
+        return self.spawn(x, y, target_x, target_y, size=attack_props["projectile_size"], speed=speed,
+                          image_path=attack_props["image"], piercing=attack_props["piercing"],
+                          damage=attack_props["damage"], attack_type=attack_type)
+
+    def update(self) -> None:
+        """Mueve todos los proyectiles vivos (equivale a Projectile.update)."""
+        n = self.count
+        self.x[:n] += self.dx[:n]
+        self.y[:n] += self.dy[:n]
+
+    def off_screen_mask(self) -> np.ndarray:
+        """Máscara de proyectiles fuera de pantalla (mismos límites que Projectile.is_off_screen)."""
+        n = self.count
+        x = self.x[:n]
+        y = self.y[:n]
+        return (x < 0) | (x > self.screen_width) | (y < 0) | (y > self.screen_height)
+
+    def cull_off_screen(self) -> int:
+        """
+        Marca como muertos los proyectiles fuera de pantalla.
+
+        Returns:
+            Número de proyectiles descartados
+        """
+        off_screen = self.off_screen_mask() & self.alive[:self.count]
+        self.alive[:self.count] &= ~off_screen
+        return int(np.count_nonzero(off_screen))
+
+    def register_hit(self, index: int) -> bool:
+        """
+        Aplica un impacto contra un enemigo al proyectil index.
+
+        Returns:
+            True si el proyectil se consume (no perforante, o perforante con el máximo de impactos)
+        """
+        if self.piercing[index]:
+            self.piercing_hits[index] += 1
+            if self.piercing_hits[index] < PROJECTILE_PIERCING_HITS:
+                return False
+        self.alive[index] = False
+        return True
+
+    def compact(self) -> None:
+        """Elimina los proyectiles muertos desplazando los vivos al principio de los arrays."""
+        n = self.count
+        keep = self.alive[:n].copy()  # alive también se compacta dentro del bucle
+        kept = int(np.count_nonzero(keep))
+        if kept == n:
+            return
+        for name in self._ARRAYS:
+            array = getattr(self, name)
+            array[:kept] = array[:n][keep]
+        self.count = kept
+
+    def step(self, collide: Optional[Callable[["ProjectileBatch"], None]] = None) -> None:
+        """
+        Paso completo de un frame: mover, resolver colisiones, descartar y compactar.
+
+        Args:
+            collide: Función opcional que recibe el lote tras moverlo y llama a register_hit()
+        """
+        self.update()
+        if collide is not None:
+            collide(self)
+        self.cull_off_screen()
+        self.compact()
+
+    def collision_rect(self, index: int) -> pygame.Rect:
+        """Rectángulo de colisión del proyectil index (igual que Projectile.get_collision_rect)."""
+        size = int(self.size[index])
+        return pygame.Rect(float(self.x[index]), float(self.y[index]), size, size)
+
+    def live_indices(self) -> np.ndarray:
+        """Índices de los proyectiles vivos."""
+        return np.flatnonzero(self.alive[:self.count])
+
+    def clear(self) -> None:
+        """Elimina todos los proyectiles."""
+        self.alive[:self.count] = False
+        self.count = 0
+
+    def draw(self, screen: pygame.Surface) -> list:
+        """
+        Dibuja los proyectiles vivos con un único screen.blits (círculo si no hay sprite).
+
+        Returns:
+            Rectángulos dibujados (para el render por rectángulos sucios)
+        """
+        n = self.count
+        if n == 0:
+            return []
+        rects = []
+        kinds = self._kinds
+        blit_sequence = []
+        for x, y, kind, alive in zip(self.x[:n].tolist(), self.y[:n].tolist(),
+                                     self.kind[:n].tolist(), self.alive[:n].tolist()):
+            if not alive:
+                continue
+            sprite, size, _ = kinds[kind]
+            if sprite is not None:
+                blit_sequence.append((sprite, (x, y)))
+            else:
+                rects.append(pygame.draw.circle(screen, DEFAULT_COLOR, (int(x), int(y)), size // 2))
+        rects += screen.blits(blit_sequence)
+        return rects
+
+    def enqueue(self, queue, rects: Optional[list] = None) -> None:
+        """
+        Encola los proyectiles vivos en la capa de proyectiles de la cola de render.
+
+        Args:
+            queue: Cola de render (utils.render_queue.RenderQueue)
+            rects: Lista a la que añadir el área de cada proyectil (solo hace falta para el
+                render por rectángulos sucios)
+        """
+        n = self.count
+        if n == 0:
+            return
+        kinds = self._kinds
+        blits = queue.blits[LAYER_PROJECTILES]
+        for x, y, kind, alive in zip(self.x[:n].tolist(), self.y[:n].tolist(),
+                                     self.kind[:n].tolist(), self.alive[:n].tolist()):
+            if not alive:
+                continue
+            sprite, size, _ = kinds[kind]
+            if sprite is not None:
+                blits.append((sprite, (x, y)))
+                if rects is not None:
+                    rects.append(sprite.get_rect(topleft=(x, y)))
+            else:
+                center = (int(x), int(y))
+                radius = size // 2
+                queue.add_draw(LAYER_PROJECTILES, pygame.draw.circle, DEFAULT_COLOR, center, radius)
+                if rects is not None:
+                    rects.append(pygame.Rect(center[0] - radius, center[1] - radius, 2 * radius + 1, 2 * radius + 1))
+
+    def __len__(self) -> int:
+        """Número de proyectiles en el lote (vivos hasta la próxima compactación)."""
+        return self.count
+
+    def __str__(self) -> str:
+        """Representación en string del lote."""
+        return f"ProjectileBatch(count={self.count}, capacity={self.capacity})"
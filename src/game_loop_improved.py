@@ -11,22 +11,39 @@ import time
 import sys
 import os
 sys.path.insert(0, os.path.dirname(__file__))
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, Union
 from managers.sound_manager import SoundManager
 from managers.save_manager import SaveManager
 from managers.enemy_generator import EnemyGenerator
+from managers.projectile_pool import ProjectilePool
 from entities.player import Player
 from entities.enemies import Enemy
 from entities.projectile import Projectile
+from entities.projectile_batch import ProjectileBatch
 from entities.powerups import PowerUp
 from ui.menu_system import MenuSystem
 from ui.hud import HUD
+from ui.profiler_overlay import ProfilerOverlay
 from utils.text_renderer import TextRenderer
 from utils.sprite_sheet import AnimationManager
+from utils.asset_preloader import AssetPreloader
+from utils.spatial_hash import SpatialHashGrid
+from utils.collision import find_overlaps, rects_to_array, square_rects_array, resolve_projectile_hits
+from utils.input_replay import InputRecorder, InputReplayer
+from utils.frame_profiler import FrameProfiler
+from utils.dirty_rect_renderer import DirtyRectRenderer
+from utils.render_queue import RenderQueue
+from utils.sprite_groups import SpriteGroupRenderer, sync_group, collide_boxes, group_overlaps
+from utils.background import level_background
+from utils.flight_recorder import FlightRecorder
 from utils.advanced_logger import setup_logging, get_logger
-from constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from utils.trace import get_channel, flush as flush_traces
+from constants import (SCREEN_WIDTH, SCREEN_HEIGHT, FPS, ENEMY_SIZE, PROJECTILE_PIERCING_HITS, PROJECTILE_ENGINE,
+                       SIMULATION_DT, MAX_SIM_STEPS, RENDER_MODE, SPRITE_BATCHING, COLLISION_ENGINE)
 import pygame_menu
 
+_trace_loop = get_channel("loop")
+
 
 class GameLoop:
     """
@@ -34,6 +51,11 @@ class GameLoop:
     Optimizado para rendimiento y mantenibilidad.
     """
     
+    # Fases de un paso de simulación y de un render, en orden (las mide tools/benchmark_gameplay.py)
+    UPDATE_PHASES = ("_update_player", "_update_enemies", "_advance_projectiles", "_update_powerups",
+                     "_check_player_collisions", "_spawn_entities")
+    RENDER_PHASES = ("_draw_entities", "_draw_hud", "_present")
+    
     def __init__(self, screen: pygame.Surface, logger=None):
         """
         Inicializa el bucle de juego mejorado.
@@ -46,27 +68,70 @@ class GameLoop:
         self.logger = logger or get_logger("PyGame")
         self.clock = pygame.time.Clock()
         
+        # Reloj de simulación: avanza SIMULATION_DT por paso y es el único reloj que
+        # ven las entidades (temporizadores, animaciones, cooldowns, niveles)
+        self.sim_time = 0.0
+        self.sim_accumulator = 0.0
+        self.last_frame_time: Optional[float] = None
+        self.sim_steps_dropped = 0
+        
         # Estado del juego
         self.running = False
         self.paused = False
         self.game_state = "menu"  # menu, playing, paused, game_over
+        # En modo sin ventana (headless.py) los fines de nivel y de partida no abren menús
+        self.menus_enabled = True
+        # Grabación/reproducción de entrada (utils.input_replay); ver headless.py --record/--replay
+        self.input_recorder: Optional[InputRecorder] = None
+        self.input_replayer: Optional[InputReplayer] = None
+        # Grabador de vuelo (utils.flight_recorder): métricas por frame y volcado con F12
+        self.flight_recorder: Optional[FlightRecorder] = None
         
         # Managers
-        self.sound_manager = SoundManager(self.logger)
+        # Los efectos de sonido los carga el precargador en segundo plano
+        self.sound_manager = SoundManager(self.logger, load_sounds=False)
         self.save_manager = SaveManager(self.logger)
         self.enemy_generator = EnemyGenerator(self.logger)
+        self.projectile_pool = ProjectilePool(self.logger)
         self.menu_system = MenuSystem(screen, self.logger)
         self.text_renderer = TextRenderer(self.logger)
         self.animation_manager = AnimationManager(self.logger)
+        self.asset_preloader = AssetPreloader(self.sound_manager, self.logger)
+        self.preload_font: Optional[pygame.font.Font] = None
         
         # Entidades del juego
         self.player: Optional[Player] = None
         self.enemies: list[Enemy] = []
         self.projectiles: list[Projectile] = []
+        # Con PROJECTILE_ENGINE = "batch" los proyectiles del jugador viven en arrays de NumPy
+        self.projectile_batch: Optional[ProjectileBatch] = None
+        if PROJECTILE_ENGINE == "batch":
+            self.projectile_batch = ProjectileBatch(SCREEN_WIDTH, SCREEN_HEIGHT, logger=self.logger)
         self.powerups: list[PowerUp] = []
         
+        # Rejillas espaciales para las consultas de colisión (se reconstruyen cada frame)
+        self.enemy_grid = SpatialHashGrid(SCREEN_WIDTH, SCREEN_HEIGHT, ENEMY_SIZE)
+        self.powerup_grid = SpatialHashGrid(SCREEN_WIDTH, SCREEN_HEIGHT, ENEMY_SIZE)
+        # Grupos de pygame.sprite para COLLISION_ENGINE = "groups" (sincronizados con las listas en cada paso)
+        self.collision_engine = COLLISION_ENGINE
+        self.enemy_group = pygame.sprite.Group()
+        self.projectile_group = pygame.sprite.Group()
+        self.powerup_group = pygame.sprite.Group()
+        
         # HUD
         self.hud = HUD(screen)
+        # Fondo del nivel, escalado y convertido una vez (utils.background); se carga aquí y no en el
+        # precargador para no decodificar dos veces la imagen 4K
+        self.background = level_background(1, screen.get_size(), self.logger)
+        self._pause_overlay: Optional[pygame.Surface] = None
+        # Render por rectángulos sucios (RENDER_MODE = "dirty" o "sprites"); None = fill + flip por frame
+        self.render_mode = "full"
+        self.dirty_renderer: Optional[Union[DirtyRectRenderer, SpriteGroupRenderer]] = None
+        # Áreas dibujadas en el frame actual (retornadas por los draw() de entidades y HUD)
+        self.drawn_rects: list = []
+        self.set_render_mode(RENDER_MODE)
+        # Cola de sprites por capas (SPRITE_BATCHING); None = un blit por entidad
+        self.render_queue: Optional[RenderQueue] = RenderQueue() if SPRITE_BATCHING else None
         self.active_powerups = {}  # Diccionario para tiempos de powerups activos
         
         # Estadísticas del juego
@@ -90,10 +155,12 @@ class GameLoop:
         # Callbacks del menú
         self._setup_menu_callbacks()
         
-        # Estadísticas de rendimiento
+        # Estadísticas de rendimiento: tiempos por fase de los últimos frames (overlay con F1)
+        self.profiler = FrameProfiler()
+        self.profiler_overlay = ProfilerOverlay(self.profiler)
+        self.debug_mode = False
         self.fps_counter = 0
-        self.frame_times = []
-        self.last_fps_update = time.time()
+        self.last_fps_update = time.perf_counter()
         
         self.logger.log_event("GameLoop mejorado inicializado", "game_loop")
         self.logger.log_system_info()
@@ -134,20 +201,28 @@ class GameLoop:
         self.running = True
         self.logger.log_event("Iniciando bucle principal del juego", "game_loop")
         
-        # Mostrar menú principal
+        # Mostrar menú principal y precargar assets mientras tanto
         self.menu_system.show_main_menu()
         self.game_state = "menu"
+        self.asset_preloader.start()
         # Guardar instancia global para callbacks
         GameLoop.instance = self
         
         while self.running:
-            print(f"[DEBUG] game_state={self.game_state}, current_menu={self.menu_system.current_menu}")
+            if _trace_loop.enabled:
+                _trace_loop("game_state=%s, current_menu=%s", self.game_state, self.menu_system.current_menu)
             if self.game_state == "menu" and self.menu_system.current_menu:
                 self._handle_menu_events_non_blocking()
+                self.profiler.pause()
             else:
-                self._handle_events()
-                self._update()
+                self.profiler.begin_frame()
+                with self.profiler.section("events"):
+                    self._handle_events()
+                self._advance_simulation()
                 self._render()
+                self.profiler.end_frame()
+                if self.flight_recorder is not None:
+                    self._record_flight_frame()
                 self._update_fps()
             self.clock.tick(FPS)
         self.logger.log_event("Bucle principal terminado", "game_loop")
@@ -161,26 +236,58 @@ class GameLoop:
             if event.type == pygame.QUIT:
                 self.running = False
                 self.logger.log_event("Evento QUIT recibido (menú)", "game_loop")
+                self._dump_flight_recorder_on_errors()
                 return
         self.menu_system.current_menu.update(events)
         # Comprobar si el menú sigue activo tras el update (puede haber sido cerrado por un callback)
         if not self.menu_system.current_menu:
             return
+        self.screen.blit(self.background, (0, 0))
         self.menu_system.current_menu.draw(self.screen)
+        if not self.asset_preloader.is_done():
+            self.asset_preloader.step()
+            self._render_preload_progress()
         pygame.display.flip()
     
-    def _handle_events(self) -> None:
-        """Maneja los eventos del juego."""
-        for event in pygame.event.get():
+    def _render_preload_progress(self) -> None:
+        """Dibuja una barra con el progreso de la precarga de assets sobre el menú."""
+        if self.preload_font is None:
+            self.preload_font = pygame.font.Font(None, 24)
+        progress = self.asset_preloader.progress
+        bar_rect = pygame.Rect(40, SCREEN_HEIGHT - 50, SCREEN_WIDTH - 80, 12)
+        pygame.draw.rect(self.screen, (60, 60, 60), bar_rect, border_radius=6)
+        fill_rect = bar_rect.copy()
+        fill_rect.width = int(bar_rect.width * progress)
+        if fill_rect.width > 0:
+            pygame.draw.rect(self.screen, (255, 255, 0), fill_rect, border_radius=6)
+        text_surface = self.preload_font.render(f"Cargando assets... {int(progress * 100)}%", True, (255, 255, 255))
+        self.screen.blit(text_surface, (bar_rect.x, bar_rect.y - 22))
+    
+    def _handle_events(self, events: Optional[list] = None) -> None:
+        """
+        Maneja los eventos del juego.
+
+        Args:
+            events: Eventos a procesar (p. ej. de un replay); se leen de la cola de pygame si es None
+        """
+        if events is None:
+            events = pygame.event.get()
+        if self.input_recorder is not None:
+            self.input_recorder.record_events(events)
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
                 self.logger.log_event("Evento QUIT recibido", "game_loop")
+                self._dump_flight_recorder_on_errors()
             
             elif event.type == pygame.KEYDOWN:
                 self._handle_keydown(event)
             
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 self._handle_mouse_click(event)
+            
+            elif event.type == pygame.WINDOWEXPOSED and self.dirty_renderer is not None:
+                self.dirty_renderer.invalidate()
     
     def _handle_keydown(self, event: pygame.event.Event) -> None:
         """Maneja eventos de teclas presionadas."""
@@ -198,6 +305,36 @@ class GameLoop:
         
         elif event.key == pygame.K_F1:
             self._toggle_debug_mode()
+        
+        elif event.key == pygame.K_F12:
+            self.dump_flight_recorder("tecla F12")
+    
+    def _record_flight_frame(self) -> None:
+        """Guarda las métricas del frame recién cerrado en el grabador de vuelo."""
+        projectiles = len(self.projectile_batch) if self.projectile_batch is not None else len(self.projectiles)
+        self.flight_recorder.record_frame(self.sim_time, self.game_state, self.profiler.last_frame_ms,
+                                          len(self.enemies), projectiles, len(self.powerups), self.score)
+    
+    def dump_flight_recorder(self, reason: str, exc_info=None) -> None:
+        """
+        Vuelca el grabador de vuelo a un archivo de logs/ (no hace nada si no hay grabador).
+
+        Args:
+            reason: Motivo del volcado
+            exc_info: Tupla de sys.exc_info() si el volcado lo provoca una excepción
+        """
+        if self.flight_recorder is None:
+            return
+        path = self.flight_recorder.dump(reason, exc_info)
+        if path is not None:
+            self.logger.log_event("Grabador de vuelo volcado en %s (%s)", "game_loop", path, reason)
+        else:
+            self.logger.log_warning("No se pudo volcar el grabador de vuelo (%s)", "game_loop", reason)
+    
+    def _dump_flight_recorder_on_errors(self) -> None:
+        """Al salir, vuelca el grabador de vuelo si se registró algún error durante la sesión."""
+        if self.flight_recorder is not None and self.flight_recorder.errors_seen:
+            self.dump_flight_recorder(f"salida con {self.flight_recorder.errors_seen} errores registrados")
     
     def _handle_mouse_click(self, event: pygame.event.Event) -> None:
         """Maneja eventos de clics del ratón."""
@@ -206,111 +343,310 @@ class GameLoop:
             mouse_x, mouse_y = event.pos if hasattr(event, 'pos') else pygame.mouse.get_pos()
             self._player_shoot(mouse_x, mouse_y)
     
-    def _update(self) -> None:
-        """Actualiza la lógica del juego."""
+    def _advance_simulation(self) -> None:
+        """
+        Ejecuta los pasos de simulación fijos que corresponden al tiempo real transcurrido.
+
+        El tiempo de cada frame se acumula y se consume en pasos de SIMULATION_DT, así la
+        velocidad del juego no depende de los FPS. Si un frame necesitaría más de
+        MAX_SIM_STEPS pasos el resto se descarta (el juego se ralentiza en lugar de
+        encadenar frames cada vez más lentos).
+        """
+        if self.game_state != "playing":
+            # En pausa o en menús el reloj de simulación no avanza
+            self.last_frame_time = None
+            self.sim_accumulator = 0.0
+            return
+        
+        frame_start = time.perf_counter()
+        if self.last_frame_time is None:
+            # Primer frame de juego tras un menú: empezar con un paso
+            self.sim_accumulator = SIMULATION_DT
+        else:
+            self.sim_accumulator += frame_start - self.last_frame_time
+        self.last_frame_time = frame_start
+        
+        steps = 0
+        while self.sim_accumulator >= SIMULATION_DT and self.game_state == "playing":
+            if steps == MAX_SIM_STEPS:
+                dropped = int(self.sim_accumulator / SIMULATION_DT)
+                self.sim_steps_dropped += dropped
+                self.sim_accumulator = 0.0
+                self.logger.log_debug("Frame lento: %d pasos de simulación descartados", "game_loop", dropped)
+                break
+            self._step()
+            self.sim_accumulator -= SIMULATION_DT
+            steps += 1
+    
+    def _step(self, keys=None) -> None:
+        """
+        Avanza la simulación un paso fijo de SIMULATION_DT segundos.
+
+        Args:
+            keys: Estado de teclas del paso (p. ej. ReplayKeys de un replay); se lee del teclado si es None
+        """
         if self.game_state == "playing":
-            self._update_game()
+            if keys is None:
+                keys = pygame.key.get_pressed()
+            if self.input_recorder is not None:
+                self.input_recorder.record_step(keys)
+            self.sim_time += SIMULATION_DT
+            self._update_game(self.sim_time, keys)
     
-    def _update_game(self) -> None:
-        """Actualiza la lógica del juego durante la partida."""
-        current_time = time.time()
+    def _update_game(self, now: float, keys=None) -> None:
+        """
+        Actualiza la lógica del juego durante la partida, fase a fase (ver UPDATE_PHASES).
+
+        Args:
+            now: Reloj de simulación del paso actual (segundos)
+            keys: Estado de teclas para el jugador (ver Player.update)
+        """
+        profiler = self.profiler
+        with profiler.section("player"):
+            self._update_player(now, keys)
+        with profiler.section("enemies"):
+            self._update_enemies(now)
+        with profiler.section("projectiles"):
+            self._advance_projectiles()
+        with profiler.section("powerups"):
+            self._update_powerups()
+        with profiler.section("collisions"):
+            if self._check_player_collisions(now):
+                return
         
-        # Actualizar jugador
-        if self.player:
-            self.player.update()
-            # El movimiento ya se gestiona en Player.update()
+        # Actualizar tiempo del nivel
+        self.level_time = now - self.level_start_time
+        
+        # Verificar fin de nivel
+        if self.level_time >= self.level_duration:
+            self._end_level()
+            return
         
-        # Actualizar enemigos
+        with profiler.section("spawn"):
+            self._spawn_entities(now)
+    
+    def _update_player(self, now: float, keys=None) -> None:
+        """Actualiza el jugador (movimiento, animación y power-ups en Player.update())."""
+        if self.player:
+            self.player.update(now, keys)
+    
+    def _update_enemies(self, now: float) -> None:
+        """Mueve los enemigos, descarta los que salen de pantalla y los indexa en la rejilla."""
         for enemy in self.enemies[:]:
-            enemy.update()
+            enemy.update(now)
             
             # Verificar si el enemigo salió de la pantalla
             if enemy.y > SCREEN_HEIGHT:
-                self.enemies.remove(enemy)
-                self.logger.log_event("Enemigo eliminado por salir de pantalla", "game_loop")
+                self._remove_enemy(enemy)
+                self.logger.log_debug("Enemigo eliminado por salir de pantalla", "game_loop")
         
-        # Actualizar proyectiles
-        for projectile in self.projectiles[:]:
-            projectile.update()
-            
-            # Añadir contador de colisiones para proyectiles perforantes
-            if not hasattr(projectile, 'piercing_hits'):
-                projectile.piercing_hits = 0
-            
-            # Verificar colisiones con enemigos
-            for enemy in self.enemies[:]:
-                if projectile.get_collision_rect().colliderect(enemy.collision_box):
-                    self.logger.log_debug(f"Proyectil colisiona con enemigo en ({enemy.x},{enemy.y}) - Daño: {projectile.damage}", "game_loop")
-                    enemy.take_damage(projectile.damage)
-                    if projectile.piercing:
-                        projectile.piercing_hits += 1
-                        if projectile.piercing_hits >= 2:  # Por ejemplo, atraviesa 2 enemigos máximo
-                            self.logger.log_debug("Proyectil perforante eliminado tras atravesar 2 enemigos.", "game_loop")
-                            self.projectiles.remove(projectile)
-                            break
-                    else:
-                        self.logger.log_debug("Proyectil eliminado tras colisión.", "game_loop")
-                        self.projectiles.remove(projectile)
-                        break
-                    
-                    if enemy.health <= 0:
-                        self.logger.log_event(f"Enemigo eliminado - Puntuación: {self.score}", "game_loop")
-                        self.enemies.remove(enemy)
-                        self.score += enemy.points
-            
-            # Verificar si el proyectil salió de la pantalla
-            if (projectile.y < 0 or projectile.y > SCREEN_HEIGHT or 
-                projectile.x < 0 or projectile.x > SCREEN_WIDTH):
-                if projectile in self.projectiles:
-                    self.logger.log_debug("Proyectil eliminado por salir de pantalla.", "game_loop")
-                    self.projectiles.remove(projectile)
-        
-        # Actualizar powerups
+        # Indexar los enemigos ya movidos para las consultas de colisión del jugador
+        if self.collision_engine == "groups":
+            sync_group(self.enemy_group, self.enemies)
+        else:
+            self.enemy_grid.rebuild(self.enemies)
+    
+    def _advance_projectiles(self) -> None:
+        """Mueve los proyectiles del jugador y resuelve sus impactos con el motor configurado."""
+        if self.projectile_batch is not None:
+            self.projectile_batch.step(self._collide_projectile_batch)
+        else:
+            self._update_projectiles()
+    
+    def _update_powerups(self) -> None:
+        """Mueve los powerups, descarta los que salen de pantalla y los indexa en la rejilla."""
+        self.powerup_grid.clear()
+        use_grid = self.collision_engine != "groups"
         for powerup in self.powerups[:]:
             powerup.update()
             
-            # Verificar colisiones con power-ups
-            for powerup in self.powerups[:]:
-                if self.player and powerup.get_collision_rect().colliderect(self.player.collision_box):
-                    self.player.activate_powerup(powerup.type)
-                    self.powerups.remove(powerup)
-                    self.logger.log_event(f"PowerUp recogido: {powerup.type}", "game_loop")
-            
             # Verificar si el powerup salió de la pantalla
             if powerup.y > SCREEN_HEIGHT:
                 self.powerups.remove(powerup)
+            elif use_grid:
+                self.powerup_grid.insert(powerup, powerup.get_collision_rect())
+        if not use_grid:
+            sync_group(self.powerup_group, self.powerups)
+    
+    def _check_player_collisions(self, now: float) -> bool:
+        """
+        Resuelve las colisiones del jugador con power-ups y enemigos.
+
+        Returns:
+            True si el jugador se ha quedado sin vidas (partida terminada)
+        """
+        if not self.player:
+            return False
         
-        # Verificar colisiones jugador-enemigos
-        if self.player:
-            for enemy in self.enemies[:]:
-                if self.player.collision_box.colliderect(enemy.collision_box):
-                    self.player.take_damage(enemy.damage)
-                    self.enemies.remove(enemy)
-                    self.logger.log_event("Jugador dañado por enemigo", "game_loop")
-                    
-                    if self.player.lives <= 0:
-                        self._game_over()
-                        return
-        
-        # Actualizar tiempo del nivel
-        self.level_time = current_time - self.level_start_time
-        
-        # Verificar fin de nivel
-        if self.level_time >= self.level_duration:
-            self._end_level()
+        # Verificar colisiones con power-ups
+        for powerup in self._player_overlaps(self.powerup_grid, self.powerup_group):
+            self.player.activate_powerup(powerup.type, now)
+            self.powerups.remove(powerup)
+            self.logger.log_event("PowerUp recogido: %s", "game_loop", powerup.type)
         
-        # Generar enemigos
-        nuevos_enemigos = self.enemy_generator.generate_enemies(self.score)
+        # Verificar colisiones jugador-enemigos
+        for enemy in self._player_overlaps(self.enemy_grid, self.enemy_group):
+            self.player.take_damage(enemy.damage)
+            self._remove_enemy(enemy)
+            self.logger.log_event("Jugador dañado por enemigo", "game_loop")
+            
+            if self.player.lives <= 0:
+                self._game_over()
+                return True
+        return False
+    
+    def _player_overlaps(self, grid: SpatialHashGrid, group: pygame.sprite.Group) -> list:
+        """Entidades que tocan la caja de colisión del jugador, según el motor de colisiones."""
+        if self.collision_engine == "groups":
+            return pygame.sprite.spritecollide(self.player, group, False, collide_boxes)
+        return grid.query(self.player.collision_box)
+    
+    def _spawn_entities(self, now: float) -> None:
+        """Genera los enemigos y powerups que tocan en este paso."""
+        nuevos_enemigos = self.enemy_generator.generate_enemies(self.score, now)
         if nuevos_enemigos:
             self.enemies.extend(nuevos_enemigos)
         
         # Generar powerups aleatorios
-        if current_time - self.last_powerup_time > 10:  # Cada 10 segundos
+        if now - self.last_powerup_time > 10:  # Cada 10 segundos
             self._spawn_random_powerup()
-            self.last_powerup_time = current_time
+            self.last_powerup_time = now
+    
+    def _update_projectiles(self) -> None:
+        """Mueve los proyectiles (objetos Projectile) y resuelve sus colisiones con enemigos."""
+        for projectile in self.projectiles:
+            projectile.update()
+        
+        # Verificar colisiones con enemigos (broadphase por lotes)
+        self._collide_projectiles()
+        
+        # Verificar si el proyectil salió de la pantalla
+        for projectile in self.projectiles[:]:
+            if (projectile.y < 0 or projectile.y > SCREEN_HEIGHT or 
+                projectile.x < 0 or projectile.x > SCREEN_WIDTH):
+                self.logger.log_debug("Proyectil eliminado por salir de pantalla.", "game_loop")
+                self._remove_projectile(projectile)
+    
+    def _collide_projectiles(self) -> None:
+        """
+        Resuelve las colisiones proyectil-enemigo de todo el frame de una vez.
+        Un proyectil no perforante se detiene en el primer enemigo y uno perforante
+        tras PROJECTILE_PIERCING_HITS, igual que el antiguo bucle de colliderect.
+        """
+        if not self.projectiles or not self.enemies:
+            return
+        projectiles = list(self.projectiles)
+        enemies = list(self.enemies)
+        if self.collision_engine == "groups":
+            sync_group(self.projectile_group, projectiles)
+            ia, ib = group_overlaps(projectiles, self.projectile_group, enemies, self.enemy_group)
+        else:
+            ia, ib = find_overlaps(rects_to_array([projectile.get_collision_rect() for projectile in projectiles]),
+                                   rects_to_array([enemy.collision_box for enemy in enemies]))
+        hits, consumed = resolve_projectile_hits(
+            ia, ib,
+            [projectile.piercing for projectile in projectiles],
+            [projectile.piercing_hits for projectile in projectiles],
+            [projectile.damage for projectile in projectiles],
+            [enemy.health for enemy in enemies],
+            PROJECTILE_PIERCING_HITS)
+        
+        for projectile_index, enemy_index in hits:
+            projectile = projectiles[projectile_index]
+            self._apply_projectile_hit(enemies[enemy_index], projectile.damage)
+            if projectile.piercing:
+                projectile.piercing_hits += 1
+        
+        if consumed:
+            self.logger.log_debug("%d proyectiles eliminados tras colisión.", "game_loop", len(consumed))
+            consumed_projectiles = [projectiles[index] for index in consumed]
+            consumed_ids = {id(projectile) for projectile in consumed_projectiles}
+            self.projectiles = [projectile for projectile in self.projectiles if id(projectile) not in consumed_ids]
+            self.projectile_pool.release_all(consumed_projectiles)
+    
+    def _collide_projectile_batch(self, batch: ProjectileBatch) -> None:
+        """Resuelve las colisiones de los proyectiles del lote con los enemigos (mismas reglas que _collide_projectiles)."""
+        if batch.count == 0 or not self.enemies:
+            return
+        enemies = list(self.enemies)
+        live = batch.live_indices()
+        ia, ib = find_overlaps(square_rects_array(batch.x[live], batch.y[live], batch.size[live]),
+                               rects_to_array([enemy.collision_box for enemy in enemies]))
+        hits, _ = resolve_projectile_hits(
+            ia, ib, batch.piercing[live].tolist(), batch.piercing_hits[live].tolist(),
+            batch.damage[live].tolist(), [enemy.health for enemy in enemies], PROJECTILE_PIERCING_HITS)
+        
+        for projectile_index, enemy_index in hits:
+            index = int(live[projectile_index])
+            self._apply_projectile_hit(enemies[enemy_index], int(batch.damage[index]))
+            batch.register_hit(index)
+    
+    def _apply_projectile_hit(self, enemy: Enemy, damage: int) -> None:
+        """Aplica el daño de un proyectil a un enemigo y lo elimina si muere."""
+        if self.logger.debug_enabled:
+            self.logger.log_debug("Proyectil colisiona con enemigo en (%s,%s) - Daño: %s", "game_loop", enemy.x, enemy.y, damage)
+        if enemy.take_damage(damage):
+            self.score += enemy.score_value
+            self._remove_enemy(enemy)
+            self.logger.log_event("Enemigo eliminado - Puntuación: %s", "game_loop", self.score)
+    
+    def _remove_enemy(self, enemy: Enemy) -> None:
+        """Quita un enemigo de la partida (y de la rejilla de colisiones) y lo devuelve al pool del generador."""
+        self.enemies.remove(enemy)
+        self.enemy_grid.remove(enemy, enemy.collision_box)
+        self.enemy_group.remove(enemy)
+        self.enemy_generator.release_enemy(enemy)
+    
+    def _clear_enemies(self) -> None:
+        """Quita todos los enemigos de la partida devolviéndolos al pool."""
+        self.enemy_generator.release_enemies(self.enemies)
+        self.enemies.clear()
+        self.enemy_grid.clear()
+        self.enemy_group.empty()
+    
+    def _projectile_source(self):
+        """Retorna dónde crea el jugador sus proyectiles: el lote NumPy o el pool de objetos."""
+        return self.projectile_batch if self.projectile_batch is not None else self.projectile_pool
+    
+    def _remove_projectile(self, projectile: Projectile) -> None:
+        """Quita un proyectil de la partida y lo devuelve al pool."""
+        self.projectiles.remove(projectile)
+        self.projectile_pool.release(projectile)
+    
+    def _clear_projectiles(self) -> None:
+        """Quita todos los proyectiles de la partida devolviéndolos al pool."""
+        self.projectile_pool.release_all(self.projectiles)
+        self.projectiles.clear()
+        if self.projectile_batch is not None:
+            self.projectile_batch.clear()
+    
+    def set_render_mode(self, mode: str) -> None:
+        """
+        Cambia el modo de render de la partida.
+
+        Args:
+            mode: "full" (rellenar la pantalla y flip() en cada frame), "dirty" (borrar y
+                  actualizar solo las zonas dibujadas en este frame y en el anterior) o
+                  "sprites" (las entidades se dibujan como un grupo LayeredDirty)
+        """
+        if mode == "dirty":
+            if not isinstance(self.dirty_renderer, DirtyRectRenderer):
+                self.dirty_renderer = DirtyRectRenderer(self.screen, self.background)
+        elif mode == "sprites":
+            if not isinstance(self.dirty_renderer, SpriteGroupRenderer):
+                self.dirty_renderer = SpriteGroupRenderer(self.screen, self.background)
+        elif mode == "full":
+            self.dirty_renderer = None
+        else:
+            raise ValueError(f"Modo de render desconocido: {mode}")
+        self.render_mode = mode
+        self.logger.log_event("Modo de render: %s", "game_loop", mode)
     
     def _render(self) -> None:
         """Renderiza el juego."""
+        if self.game_state != "playing" and self.dirty_renderer is not None:
+            # Menús y pausa dibujan sobre toda la pantalla: al volver, frame completo
+            self.dirty_renderer.invalidate()
         if self.game_state == "playing":
             self._render_game()
         elif self.game_state == "menu":
@@ -319,40 +655,108 @@ class GameLoop:
             self._render_paused_game()
     
     def _render_game(self) -> None:
-        """Renderiza el juego durante la partida."""
-        self.screen.fill((0, 0, 0))
-        if hasattr(self, 'debug_mode') and self.debug_mode:
-            print(f"[DEBUG] Renderizando juego. Jugador: {self.player}, Enemigos: {len(self.enemies)}, Proyectiles: {len(self.projectiles)}")
-        # Renderizar entidades
+        """Renderiza el juego durante la partida, fase a fase (ver RENDER_PHASES)."""
+        profiler = self.profiler
+        renderer = self.dirty_renderer
+        self.drawn_rects.clear()
+        with profiler.section("render"):
+            if renderer is None:
+                self.screen.blit(self.background, (0, 0))
+            else:
+                if self.debug_mode:
+                    # El overlay del profiler es translúcido: redibujar la pantalla entera
+                    renderer.invalidate()
+                renderer.erase()
+            if _trace_loop.enabled:
+                _trace_loop("Renderizando juego. Jugador: %s, Enemigos: %s, Proyectiles: %s",
+                            self.player, len(self.enemies), len(self.projectiles))
+            self._draw_entities()
+        with profiler.section("hud"):
+            self._draw_hud()
+        with profiler.section("flip"):
+            self._present()
+    
+    def _draw_entities(self) -> None:
+        """Dibuja jugador, enemigos, proyectiles y powerups, anotando el área de cada uno."""
+        screen = self.screen
+        rects = self.drawn_rects
+        queue = self.render_queue
+        if self.render_mode == "sprites":
+            self._draw_sprites(queue, rects)
+            return
+        if queue is not None:
+            self._enqueue_entities(queue, rects)
+            queue.flush(screen)
+            return
+        if self.player:
+            rects.append(self.player.draw(screen))
+        for enemy in self.enemies:
+            rects.append(enemy.draw(screen))
+        for projectile in self.projectiles:
+            rects.append(projectile.draw(screen))
+        if self.projectile_batch is not None:
+            rects += self.projectile_batch.draw(screen)
+        for powerup in self.powerups:
+            rects.append(powerup.draw(screen))
+    
+    def _draw_sprites(self, queue: Optional[RenderQueue], rects: list) -> None:
+        """
+        Modo "sprites": el grupo LayeredDirty dibuja jugador, enemigos, proyectiles y powerups.
+        El lote de proyectiles NumPy no son sprites: se dibuja encima y sus áreas se anotan
+        en rects para que el renderer las repinte en el frame siguiente.
+        """
+        entities = [self.player] if self.player else []
+        entities += self.enemies
+        entities += self.projectiles
+        entities += self.powerups
+        self.dirty_renderer.draw_sprites(entities)
+        batch = self.projectile_batch
+        if batch is not None:
+            if queue is not None:
+                batch.enqueue(queue, rects)
+                queue.flush(self.screen)
+            else:
+                rects += batch.draw(self.screen)
+    
+    def _enqueue_entities(self, queue: RenderQueue, rects: list) -> None:
+        """Encola las entidades por capas en lugar de dibujarlas una a una."""
         if self.player:
-            self.player.draw(self.screen)
+            rects.append(self.player.enqueue(queue))
         for enemy in self.enemies:
-            enemy.draw(self.screen)
+            rects.append(enemy.enqueue(queue))
         for projectile in self.projectiles:
-            projectile.draw(self.screen)
+            rects.append(projectile.enqueue(queue))
+        if self.projectile_batch is not None:
+            # Las áreas de cada proyectil del lote solo hacen falta en modo "dirty"
+            self.projectile_batch.enqueue(queue, rects if self.dirty_renderer is not None else None)
         for powerup in self.powerups:
-            powerup.draw(self.screen)
-        # Renderizar HUD
+            rects.append(powerup.enqueue(queue))
+    
+    def _draw_hud(self) -> None:
+        """Dibuja el HUD y, en modo debug, el overlay del profiler."""
         lives = self.player.lives if self.player else 0
         shield_lives = self.player.shield_lives if self.player and hasattr(self.player, 'shield_lives') else 0
         score = self.score
         current_level = self.level
         time_remaining = max(0, self.level_duration - self.level_time)
         active_powerups = self.active_powerups
-        self.hud.draw(lives, shield_lives, score, current_level, time_remaining, active_powerups)
+        self.drawn_rects.append(self.hud.draw(lives, shield_lives, score, current_level, time_remaining, active_powerups))
         # Renderizar información de debug visual
-        if hasattr(self, 'debug_mode') and self.debug_mode:
-            font = pygame.font.SysFont('Arial', 18)
-            debug_text = f"DEBUG: Jugador={self.player}, Enemigos={len(self.enemies)}, Proyectiles={len(self.projectiles)}, Powerups={len(self.powerups)}"
-            text_surface = font.render(debug_text, True, (255,255,0))
-            self.screen.blit(text_surface, (10, 10))
-        pygame.display.flip()
+        if self.debug_mode:
+            self._render_debug_info()
+    
+    def _present(self) -> None:
+        """Presenta el frame dibujado en pantalla (solo las zonas sucias en modo "dirty")."""
+        if self.dirty_renderer is not None:
+            self.dirty_renderer.present(self.drawn_rects)
+        else:
+            pygame.display.flip()
     
     def _render_menu(self) -> None:
         """Renderiza el menú."""
         # Los menús de pygame-menu se renderizan automáticamente
         # Solo limpiar pantalla y actualizar
-        self.screen.fill((0, 0, 0))
+        self.screen.blit(self.background, (0, 0))
         pygame.display.flip()
     
     def _render_paused_game(self) -> None:
@@ -360,11 +764,12 @@ class GameLoop:
         # Renderizar el juego en segundo plano
         self._render_game()
         
-        # Renderizar overlay de pausa
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        # Renderizar overlay de pausa (creado una vez)
+        if self._pause_overlay is None:
+            self._pause_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+            self._pause_overlay.set_alpha(128)
+            self._pause_overlay.fill((0, 0, 0))
+        self.screen.blit(self._pause_overlay, (0, 0))
         
         # Renderizar texto de pausa
         self.text_renderer.render_centered_text(
@@ -386,31 +791,25 @@ class GameLoop:
         pygame.display.flip()
     
     def _render_debug_info(self) -> None:
-        """Renderiza información de debug."""
+        """Renderiza el overlay del profiler con información de la partida."""
+        projectiles = len(self.projectile_batch) if self.projectile_batch is not None else len(self.projectiles)
         debug_info = {
-            'FPS': self.fps_counter,
             'Enemigos': len(self.enemies),
-            'Proyectiles': len(self.projectiles),
+            'Proyectiles': projectiles,
             'Powerups': len(self.powerups),
             'Nivel': self.level,
             'Puntuación': self.score,
-            'Tiempo Nivel': f"{self.level_time:.1f}s"
+            'Tiempo Nivel': f"{self.level_time:.1f}s",
+            'Pasos descartados': self.sim_steps_dropped
         }
         
-        self.text_renderer.render_debug_info(debug_info, (10, 10))
+        self.profiler_overlay.draw(self.screen, debug_info)
     
     def _update_fps(self) -> None:
-        """Actualiza el contador de FPS."""
-        current_time = time.time()
-        self.frame_times.append(current_time)
-        
-        # Mantener solo los últimos 60 frames
-        if len(self.frame_times) > 60:
-            self.frame_times.pop(0)
-        
-        # Actualizar FPS cada segundo
+        """Actualiza el contador de FPS (una vez por segundo, desde el profiler)."""
+        current_time = time.perf_counter()
         if current_time - self.last_fps_update >= 1.0:
-            self.fps_counter = len(self.frame_times)
+            self.fps_counter = round(self.profiler.fps)
             self.last_fps_update = current_time
     
     def _start_new_game(self) -> None:
@@ -422,27 +821,63 @@ class GameLoop:
     def _select_character(self, character_name: str) -> None:
         """Selecciona un personaje y inicia el juego."""
         self.logger.log_event(f"Personaje seleccionado: {character_name}", "game_loop")
-        if hasattr(self, 'debug_mode') and self.debug_mode:
-            print(f"[DEBUG] Seleccionando personaje: {character_name}")
+        _trace_loop("Seleccionando personaje: %s", character_name)
+        self.start_game(character_name)
+        _trace_loop("Estado cambiado a 'playing'. Jugador y entidades inicializadas.")
+
+    def start_game(self, character_name: str, level: int = 1) -> None:
+        """
+        Empieza una partida nueva sin pasar por los menús.
+
+        Args:
+            character_name: Clave de CHARACTER_STATS del personaje
+            level: Nivel con el que empezar
+        """
+        # Terminar la precarga para empezar a jugar con la caché caliente
+        self.asset_preloader.finish()
+        self.projectile_pool.preload_sprites()
+        # Cada partida empieza con el reloj de simulación a cero y, si se graba o se
+        # reproduce, con la semilla aleatoria del replay: así la partida es repetible
+        self.sim_time = 0.0
+        if self.input_replayer is not None:
+            self.input_replayer.start()
+        elif self.input_recorder is not None:
+            self.input_recorder.start(character_name, level)
         # Crear jugador según el personaje seleccionado
-        self.player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100, self.logger, self.sound_manager, character_name)
-        if hasattr(self, 'debug_mode') and self.debug_mode:
-            print(f"[DEBUG] Jugador creado: {self.player}")
+        self.player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100, self.logger, self.sound_manager, character_name,
+                             projectile_pool=self._projectile_source())
         # Inicializar juego
         self.score = 0
-        self.level = 1
-        self.level_start_time = time.time()
-        self.last_powerup_time = time.time()
+        self.level = level
+        self._set_level_background(level)
+        self.level_duration = self._level_duration(level)
+        self.level_time = 0
+        self.level_start_time = self.sim_time
+        self.last_powerup_time = self.sim_time
+        self.enemy_generator.reset(self.sim_time)
         # Limpiar entidades
-        self.enemies.clear()
-        self.projectiles.clear()
+        self._clear_enemies()
+        self._clear_projectiles()
         self.powerups.clear()
         # Cambiar estado
         self.game_state = "playing"
         self.menu_system.clear_stack()
-        self.logger.log_event("Juego iniciado", "game_loop")
-        if hasattr(self, 'debug_mode') and self.debug_mode:
-            print(f"[DEBUG] Estado cambiado a 'playing'. Jugador y entidades inicializadas.")
+        self.logger.log_event(f"Juego iniciado (personaje={character_name}, nivel={level})", "game_loop")
+
+    def _set_level_background(self, level: int) -> None:
+        """Usa el fondo del nivel (cacheado) para limpiar la pantalla y borrar en modo "dirty"."""
+        background = level_background(level, self.screen.get_size(), self.logger)
+        if background is not self.background:
+            self.background = background
+            if self.dirty_renderer is not None:
+                self.dirty_renderer.set_background(background)
+
+    @staticmethod
+    def _level_duration(level: int) -> int:
+        """Duración en segundos de un nivel (30 s el primero, +5 s por nivel hasta 60 s)."""
+        if level <= 1:
+            return 30
+        return min(30 + (level * 5), 60)  # Máximo 60 segundos
 
     def _pause_game(self) -> None:
         """Pausa el juego."""
@@ -461,23 +896,27 @@ class GameLoop:
     def _end_level(self) -> None:
         """Termina el nivel actual."""
         self.logger.log_event(f"Nivel {self.level} completado", "game_loop")
+        # Salir de "playing" para que el nivel no vuelva a terminar en cada paso
+        self.game_state = "menu"
         
         # Mostrar menú de mejoras
-        self.menu_system.show_upgrade_menu(
-            self.upgrade_points, 
-            self.points_spent, 
-            self.upgrade_levels
-        )
+        if self.menus_enabled:
+            self.menu_system.show_upgrade_menu(
+                self.upgrade_points, 
+                self.points_spent, 
+                self.upgrade_levels
+            )
     
     def _continue_game(self) -> None:
         """Continúa al siguiente nivel."""
         self.level += 1
-        self.level_start_time = time.time()
-        self.level_duration = min(30 + (self.level * 5), 60)  # Máximo 60 segundos
+        self.level_start_time = self.sim_time
+        self.level_duration = self._level_duration(self.level)
+        self._set_level_background(self.level)
         
         # Limpiar entidades
-        self.enemies.clear()
-        self.projectiles.clear()
+        self._clear_enemies()
+        self._clear_projectiles()
         self.powerups.clear()
         
         # Cambiar estado
@@ -490,15 +929,16 @@ class GameLoop:
         """Termina el juego."""
         self.logger.log_event(f"Juego terminado - Puntuación final: {self.score}", "game_loop")
         self.game_state = "game_over"
-        self.menu_system.show_game_over(self.score)
+        if self.menus_enabled:
+            self.menu_system.show_game_over(self.score)
     
     def _player_shoot(self, target_x=None, target_y=None) -> None:
         """Hace que el jugador dispare."""
         if self.player and not self.paused:
             if target_x is None or target_y is None:
                 target_x, target_y = pygame.mouse.get_pos()
-            projectiles = self.player.shoot(target_x, target_y)
-            self.projectiles.extend(projectiles)
+            # Con el lote NumPy shoot() no retorna nada: el proyectil ya está en el lote
+            self.projectiles.extend(self.player.shoot(target_x, target_y, self.sim_time))
             self.sound_manager.play_sound("shoot")
     
     def _spawn_random_powerup(self) -> None:
@@ -512,7 +952,7 @@ class GameLoop:
         powerup = PowerUp(x, -50, powerup_type, self.logger)
         self.powerups.append(powerup)
         
-        self.logger.log_event(f"Powerup generado: {powerup_type}", "game_loop")
+        self.logger.log_event("Powerup generado: %s", "game_loop", powerup_type)
     
     def _apply_upgrade(self, upgrade_type: str) -> None:
         """Aplica una mejora al jugador."""
@@ -595,7 +1035,7 @@ class GameLoop:
     
     def _toggle_fps_display(self, enabled: bool) -> None:
         """Alterna la visualización de FPS."""
-        self.debug_mode = enabled
+        self._set_debug_mode(enabled)
         self.logger.log_event(f"Debug mode: {enabled}", "game_loop")
     
     def _apply_options(self) -> None:
@@ -608,22 +1048,28 @@ class GameLoop:
         if save_data:
             # Restaurar estado del juego
             self.level = save_data.get('level', 1)
+            self.level_duration = self._level_duration(self.level)
+            self._set_level_background(self.level)
             self.score = save_data.get('score', 0)
             self.upgrade_levels = save_data.get('upgrade_levels', {})
             self.upgrade_points = save_data.get('upgrade_points', 0)
             self.points_spent = save_data.get('points_spent', 0)
             
-            # Crear jugador
+            # Crear jugador (con la precarga terminada)
+            self.asset_preloader.finish()
+            self.projectile_pool.preload_sprites()
             player_name = save_data.get('player_name', 'Kava')
-            self.player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100, self.logger, self.sound_manager, player_name)
+            self.player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100, self.logger, self.sound_manager, player_name,
+                                 projectile_pool=self._projectile_source())
             # Aplicar mejoras guardadas
             if hasattr(self.player, 'apply_saved_upgrades'):
                 self.player.apply_saved_upgrades(self.upgrade_levels)
             
             # Iniciar juego
             self.game_state = "playing"
-            self.level_start_time = time.time()
-            self.last_powerup_time = time.time()
+            self.level_start_time = self.sim_time
+            self.last_powerup_time = self.sim_time
+            self.enemy_generator.reset(self.sim_time)
             
             self.logger.log_event(f"Partida cargada desde slot {slot_num}", "game_loop")
         else:
@@ -645,19 +1091,28 @@ class GameLoop:
     
     def _toggle_debug_mode(self) -> None:
         """Alterna el modo debug."""
-        if not hasattr(self, 'debug_mode'):
-            self.debug_mode = False
-        
-        self.debug_mode = not self.debug_mode
+        self._set_debug_mode(not self.debug_mode)
         self.logger.log_event(f"Modo debug: {self.debug_mode}", "game_loop")
     
+    def _set_debug_mode(self, enabled: bool) -> None:
+        """Activa o desactiva el overlay de depuración."""
+        self.debug_mode = enabled
+        if self.dirty_renderer is not None:
+            # Al ocultar el overlay hay que redibujar la zona que cubría
+            self.dirty_renderer.invalidate()
+    
     def cleanup(self) -> None:
         """Limpia los recursos del juego."""
         self.logger.log_event("Limpiando recursos del juego", "game_loop")
         # Limpiar managers
         self.text_renderer.clear_cache()
+        if self.input_recorder is not None:
+            self.input_recorder.save()
         # Limpiar entidades
-        self.enemies.clear()
-        self.projectiles.clear()
+        self._clear_enemies()
+        self._clear_projectiles()
         self.powerups.clear()
-        self.logger.log_event("Recursos limpiados", "game_loop") 
\ No newline at end of file
+        self.logger.log_event("Recursos limpiados", "game_loop")
+        # En modo asíncrono, esperar a que el hilo de logging escriba lo pendiente
+        self.logger.flush()
+        flush_traces() 
\ No newline at end of file
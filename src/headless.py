@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Modo sin ventana para PyGame Shooter
+Autor: Kava
+Fecha: 2024-12-19
+Descripción: Ejecuta el GameLoop con los drivers dummy de SDL, sin menús, empezando con un
+personaje y nivel dados y avanzando la simulación tan rápido como sea posible (con render
+opcional). Pensado para benchmarks, pruebas de resistencia y profiling en máquinas sin pantalla.
+
+Uso:
+    python src/headless.py --character Kava --level 1 --steps 3600 --render
+    python src/headless.py --autofire --seed 1 --record replays/partida.json.gz
+    python src/headless.py --replay replays/partida.json.gz --render
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+# Los drivers dummy deben fijarse antes de inicializar pygame
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, SIMULATION_DT, CHARACTER_STATS
+from game_loop_improved import GameLoop
+from utils.advanced_logger import setup_logging
+from utils.input_replay import InputRecorder, InputReplayer, ReplayKeys
+from utils import trace
+
+
+def parse_args(argv=None):
+    """Parsea los argumentos de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Ejecuta PyGame Shooter sin ventana")
+    parser.add_argument("--character", default="Kava", choices=sorted(CHARACTER_STATS),
+                        help="Personaje con el que jugar")
+    parser.add_argument("--level", type=int, default=1, help="Nivel inicial")
+    parser.add_argument("--steps", type=int, default=3600,
+                        help="Pasos de simulación a ejecutar (60 por segundo de juego)")
+    parser.add_argument("--render", action="store_true", help="Renderizar un frame tras cada paso")
+    parser.add_argument("--autofire", action="store_true",
+                        help="Disparar automáticamente al primer enemigo en pantalla")
+    parser.add_argument("--seed", type=int, default=None, help="Semilla aleatoria para partidas reproducibles")
+    parser.add_argument("--record", default=None, help="Grabar la entrada de la partida en este fichero")
+    parser.add_argument("--replay", default=None,
+                        help="Reproducir un fichero grabado (ignora --character, --level, --steps y --seed)")
+    parser.add_argument("--trace", default=None,
+                        help="Canales de traza a activar, separados por comas, o 'all' (por defecto PYGAME_TRACE)")
+    parser.add_argument("--trace-file", default=None, help="Escribir las trazas en este archivo en lugar de stdout")
+    return parser.parse_args(argv)
+
+
+def autofire(game):
+    """
+    Retorna el clic que apunta al centro del primer enemigo (o hacia arriba si no hay
+    enemigos). Se entrega como evento para que quede grabado con --record.
+    """
+    if game.enemies:
+        enemy = game.enemies[0]
+        pos = (int(enemy.x + enemy.size // 2), int(enemy.y + enemy.size // 2))
+    else:
+        pos = (SCREEN_WIDTH // 2, 0)
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)
+
+
+def run_headless(character="Kava", level=1, steps=3600, render=False, fire=False, seed=None, logger=None,
+                 record=None, replay=None):
+    """
+    Ejecuta una partida sin ventana y retorna las estadísticas de la ejecución.
+
+    Entre pasos no se lee la cola de eventos ni se espera al reloj: la simulación avanza
+    tan rápido como permite la máquina. Al terminar un nivel se continúa al siguiente;
+    la ejecución se detiene antes de tiempo si la partida termina.
+
+    Args:
+        record: Fichero donde grabar la entrada de la partida (opcional)
+        replay: Fichero grabado a reproducir; fija personaje, nivel, semilla y pasos
+    """
+    logger = logger or setup_logging("PyGame", "logs")
+    replayer = None
+    if replay is not None:
+        replayer = InputReplayer(replay)
+        character, level, steps, fire = replayer.character, replayer.level, len(replayer), False
+    elif seed is not None:
+        random.seed(seed)
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    game = GameLoop(screen, logger)
+    game.menus_enabled = False
+    game.input_replayer = replayer
+    if record is not None:
+        game.input_recorder = InputRecorder(record, seed, logger)
+    game.start_game(character, level)
+
+    step_time = 0.0
+    render_time = 0.0
+    steps_done = 0
+    start = time.perf_counter()
+    for step in range(steps):
+        if game.game_state == "menu":
+            # Fin de nivel: saltar el menú de mejoras
+            game._continue_game()
+        if game.game_state != "playing":
+            break
+        if replayer is not None:
+            keys, events = replayer.frame(step)
+        else:
+            # Sin teclado: el jugador no se mueve y solo dispara con --autofire
+            keys, events = ReplayKeys(), ([autofire(game)] if fire else [])
+        game._handle_events(events)
+
+        step_start = time.perf_counter()
+        game._step(keys)
+        step_end = time.perf_counter()
+        step_time += step_end - step_start
+        steps_done += 1
+
+        if render and game.game_state == "playing":
+            game._render()
+            render_time += time.perf_counter() - step_end
+    wall_time = time.perf_counter() - start
+
+    stats = {
+        "character": character,
+        "replay": replay,
+        "steps": steps_done,
+        "sim_seconds": steps_done * SIMULATION_DT,
+        "wall_seconds": wall_time,
+        "steps_per_second": steps_done / wall_time if wall_time > 0 else 0.0,
+        "step_ms": step_time / steps_done * 1000 if steps_done else 0.0,
+        "render_ms": render_time / steps_done * 1000 if render and steps_done else 0.0,
+        "score": game.score,
+        "level": game.level,
+        "enemies": len(game.enemies),
+        "projectiles": len(game.projectiles),
+        "state": game.game_state
+    }
+    logger.log_event(f"Ejecución sin ventana terminada: {stats}", "headless")
+
+    game.cleanup()
+    pygame.quit()
+    return stats
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.trace is not None or args.trace_file is not None:
+        trace.configure(args.trace, args.trace_file)
+    stats = run_headless(args.character, args.level, args.steps, args.render, args.autofire, args.seed,
+                         record=args.record, replay=args.replay)
+
+    print("=== EJECUCIÓN SIN VENTANA ===")
+    print(f"   Personaje: {stats['character']}  Nivel final: {stats['level']}  Estado: {stats['state']}")
+    print(f"   Pasos: {stats['steps']} ({stats['sim_seconds']:.1f} s de juego) en {stats['wall_seconds']:.2f} s reales")
+    print(f"   Velocidad: {stats['steps_per_second']:.0f} pasos/s  ({stats['step_ms']:.3f} ms/paso)")
+    if args.render:
+        print(f"   Render: {stats['render_ms']:.3f} ms/frame")
+    print(f"   Puntuación: {stats['score']}  Enemigos: {stats['enemies']}  Proyectiles: {stats['projectiles']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,17 +5,43 @@ Autor: Kava
 Fecha: 2024-12-19
 Descripción: Inicializa el sistema, configura logging y ejecuta el bucle principal del juego.
 """
+import argparse
 import pygame
 import sys
 import os
 sys.path.insert(0, os.path.dirname(__file__))
-from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, RENDER_MODE
 from game_loop_improved import GameLoop
 from utils.advanced_logger import setup_logging
+from utils.input_replay import InputRecorder
+from utils.flight_recorder import FlightRecorder
+from utils import trace
 
-def main():
+def parse_args(argv=None):
+	"""Parsea los argumentos de línea de comandos."""
+	parser = argparse.ArgumentParser(description="PyGame Shooter")
+	parser.add_argument("--record", default=None,
+						help="Grabar la entrada de la partida en este fichero (reproducir con headless.py --replay)")
+	parser.add_argument("--log-queue", default=None, choices=["off", "drop", "block", "sample"],
+						help="Escribir los logs desde un hilo en segundo plano con esta política de cola llena "
+							 "(por defecto PYGAME_LOG_ASYNC, o 'off' = síncrono; 'drop' y 'sample' pueden descartar registros)")
+	parser.add_argument("--log-disk-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+						help="Nivel mínimo que se escribe en los archivos de log; lo inferior solo queda en el grabador de vuelo (volcado con F12 o ante un error)")
+	parser.add_argument("--render-mode", default=RENDER_MODE, choices=["full", "dirty", "sprites"],
+						help="'dirty' redibuja y actualiza solo las zonas de pantalla que cambian (máquinas lentas); 'sprites' lo hace con un grupo pygame.sprite.LayeredDirty")
+	parser.add_argument("--trace", default=None,
+						help="Canales de traza a activar, separados por comas, o 'all' (por defecto PYGAME_TRACE): " + ", ".join(trace.TRACE_CHANNELS))
+	parser.add_argument("--trace-file", default=None, help="Escribir las trazas en este archivo en lugar de stdout")
+	return parser.parse_args(argv)
+
+def main(argv=None):
+	args = parse_args(argv)
+	if args.trace is not None or args.trace_file is not None:
+		trace.configure(args.trace, args.trace_file)
 	# Configurar el sistema de logging avanzado
-	logger = setup_logging("PyGame", "logs")
+	logger = setup_logging("PyGame", "logs", async_mode=args.log_queue)
+	flight_recorder = FlightRecorder("logs")
+	logger.attach_flight_recorder(flight_recorder, args.log_disk_level)
 	
 	# Inicialización de Pygame
 	pygame.init()
@@ -27,12 +53,23 @@ def main():
 
 	# Crear y ejecutar el nuevo bucle de juego mejorado
 	juego = GameLoop(screen, logger)
-	juego.run()
+	juego.flight_recorder = flight_recorder
+	juego.set_render_mode(args.render_mode)
+	if args.record:
+		juego.input_recorder = InputRecorder(args.record, logger=logger)
+	try:
+		juego.run()
+	except Exception:
+		logger.log_critical("Excepción no controlada en el bucle principal", "main")
+		juego.dump_flight_recorder("excepción no controlada", sys.exc_info())
+		logger.close()
+		raise
 
 	# Al salir, limpiar recursos
 	juego.cleanup()
 	pygame.quit()
 	logger.log_event("Aplicación terminada", "main")
+	logger.close()
 	sys.exit()
 
 if __name__ == "__main__":
@@ -6,32 +6,82 @@ Fecha: 2024-12-19
 Descripción: Lógica de generación dinámica de enemigos según el progreso y puntuación del jugador.
 """
 import random
-import time
 from entities.enemy import Enemy # Importar la clase Enemy genérica
 from constants import *
 from utils.advanced_logger import get_logger
 
 class EnemyGenerator:
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, max_pool_size=64):
         self.logger = logger or get_logger("PyGame")
-        self.start_time = time.time()
         self.base_enemy_count = 4
-        self.last_spawn_time = time.time()
+        self.max_score_doublings = 16
+        self.reset(0.0)
         self.spawn_interval = 2  # Generar enemigos cada 2 segundos
-        self.logger.log_event("EnemyGenerator inicializado", "enemy_gen")
 
-    def generate_enemies(self, score):
-        """Genera enemigos basados en la puntuación y el tiempo transcurrido."""
-        new_enemies = []
-        elapsed_time = time.time() - self.start_time
-        time_based_extra = (elapsed_time // 60) * 2  # Añadir 2 enemigos extra cada minuto
-        score_based_multiplier = 2 ** (score // 5)  # Duplicar cada 5 puntos
-        max_enemies_to_spawn = self.base_enemy_count * score_based_multiplier + time_based_extra
+        # Pool de enemigos reutilizables (muertos o fuera de pantalla)
+        self.max_pool_size = max_pool_size
+        self.enemy_pool = []
+        self.pool_hits = 0
+        self.pool_misses = 0
+
+        self.logger.log_event(f"EnemyGenerator inicializado (pool máximo: {max_pool_size})", "enemy_gen")
+
+    def reset(self, now):
+        """Reinicia los temporizadores de generación al empezar una partida (now: reloj de simulación)."""
+        self.start_time = now
+        self.last_spawn_time = now
+
+    def acquire_enemy(self, x, y, enemy_type, rarity="NORMAL", now=0.0):
+        """Obtiene un enemigo del pool (reinicializado) o crea uno nuevo si está vacío."""
+        if self.enemy_pool:
+            enemy = self.enemy_pool.pop()
+            enemy.reset(x, y, enemy_type, rarity, now)
+            self.pool_hits += 1
+        else:
+            enemy = Enemy(x, y, enemy_type=enemy_type, rarity=rarity, logger=self.logger, now=now)
+            self.pool_misses += 1
+        return enemy
+
+    def release_enemy(self, enemy):
+        """Devuelve un enemigo al pool. Si el pool está lleno se descarta."""
+        if len(self.enemy_pool) < self.max_pool_size:
+            self.enemy_pool.append(enemy)
 
-        self.logger.log_debug(f"Generando enemigos: score={score}, max_enemies_to_spawn={max_enemies_to_spawn}", "enemy_gen")
+    def release_enemies(self, enemies):
+        """Devuelve una lista de enemigos al pool."""
+        for enemy in enemies:
+            self.release_enemy(enemy)
+
+    def get_pool_stats(self):
+        """Retorna las estadísticas del pool de enemigos."""
+        return {
+            'pooled': len(self.enemy_pool),
+            'max_pool_size': self.max_pool_size,
+            'hits': self.pool_hits,
+            'misses': self.pool_misses
+        }
+
+    def generate_enemies(self, score, now):
+        """
+        Genera enemigos basados en la puntuación y el tiempo transcurrido.
+
+        Args:
+            score: Puntuación actual
+            now: Reloj de simulación del paso actual (segundos)
+        """
+        new_enemies = []
+        # Se llama en cada paso: el cálculo solo alimenta el log de debug
+        if self.logger.debug_enabled:
+            elapsed_time = now - self.start_time
+            time_based_extra = (elapsed_time // 60) * 2  # Añadir 2 enemigos extra cada minuto
+            # Duplicar cada 5 puntos, con tope: sin él 2 ** (score // 5) desborda al sumar el float
+            # de time_based_extra a partir de ~5100 puntos
+            score_based_multiplier = 2 ** min(score // 5, self.max_score_doublings)
+            max_enemies_to_spawn = self.base_enemy_count * score_based_multiplier + time_based_extra
+            self.logger.log_debug("Generando enemigos: score=%s, max_enemies_to_spawn=%s", "enemy_gen", score, max_enemies_to_spawn)
 
         # Generar enemigos periódicamente
-        if time.time() - self.last_spawn_time >= self.spawn_interval:
+        if now - self.last_spawn_time >= self.spawn_interval:
             # Seleccionar tipo de enemigo aleatoriamente
             enemy_type_name = random.choice(["ZOMBIE_MALE", "ZOMBIE_GIRL"])
             
@@ -39,9 +89,10 @@ class EnemyGenerator:
             rarity_choices = [rarity for rarity, prob in RARITY_PROBABILITIES.items() for _ in range(int(prob * 100))]
             enemy_rarity = random.choice(rarity_choices)
 
-            enemy = Enemy(random.randint(0, SCREEN_WIDTH - ENEMY_SIZE), 0, enemy_type=enemy_type_name, rarity=enemy_rarity, logger=self.logger)
+            enemy = self.acquire_enemy(random.randint(0, SCREEN_WIDTH - ENEMY_SIZE), 0, enemy_type_name, enemy_rarity, now)
             new_enemies.append(enemy)
-            self.logger.log_debug(f"Enemigo generado: Tipo={enemy_type_name}, Rareza={enemy_rarity}, Posición=({enemy.x}, {enemy.y})", "enemy_gen")
-            self.last_spawn_time = time.time()
+            self.logger.log_debug("Enemigo generado: Tipo=%s, Rareza=%s, Posición=(%s, %s)", "enemy_gen",
+                                  enemy_type_name, enemy_rarity, enemy.x, enemy.y)
+            self.last_spawn_time = now
 
         return new_enemies
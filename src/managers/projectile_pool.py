@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Pool de proyectiles para PyGame Shooter
+Autor: Kava
+Fecha: 2024-12-19
+Descripción: Reutiliza proyectiles por tipo de ataque (constants.ATTACK_TYPES) para que
+disparar no cree objetos ni cargue imágenes en cada disparo.
+"""
+from entities.projectile import Projectile
+from constants import ATTACK_TYPES
+from utils.advanced_logger import get_logger
+
+
+class ProjectilePool:
+    def __init__(self, logger=None, max_pool_size=128):
+        """
+        Inicializa el pool de proyectiles.
+
+        Args:
+            logger: Instancia del logger para debug (opcional, usa AdvancedLogger por defecto)
+            max_pool_size: Proyectiles libres que se conservan como máximo por tipo de ataque
+        """
+        self.logger = logger or get_logger("PyGame")
+        self.max_pool_size = max_pool_size
+        self.pools = {attack_type: [] for attack_type in ATTACK_TYPES}
+        self.pool_hits = 0
+        self.pool_misses = 0
+
+        self.logger.log_event(f"ProjectilePool inicializado (pool máximo por tipo: {max_pool_size})", "projectile_pool")
+
+    def preload_sprites(self):
+        """Carga y escala el sprite de cada tipo de ataque (requiere modo de vídeo)."""
+        for attack_props in ATTACK_TYPES.values():
+            Projectile.get_sprite(attack_props["image"], attack_props["projectile_size"], self.logger)
+
+    def acquire(self, attack_type, x, y, target_x, target_y, speed=None):
+        """
+        Obtiene un proyectil del tipo de ataque indicado, reinicializado hacia el objetivo.
+
+        Args:
+            attack_type: Clave de ATTACK_TYPES
+            x, y: Posición inicial
+            target_x, target_y: Punto hacia el que se dispara
+            speed: Velocidad del proyectil (por defecto la del tipo de ataque)
+
+        Returns:
+            Proyectil listo para añadir a la lista de proyectiles activos
+        """
+        attack_props = ATTACK_TYPES[attack_type]
+        if speed is None:
+            speed = attack_props["projectile_speed"]
+        pool = self.pools.setdefault(attack_type, [])
+        if pool:
+            projectile = pool.pop()
+            projectile.reset(x, y, target_x, target_y, size=attack_props["projectile_size"], speed=speed,
+                             image_path=attack_props["image"], piercing=attack_props["piercing"],
+                             damage=attack_props["damage"])
+            self.pool_hits += 1
+        else:
+            projectile = Projectile(x, y, target_x, target_y, size=attack_props["projectile_size"], speed=speed,
+                                    image_path=attack_props["image"], piercing=attack_props["piercing"],
+                                    damage=attack_props["damage"], logger=self.logger)
+            projectile.attack_type = attack_type
+            self.pool_misses += 1
+        return projectile
+
+    def release(self, projectile):
+        """Devuelve un proyectil al pool de su tipo. Los que no vienen del pool se descartan."""
+        pool = self.pools.get(projectile.attack_type)
+        if pool is not None and len(pool) < self.max_pool_size:
+            pool.append(projectile)
+
+    def release_all(self, projectiles):
+        """Devuelve una lista de proyectiles al pool."""
+        for projectile in projectiles:
+            self.release(projectile)
+
+    def get_pool_stats(self):
+        """Retorna las estadísticas del pool de proyectiles."""
+        return {
+            'pooled': {attack_type: len(pool) for attack_type, pool in self.pools.items()},
+            'max_pool_size': self.max_pool_size,
+            'hits': self.pool_hits,
+            'misses': self.pool_misses
+        }
@@ -8,6 +8,9 @@ Descripción: Sistema de guardado/carga de partidas con soporte para múltiples
 import json
 import os
 from utils.advanced_logger import get_logger
+from utils.trace import get_channel
+
+_trace_save = get_channel("save")
 
 class SaveManager:
     def __init__(self, logger=None):
@@ -20,7 +23,7 @@ class SaveManager:
         return os.path.join(self.save_dir, f"save_slot_{slot}.json")
 
     def save_game(self, slot, game_state):
-        print(f"[DEBUG] Guardando partida en slot {slot}: {game_state}")
+        _trace_save("Guardando partida en slot %s: %s", slot, game_state)
         path = self._get_save_path(slot)
         try:
             with open(path, "w") as f:
@@ -32,7 +35,7 @@ class SaveManager:
             return False
 
     def load_game(self, slot):
-        print(f"[DEBUG] Cargando partida desde slot {slot}")
+        _trace_save("Cargando partida desde slot %s", slot)
         path = self._get_save_path(slot)
         if not os.path.exists(path):
             self.logger.log_warning(f"No hay datos guardados en el slot {slot}", "save")
@@ -10,25 +10,34 @@ import os
 from utils.advanced_logger import get_logger
 
 class SoundManager:
-    def __init__(self, logger=None):
+    # Sonidos del juego: nombre -> ruta (la música se reproduce en streaming, no se decodifica)
+    SOUND_FILES = {
+        'shoot': 'assets/sounds/shoot.wav',
+        'explosion': 'assets/sounds/explosion.wav',
+        'background_music': 'assets/sounds/background_music.mp3'
+    }
+    MUSIC_NAMES = ('background_music',)
+
+    def __init__(self, logger=None, load_sounds=True):
         self.logger = logger or get_logger("PyGame")
         self.sounds = {}
         self.music_volume = 0.5
         self.sfx_volume = 0.7
-        self._load_sounds()
+        # Con load_sounds=False los efectos los carga un AssetPreloader en segundo plano
+        if load_sounds:
+            self._load_sounds()
+    
+    def register_sound(self, sound_name, sound):
+        """Registra un sonido ya cargado (Sound) o la ruta de una música."""
+        self.sounds[sound_name] = sound
+        self.logger.log_debug(f"Sonido registrado: {sound_name}", "sound")
     
     def _load_sounds(self):
         """Carga todos los sonidos del juego."""
-        sound_files = {
-            'shoot': 'assets/sounds/shoot.wav',
-            'explosion': 'assets/sounds/explosion.wav',
-            'background_music': 'assets/sounds/background_music.mp3'
-        }
-        
-        for sound_name, sound_path in sound_files.items():
+        for sound_name, sound_path in self.SOUND_FILES.items():
             try:
                 if os.path.exists(sound_path):
-                    if sound_name == 'background_music':
+                    if sound_name in self.MUSIC_NAMES:
                         # La música se carga de forma diferente
                         self.sounds[sound_name] = sound_path
                     else:
@@ -47,7 +56,7 @@ class SoundManager:
                 if isinstance(sound, pygame.mixer.Sound):
                     sound.set_volume(self.sfx_volume)
                     sound.play()
-                    self.logger.log_debug(f"Reproduciendo sonido: {sound_name}", "sound")
+                    self.logger.log_debug("Reproduciendo sonido: %s", "sound", sound_name)
                 else:
                     self.logger.log_warning(f"'{sound_name}' no es un efecto de sonido válido", "sound")
             else:
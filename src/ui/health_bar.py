@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Barras de vida de enemigos para PyGame Shooter
+Autor: Kava
+Fecha: 2024-12-19
+Descripción: Renderer compartido de barras de vida. La base (fondo gris + marco) se compone una
+vez y las tiras de vida de cada rareza se construyen una vez por ancho posible (0..BAR_WIDTH),
+así dibujar la barra de un enemigo son dos blits sin crear superficies (o dos entradas en la
+cola de render, ver utils.render_queue). En modo "sprites" cada enemigo lleva un HealthBarSprite.
+"""
+
+from typing import Dict, List, Optional
+
+import pygame
+
+from utils.image_loader import load_cached_image
+from utils.render_queue import LAYER_HEALTH_BARS
+
+BAR_WIDTH = 50
+BAR_HEIGHT = 8
+BAR_OFFSET_Y = -15  # Distancia de la barra sobre el sprite del enemigo
+FRAME_IMAGE = "assets/ui/Health_03.png"
+BAR_IMAGES = {
+    "NORMAL": "assets/ui/Health_03_Bar01.png",
+    "RARE": "assets/ui/Health_03_Bar02.png",
+    "EPIC": "assets/ui/Health_03_Bar03.png",
+    "ELITE": "assets/ui/Health_03_Bar03.png",
+    "LEGENDARY": "assets/ui/Health_03_Bar03.png",
+}
+
+
+class HealthBarRenderer:
+    """Barras de vida precompuestas, compartidas por todos los enemigos."""
+
+    def __init__(self, width: int = BAR_WIDTH, height: int = BAR_HEIGHT):
+        self.width = width
+        self.height = height
+        self._base: Optional[pygame.Surface] = None
+        # Ruta de la imagen de la barra -> tira por ancho en píxeles (None para ancho 0)
+        self._strips: Dict[str, List[Optional[pygame.Surface]]] = {}
+        # Tira -> base con la tira ya encima (para HealthBarSprite)
+        self._composed: Dict[Optional[pygame.Surface], pygame.Surface] = {}
+
+    def _build_base(self) -> pygame.Surface:
+        """Fondo gris redondeado con el marco encima, en una sola superficie."""
+        frame = load_cached_image(FRAME_IMAGE)
+        size = (max(frame.get_width(), self.width), max(frame.get_height(), self.height))
+        base = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(base, (200, 200, 200), (0, 0, self.width, self.height), border_radius=4)
+        base.blit(frame, (0, 0))
+        return base
+
+    def _build_strips(self, path: str) -> List[Optional[pygame.Surface]]:
+        """Una tira por ancho: el trozo de la imagen de la barra sobre negro, con el negro transparente."""
+        image = load_cached_image(path)
+        strips: List[Optional[pygame.Surface]] = [None]
+        for width in range(1, self.width + 1):
+            strip = pygame.Surface((width, self.height))
+            strip.set_colorkey((0, 0, 0))
+            strip.blit(image.subsurface((0, 0, width, self.height)), (0, 0))
+            strips.append(strip)
+        return strips
+
+    def strip(self, rarity: str, ratio: float) -> Optional[pygame.Surface]:
+        """
+        Tira de vida para una rareza y una fracción de vida.
+
+        Args:
+            rarity: Rareza del enemigo (clave de BAR_IMAGES)
+            ratio: Vida actual / vida máxima
+
+        Returns:
+            Superficie compartida (no modificar), o None si la barra está vacía
+        """
+        path = BAR_IMAGES.get(rarity, BAR_IMAGES["NORMAL"])
+        strips = self._strips.get(path)
+        if strips is None:
+            strips = self._strips[path] = self._build_strips(path)
+        return strips[min(self.width, max(0, int(self.width * ratio)))]
+
+    def draw(self, screen: pygame.Surface, x: float, y: float, strip: Optional[pygame.Surface]) -> pygame.Rect:
+        """
+        Dibuja una barra en (x, y).
+
+        Returns:
+            Área de la barra sin recortar a la pantalla
+        """
+        base = self._get_base()
+        screen.blit(base, (x, y))
+        if strip is not None:
+            screen.blit(strip, (x, y))
+        return base.get_rect(topleft=(x, y))
+
+    def enqueue(self, queue, x: float, y: float, strip: Optional[pygame.Surface]) -> pygame.Rect:
+        """
+        Encola una barra en (x, y) en la capa de barras de vida de la cola de render.
+
+        Returns:
+            Área de la barra sin recortar a la pantalla
+        """
+        base = self._get_base()
+        blits = queue.blits[LAYER_HEALTH_BARS]
+        blits.append((base, (x, y)))
+        if strip is not None:
+            blits.append((strip, (x, y)))
+        return base.get_rect(topleft=(x, y))
+
+    def composed(self, strip: Optional[pygame.Surface]) -> pygame.Surface:
+        """Barra completa (base + tira) en una sola superficie compartida, compuesta una vez por tira."""
+        image = self._composed.get(strip)
+        if image is None:
+            image = self._get_base().copy()
+            if strip is not None:
+                image.blit(strip, (0, 0))
+            self._composed[strip] = image
+        return image
+
+    def _get_base(self) -> pygame.Surface:
+        base = self._base
+        if base is None:
+            base = self._base = self._build_base()
+        return base
+
+
+class HealthBarSprite(pygame.sprite.DirtySprite):
+    """Barra de vida de un enemigo como DirtySprite: sigue al enemigo y usa la barra compuesta de su vida actual."""
+
+    _layer = LAYER_HEALTH_BARS
+
+    def __init__(self, enemy):
+        super().__init__()
+        self.enemy = enemy
+        self.dirty = 2  # Se mueve con el enemigo: repintar cada frame
+
+    @property
+    def image(self) -> pygame.Surface:
+        return get_health_bar_renderer().composed(self.enemy.health_bar_strip())
+
+    @property
+    def rect(self) -> pygame.Rect:
+        enemy = self.enemy
+        return self.image.get_rect(topleft=(enemy.x + (enemy.size - BAR_WIDTH) // 2, enemy.y + BAR_OFFSET_Y))
+
+
+_renderer: Optional[HealthBarRenderer] = None
+
+
+def get_health_bar_renderer() -> HealthBarRenderer:
+    """Retorna el renderer de barras de vida compartido por todos los enemigos."""
+    global _renderer
+    if _renderer is None:
+        _renderer = HealthBarRenderer()
+    return _renderer
@@ -1,45 +1,120 @@
 import pygame
 from constants import *
+from utils.image_loader import load_cached_image
+
+# Altura inicial de la capa del HUD (crece si los power-ups activos no caben)
+HUD_LAYER_HEIGHT = 160
+# Textos renderizados que se conservan (puntuaciones, segundos, power-ups...)
+TEXT_CACHE_SIZE = 256
+
 
 class HUD:
+    """
+    HUD de la partida compuesto en una capa cacheada.
+
+    Cada widget (corazones, puntuación, nivel, tiempo y power-ups) guarda el valor que muestra
+    y solo se vuelve a componer en la capa cuando ese valor cambia; en el caso común draw()
+    es un único blit de la capa sobre la pantalla.
+    """
+
     def __init__(self, screen):
         self.screen = screen
         self.font = pygame.font.Font("assets/fonts/arcade.ttf", 36)
         self.powerup_font = pygame.font.Font("assets/fonts/arcade.ttf", 24)
+        self._heart_images = None
+        self._text_cache = {}
+        self._layer = None
+        # nombre -> (valor mostrado, superficie, rect en la capa)
+        self._widgets = {}
+        self._bounds = pygame.Rect(0, 0, 0, 0)
 
     def draw(self, lives, shield_lives, score, current_level, time_remaining, active_powerups):
-        # Dibujar corazones rojos para las vidas (de derecha a izquierda)
+        """Dibuja el HUD (recomponiendo solo los widgets cuyo valor cambió); retorna el área dibujada."""
+        states = (
+            ("hearts", (lives, shield_lives)),
+            ("score", score),
+            ("level", current_level),
+            ("time", int(time_remaining)),
+            ("powerups", tuple((p_type, int(p_time_left)) for p_type, p_time_left in active_powerups.items())),
+        )
+        widgets = self._widgets
+        for name, state in states:
+            widget = widgets.get(name)
+            if widget is None or widget[0] != state:
+                self._update_widget(name, state)
+        return self.screen.blit(self._layer, self._bounds.topleft, self._bounds)
+
+    def _update_widget(self, name, state):
+        """Vuelve a construir un widget y lo recompone en la capa, sin tocar el resto."""
+        surface, pos = getattr(self, f"_build_{name}")(state)
+        rect = surface.get_rect(topleft=pos)
+        if self._layer is None or rect.bottom > self._layer.get_height():
+            self._resize_layer(max(HUD_LAYER_HEIGHT, rect.bottom))
+
+        old = self._widgets.get(name)
+        self._widgets[name] = (state, surface, rect)
+        # Borrar el área vieja y la nueva y volver a pintar en ella, en el orden original,
+        # los widgets que la tocan (texto y tiempo pueden solaparse en pantallas estrechas)
+        area = rect.union(old[2]) if old is not None else rect
+        layer = self._layer
+        layer.set_clip(area)
+        layer.fill((0, 0, 0, 0))
+        for _, widget_surface, widget_rect in self._widgets.values():
+            if widget_rect.colliderect(area):
+                layer.blit(widget_surface, widget_rect)
+        layer.set_clip(None)
+        self._bounds = rect.unionall([widget[2] for widget in self._widgets.values()])
+
+    def _resize_layer(self, height):
+        layer = pygame.Surface((SCREEN_WIDTH, height), pygame.SRCALPHA)
+        if self._layer is not None:
+            layer.blit(self._layer, (0, 0))
+        self._layer = layer
+
+    def _text(self, font, text, color):
+        """Renderiza un texto reutilizando la superficie si ya se renderizó antes."""
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+            surface = self._text_cache[key] = font.render(text, True, color)
+        return surface
+
+    def _build_hearts(self, state):
+        lives, shield_lives = state
+        if self._heart_images is None:
+            self._heart_images = (load_cached_image("assets/ui/Hearts_Red_1.png"),   # Corazón completo
+                                  load_cached_image("assets/ui/Hearts_Red_5.png"),   # Corazón vacío
+                                  load_cached_image("assets/ui/Hearts_Blue_1.png"))  # Escudo
+        full, empty, shield = self._heart_images
+        # Rojos de izquierda a derecha (el de más a la derecha se vacía primero) y después los azules
         total_hearts = 3
-        heart_x_offset = 10
-        heart_images = []
-        for i in range(total_hearts):
-            if i < lives:
-                heart_images.append(pygame.image.load("assets/ui/Hearts_Red_1.png")) # Corazón completo
-            else:
-                heart_images.append(pygame.image.load("assets/ui/Hearts_Red_5.png")) # Corazón vacío
-        # Mostrar corazones de izquierda a derecha (el de más a la derecha se vacía primero)
-        for img in heart_images:
-            self.screen.blit(img, (heart_x_offset, 10))
-            heart_x_offset += img.get_width() + 5
-
-        # Dibujar corazones azules para el escudo (aparecen a la derecha de los rojos)
-        for i in range(shield_lives):
-            shield_image = pygame.image.load("assets/ui/Hearts_Blue_1.png")
-            self.screen.blit(shield_image, (heart_x_offset, 10))
-            heart_x_offset += shield_image.get_width() + 5
-
-        # Dibujar otros elementos del HUD
-        score_text = self.font.render(f'Puntuación: {score}', True, GREEN)
-        level_text = self.font.render(f'Nivel: {current_level}', True, BLUE)
-        time_text = self.font.render(f'Tiempo: {int(time_remaining)}', True, CYAN)
-
-        self.screen.blit(score_text, (10, 50))
-        self.screen.blit(level_text, (SCREEN_WIDTH - level_text.get_width() - 10, 10))
-        self.screen.blit(time_text, (SCREEN_WIDTH - time_text.get_width() - 10, 50))
-
-        # Dibujar power-ups activos
-        powerup_y_offset = 90
-        for p_type, p_time_left in active_powerups.items():
-            powerup_text = self.powerup_font.render(f'{p_type}: {int(p_time_left)}s', True, YELLOW)
-            self.screen.blit(powerup_text, (10, powerup_y_offset))
-            powerup_y_offset += 30
+        images = [full if i < lives else empty for i in range(total_hearts)] + [shield] * shield_lives
+        width = sum(img.get_width() + 5 for img in images) - 5
+        height = max(img.get_height() for img in images)
+        surface = pygame.Surface((max(1, width), height), pygame.SRCALPHA)
+        x = 0
+        for img in images:
+            surface.blit(img, (x, 0))
+            x += img.get_width() + 5
+        return surface, (10, 10)
+
+    def _build_score(self, score):
+        return self._text(self.font, f'Puntuación: {score}', GREEN), (10, 50)
+
+    def _build_level(self, current_level):
+        surface = self._text(self.font, f'Nivel: {current_level}', BLUE)
+        return surface, (SCREEN_WIDTH - surface.get_width() - 10, 10)
+
+    def _build_time(self, seconds):
+        surface = self._text(self.font, f'Tiempo: {seconds}', CYAN)
+        return surface, (SCREEN_WIDTH - surface.get_width() - 10, 50)
+
+    def _build_powerups(self, powerups):
+        lines = [self._text(self.powerup_font, f'{p_type}: {seconds}s', YELLOW) for p_type, seconds in powerups]
+        width = max((line.get_width() for line in lines), default=1)
+        surface = pygame.Surface((width, max(1, 30 * len(lines))), pygame.SRCALPHA)
+        for i, line in enumerate(lines):
+            surface.blit(line, (0, i * 30))
+        return surface, (10, 90)
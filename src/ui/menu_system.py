@@ -17,13 +17,17 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 try:
     from utils.advanced_logger import get_logger
+    from utils.trace import get_channel
     from constants import SCREEN_WIDTH, SCREEN_HEIGHT
 except ImportError:
     # Fallback para cuando se ejecuta desde tools/
     sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
     from utils.advanced_logger import get_logger
+    from utils.trace import get_channel
     from constants import SCREEN_WIDTH, SCREEN_HEIGHT
 
+_trace_menu = get_channel("menu")
+
 
 class MenuSystem:
     """
@@ -96,7 +100,7 @@ class MenuSystem:
     
     def create_character_selection_menu(self) -> pygame_menu.Menu:
         """Crea el menú de selección de personajes."""
-        print("[DEBUG] Creando menú de selección de personajes...")
+        _trace_menu("Creando menú de selección de personajes...")
         menu = pygame_menu.Menu(
             title='Seleccionar Personaje',
             width=SCREEN_WIDTH,
@@ -113,7 +117,7 @@ class MenuSystem:
         }
         
         for character_name, description in characters.items():
-            print(f"[DEBUG] Añadiendo personaje: {character_name} - {description}")
+            _trace_menu("Añadiendo personaje: %s - %s", character_name, description)
             frame = menu.add.frame_h(600, 100, background_color=(50, 50, 50, 150))
             frame._relax = True  # Permitir widgets más grandes que el frame
             frame.pack(menu.add.label(character_name, font_size=20))
@@ -122,7 +126,7 @@ class MenuSystem:
                                      self._callback_wrapper('select_character', character_name)))
         menu.add.button('Volver', self._callback_wrapper('back_to_main'))
         self.logger.log_event("Menú de selección de personajes creado", "menu")
-        print("[DEBUG] Menú de selección de personajes creado y retornado.")
+        _trace_menu("Menú de selección de personajes creado y retornado.")
         return menu
     
     def create_pause_menu(self) -> pygame_menu.Menu:
@@ -310,10 +314,10 @@ class MenuSystem:
     
     def show_character_selection(self) -> None:
         """Muestra el menú de selección de personajes."""
-        print("[DEBUG] show_character_selection() llamado")
+        _trace_menu("show_character_selection() llamado")
         menu = self.create_character_selection_menu()
         self.show_menu(menu)
-        print(f"[DEBUG] current_menu asignado: {self.current_menu}")
+        _trace_menu("current_menu asignado: %s", self.current_menu)
     
     def show_pause_menu(self) -> None:
         """Muestra el menú de pausa."""
@@ -8,6 +8,7 @@
 import pygame
 from constants import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLACK, FONT_SIZE, FONT_COLOR, BUTTON_COLOR, HOVER_COLOR
 from utils.image_loader import load_image
+from utils.background import load_background
 import os
 
 class BaseMenu:
@@ -24,14 +25,9 @@ class BaseMenu:
         self.buttons = []
         self.selected_option_index = 0
 
-        self.background_image = None
-        if background_image_path:
-            self.background_image = load_image(background_image_path)
-            self.background_image = pygame.transform.scale(self.background_image, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        else:
-            # Fondo por defecto espectacular
-            self.background_image = load_image("assets/images/fondos/game_background_1_dark.png")
-            self.background_image = pygame.transform.scale(self.background_image, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Fondo escalado y convertido una sola vez por proceso (compartido entre menús)
+        self.background_image = load_background(background_image_path or "assets/images/fondos/game_background_1_dark.png",
+                                                logger=logger)
 
         self.button_images = {
             'normal': None,
@@ -82,10 +78,13 @@ class BaseMenu:
         # Animación de entrada (fade in)
         if self.menu_alpha < 255:
             self.menu_alpha += 10
-        temp_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        temp_surface.blit(self.background_image, (0, 0))
-        temp_surface.set_alpha(self.menu_alpha)
-        self.screen.blit(temp_surface, (0, 0))
+        if self.menu_alpha >= 255:
+            self.screen.blit(self.background_image, (0, 0))
+        else:
+            temp_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            temp_surface.blit(self.background_image, (0, 0))
+            temp_surface.set_alpha(self.menu_alpha)
+            self.screen.blit(temp_surface, (0, 0))
 
         self.screen.blit(self.title_text_surface, self.title_rect)
 
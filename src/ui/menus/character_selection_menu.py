@@ -8,7 +8,7 @@
 import pygame
 from ui.menus.base_menu import BaseMenu
 from constants import SCREEN_WIDTH, SCREEN_HEIGHT, CHARACTER_STATS, PLAYER_SIZE, WHITE, YELLOW, RED, FONT_SIZE, BLACK
-from utils.image_loader import load_animation_frames
+from utils.image_loader import load_scaled_animation_frames
 
 class CharacterSelectionMenu(BaseMenu):
     def __init__(self, screen, logger):
@@ -21,10 +21,9 @@ class CharacterSelectionMenu(BaseMenu):
         for char_name, stats in CHARACTER_STATS.items():
             image_folder = stats["image_folder"]
             try:
-                idle_frames = load_animation_frames(image_folder, "Idle", stats["idle_frames"])
+                idle_frames = load_scaled_animation_frames(image_folder, "Idle", stats["idle_frames"], PLAYER_SIZE * 2)
                 if idle_frames:
-                    image = idle_frames[0]
-                    self.character_images[char_name] = pygame.transform.scale(image, (PLAYER_SIZE * 2, PLAYER_SIZE * 2))
+                    self.character_images[char_name] = idle_frames[0]
                 else:
                     self.logger.log_error(f"No se encontraron frames para la animación Idle de {char_name}")
                     self.character_images[char_name] = pygame.Surface((PLAYER_SIZE * 2, PLAYER_SIZE * 2))
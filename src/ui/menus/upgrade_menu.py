@@ -1,6 +1,6 @@
 import pygame
 from constants import UPGRADES, SCREEN_WIDTH, SCREEN_HEIGHT, BLACK
-from utils.image_loader import load_image
+from utils.background import load_background
 from ui.menus.base_menu import BaseMenu
 
 class UpgradeMenu(BaseMenu):
@@ -27,8 +27,7 @@ class UpgradeMenu(BaseMenu):
                              'hover': "assets/images/ui/Buttons/Blue/Blank 2.png"
                          })
 
-        self.background_image = load_image("assets/images/fondos/parque.jpg")
-        self.background_image = pygame.transform.scale(self.background_image, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.background_image = load_background("assets/images/fondos/parque.jpg", logger=logger)
 
         self.message = "" # Mensaje para el jugador
         self.message_timer = 0 # Temporizador para el mensaje
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Overlay del profiler de frames para PyGame Shooter
+Autor: Kava
+Fecha: 2024-12-19
+Descripción: Panel de depuración (F1) con la media y el máximo móviles de cada fase del
+FrameProfiler y una gráfica del tiempo de los últimos frames frente al presupuesto de 60 FPS.
+"""
+
+from typing import Dict, Optional
+
+import pygame
+
+from constants import FPS, WHITE, YELLOW, GREEN, RED
+from utils.frame_profiler import FrameProfiler
+
+PANEL_WIDTH = 300
+LINE_HEIGHT = 16
+GRAPH_HEIGHT = 80
+TABLE_COLUMNS = (190, 280)  # Borde derecho de las columnas de media y máximo
+# El texto se regenera cada pocos frames: renderizar fuentes cada frame costaría más que lo medido
+TEXT_REFRESH_FRAMES = 15
+
+
+class ProfilerOverlay:
+    """Dibuja el estado de un FrameProfiler sobre la pantalla."""
+
+    def __init__(self, profiler: FrameProfiler, position=(10, 130)):
+        """
+        Inicializa el overlay.
+
+        Args:
+            profiler: Profiler cuyos buffers se muestran
+            position: Esquina superior izquierda del panel
+        """
+        self.profiler = profiler
+        self.position = position
+        self.font: Optional[pygame.font.Font] = None
+        self.budget_ms = 1000.0 / FPS
+        self._text_surface: Optional[pygame.Surface] = None
+        self._frames_since_refresh = TEXT_REFRESH_FRAMES
+
+    def _render_text(self, info: Dict[str, object]) -> pygame.Surface:
+        """Compone el texto del panel (información de partida y tabla de fases)."""
+        if self.font is None:
+            self.font = pygame.font.Font(None, 20)
+        averages = self.profiler.averages()
+        maxima = self.profiler.maxima()
+        # Cada línea: (texto, color) o, en la tabla de fases, ((fase, media, máximo), color)
+        lines = [(f"FPS {self.profiler.fps:.1f}   frame {averages['frame']:.2f} ms   máx {maxima['frame']:.2f} ms", YELLOW)]
+        lines += [(f"{key}: {value}", WHITE) for key, value in info.items()]
+        lines.append((("fase", "media ms", "máx ms"), YELLOW))
+        for phase in self.profiler.phases:
+            color = RED if maxima[phase] > self.budget_ms else WHITE
+            lines.append(((phase, f"{averages[phase]:.2f}", f"{maxima[phase]:.2f}"), color))
+
+        surface = pygame.Surface((PANEL_WIDTH, len(lines) * LINE_HEIGHT + 8), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 170))
+        for i, (text, color) in enumerate(lines):
+            y = 4 + i * LINE_HEIGHT
+            if isinstance(text, str):
+                surface.blit(self.font.render(text, True, color), (6, y))
+                continue
+            # Columnas numéricas alineadas a la derecha (la fuente no es monoespaciada)
+            name, average, maximum = text
+            surface.blit(self.font.render(name, True, color), (6, y))
+            for value, right in ((average, TABLE_COLUMNS[0]), (maximum, TABLE_COLUMNS[1])):
+                value_surface = self.font.render(value, True, color)
+                surface.blit(value_surface, (right - value_surface.get_width(), y))
+        return surface
+
+    def _draw_graph(self, screen: pygame.Surface, top: int) -> None:
+        """Dibuja el tiempo de los últimos frames; la línea verde es el presupuesto de 1/FPS."""
+        x, _ = self.position
+        rect = pygame.Rect(x, top, PANEL_WIDTH, GRAPH_HEIGHT)
+        background = pygame.Surface(rect.size, pygame.SRCALPHA)
+        background.fill((0, 0, 0, 170))
+        screen.blit(background, rect.topleft)
+
+        # Escala: el doble del presupuesto o el peor frame visible, lo que sea mayor
+        times = self.profiler.frame_times()
+        scale = max(2 * self.budget_ms, float(times.max()) if len(times) else 0.0)
+        budget_y = rect.bottom - int(self.budget_ms / scale * GRAPH_HEIGHT)
+        pygame.draw.line(screen, GREEN, (rect.left, budget_y), (rect.right - 1, budget_y))
+        if len(times) < 2:
+            return
+        step = PANEL_WIDTH / self.profiler.capacity
+        points = [(rect.left + i * step, rect.bottom - 1 - value / scale * (GRAPH_HEIGHT - 1))
+                  for i, value in enumerate(times.tolist())]
+        pygame.draw.lines(screen, YELLOW, False, points)
+
+    def draw(self, screen: pygame.Surface, info: Optional[Dict[str, object]] = None) -> None:
+        """
+        Dibuja el panel y la gráfica.
+
+        Args:
+            screen: Superficie donde dibujar
+            info: Pares clave/valor extra para la cabecera (entidades, nivel, etc.)
+        """
+        self._frames_since_refresh += 1
+        if self._text_surface is None or self._frames_since_refresh >= TEXT_REFRESH_FRAMES:
+            self._text_surface = self._render_text(info or {})
+            self._frames_since_refresh = 0
+        screen.blit(self._text_surface, self.position)
+        self._draw_graph(screen, self.position[1] + self._text_surface.get_height() + 4)
@@ -6,28 +6,90 @@ Fecha: 2024-12-19
 Descripción: Sistema completo de logging modular y profesional para todos los componentes del juego, usando logging nativo de Python.
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import sys
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Union
 from pathlib import Path
 
+# Nivel mínimo por defecto; p. ej. PYGAME_LOG_LEVEL=INFO desactiva los mensajes de debug
+LOG_LEVEL_ENV = "PYGAME_LOG_LEVEL"
+
+# Un mensaje puede ser un texto (plantilla con %s si se pasan args) o una función que lo construye
+Message = Union[str, Callable[[], str]]
+
+# Modo asíncrono por defecto: PYGAME_LOG_ASYNC=drop|block|sample (o 1 = drop)
+LOG_ASYNC_ENV = "PYGAME_LOG_ASYNC"
+OVERFLOW_POLICIES = ("drop", "block", "sample")
+
+
+class _BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler sobre una cola acotada con política de desbordamiento.
+
+    - drop: si la cola está llena el registro se descarta (el juego nunca espera)
+    - block: el juego espera a que haya sitio (no se pierde nada)
+    - sample: por encima del 75 % de ocupación solo se encola 1 de cada sample_rate
+      registros y con la cola llena se descarta
+
+    Las advertencias y errores nunca se descartan: esperan sitio en la cola.
+    """
+
+    def __init__(self, log_queue: queue.Queue, policy: str = "drop", sample_rate: int = 10):
+        super().__init__(log_queue)
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Política de cola desconocida: {policy}")
+        self.policy = policy
+        self.sample_rate = sample_rate
+        self.high_water = max(1, log_queue.maxsize * 3 // 4)
+        self.dropped = 0
+        self.sampled_out = 0
+        self._sample_counter = 0
+        self.listener: Optional[logging.handlers.QueueListener] = None
+        self.component_handlers: Dict[str, logging.Handler] = {}
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.policy == "block" or record.levelno >= logging.WARNING:
+            self.queue.put(record)
+            return
+        if self.policy == "sample" and self.queue.qsize() >= self.high_water:
+            self._sample_counter += 1
+            if self._sample_counter % self.sample_rate:
+                self.sampled_out += 1
+                return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
 
 class AdvancedLogger:
     """
     Sistema de logging avanzado usando logging nativo de Python.
     Proporciona múltiples archivos de log, niveles, formato personalizado y logging en consola.
+
+    Los mensajes se formatean solo si el nivel está activo para el componente: en rutas
+    calientes se pasa una plantilla con argumentos (`log_debug("x=%s", "enemy", x)`) o una
+    función (`log_debug(lambda: f"x={x}", "enemy")`) en lugar de un f-string ya construido.
+    En los bucles más calientes, `if logger.debug_enabled:` evita incluso la llamada.
     """
     
-    def __init__(self, name: str = "PyGame", log_dir: str = "logs"):
+    def __init__(self, name: str = "PyGame", log_dir: str = "logs", async_mode: Optional[str] = None,
+                 queue_size: int = 10000):
         """
         Inicializa el sistema de logging avanzado.
         
         Args:
             name: Nombre del logger principal
             log_dir: Directorio donde guardar los logs
+            async_mode: None/"off" para escribir en el hilo que registra, o una política de
+                cola ("drop", "block", "sample") para que un hilo en segundo plano escriba
+                consola y archivos (por defecto, la variable de entorno PYGAME_LOG_ASYNC)
+            queue_size: Registros que caben en la cola del modo asíncrono
         """
         self.name = name
         self.log_dir = Path(log_dir)
@@ -37,17 +99,42 @@ class AdvancedLogger:
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.DEBUG)
         
+        if async_mode is None:
+            async_mode = os.environ.get(LOG_ASYNC_ENV, "off")
+        if async_mode == "1":
+            async_mode = "drop"
+        
         # Evitar duplicación de handlers
         if not self.logger.handlers:
-            self._setup_handlers()
+            self._setup_handlers(async_mode if async_mode in OVERFLOW_POLICIES else None, queue_size)
+        # Handler de cola (modo asíncrono), propio o de una instancia anterior con el mismo nombre
+        self.queue_handler: Optional[_BoundedQueueHandler] = next(
+            (handler for handler in self.logger.handlers if isinstance(handler, _BoundedQueueHandler)), None)
         
         # Loggers específicos por componente
         self.component_loggers: Dict[str, logging.Logger] = {}
+        # Nivel efectivo de cada componente (None = logger principal), para is_enabled()
+        self._effective_levels: Dict[Optional[str], int] = {}
+        # Nivel mínimo que llega a archivo (ver attach_flight_recorder)
+        self.disk_level = logging.DEBUG
+        self.flight_recorder: Optional[logging.Handler] = None
+        
+        default_level = os.environ.get(LOG_LEVEL_ENV)
+        if default_level:
+            self.logger.setLevel(self._parse_level(default_level))
+        # False si ningún componente registra DEBUG: guarda de una sola lectura de atributo
+        self.debug_enabled = True
+        self._update_debug_enabled()
         
         self.logger.info(f"Sistema de logging avanzado inicializado - Directorio: {self.log_dir}")
     
-    def _setup_handlers(self) -> None:
-        """Configura los handlers para el logger principal."""
+    def _setup_handlers(self, async_policy: Optional[str] = None, queue_size: int = 10000) -> None:
+        """
+        Configura los handlers para el logger principal.
+
+        En modo asíncrono el logger solo tiene un handler de cola; consola y archivos los
+        atiende un QueueListener en un hilo propio, así la E/S nunca bloquea un frame.
+        """
         
         # Handler para consola (solo INFO y superior)
         console_handler = logging.StreamHandler(sys.stdout)
@@ -57,7 +144,6 @@ class AdvancedLogger:
             datefmt='%H:%M:%S'
         )
         console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
         
         # Handler para archivo general (todos los niveles)
         general_handler = logging.handlers.RotatingFileHandler(
@@ -72,7 +158,6 @@ class AdvancedLogger:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         general_handler.setFormatter(general_formatter)
-        self.logger.addHandler(general_handler)
         
         # Handler para errores (solo ERROR y CRITICAL)
         error_handler = logging.handlers.RotatingFileHandler(
@@ -88,7 +173,20 @@ class AdvancedLogger:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         error_handler.setFormatter(error_formatter)
-        self.logger.addHandler(error_handler)
+        
+        handlers = (console_handler, general_handler, error_handler)
+        if async_policy is None:
+            for handler in handlers:
+                self.logger.addHandler(handler)
+            return
+        
+        queue_handler = _BoundedQueueHandler(queue.Queue(queue_size), async_policy)
+        queue_handler.listener = logging.handlers.QueueListener(queue_handler.queue, *handlers,
+                                                                respect_handler_level=True)
+        queue_handler.listener.start()
+        self.logger.addHandler(queue_handler)
+        # Vaciar la cola aunque el juego no llame a close() (el hilo del listener es daemon)
+        atexit.register(self._stop_listener, queue_handler)
     
     def get_component_logger(self, component_name: str) -> logging.Logger:
         """
@@ -103,66 +201,160 @@ class AdvancedLogger:
         if component_name not in self.component_loggers:
             # Crear logger específico
             component_logger = logging.getLogger(f"{self.name}.{component_name}")
-            component_logger.setLevel(logging.DEBUG)
+            # Heredar el nivel del logger principal salvo que se fije con set_level(…, componente)
+            component_logger.setLevel(logging.NOTSET)
             
             # Handler específico para el componente
-            component_handler = logging.handlers.RotatingFileHandler(
-                self.log_dir / f"{component_name}.log",
-                maxBytes=512*1024,  # 512KB
-                backupCount=3,
-                encoding='utf-8'
-            )
-            component_handler.setLevel(logging.DEBUG)
-            component_formatter = logging.Formatter(
-                '%(asctime)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
-            component_handler.setFormatter(component_formatter)
-            component_logger.addHandler(component_handler)
+            component_handler = self._component_handler(component_logger, component_name)
+            if component_handler is not None:
+                component_logger.addHandler(component_handler)
             
             self.component_loggers[component_name] = component_logger
             self.logger.info(f"Logger creado para componente: {component_name}")
         
         return self.component_loggers[component_name]
     
-    def log_event(self, message: str, component: Optional[str] = None) -> None:
+    def _component_handler(self, component_logger: logging.Logger, component_name: str) -> Optional[logging.Handler]:
         """
-        Registra un evento informativo.
+        Crea el handler de archivo de un componente.
+
+        En modo asíncrono el handler se añade al listener (filtrado por el nombre del logger
+        del componente) y no al logger: retorna None. También retorna None si el componente
+        ya tiene handler (otra instancia de AdvancedLogger con el mismo nombre lo creó).
+        """
+        queue_handler = self.queue_handler
+        if component_logger.handlers or (queue_handler and component_name in queue_handler.component_handlers):
+            return None
         
+        component_handler = logging.handlers.RotatingFileHandler(
+            self.log_dir / f"{component_name}.log",
+            maxBytes=512*1024,  # 512KB
+            backupCount=3,
+            encoding='utf-8'
+        )
+        component_handler.setLevel(self.disk_level)
+        component_formatter = logging.Formatter(
+            '%(asctime)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        component_handler.setFormatter(component_formatter)
+        if queue_handler is None:
+            return component_handler
+        
+        component_handler.addFilter(logging.Filter(component_logger.name))
+        queue_handler.component_handlers[component_name] = component_handler
+        # El listener recorre su tupla de handlers en cada registro: sustituirla es seguro
+        listener = queue_handler.listener
+        listener.handlers = listener.handlers + (component_handler,)
+        return None
+    
+    def attach_flight_recorder(self, recorder: logging.Handler, disk_level: str = "INFO") -> None:
+        """
+        Añade un grabador de vuelo (FlightRecorder) y sube el nivel de los handlers de archivo.
+
+        El grabador recibe todos los registros activos en memoria; a disco (y a la cola del
+        modo asíncrono) solo llegan los de disk_level o superior. Así el detalle de DEBUG
+        sigue disponible para un volcado sin escribirlo durante la partida.
+
+        Args:
+            recorder: Handler que guarda los registros en memoria
+            disk_level: Nivel mínimo que se escribe en archivo ('INFO' por defecto)
+        """
+        if self.flight_recorder is not None:
+            self.logger.removeHandler(self.flight_recorder)
+        self.disk_level = self._parse_level(disk_level)
+        handlers = list(self.logger.handlers)
+        for component_logger in self.component_loggers.values():
+            handlers += component_logger.handlers
+        if self.queue_handler is not None:
+            handlers += self.queue_handler.component_handlers.values()
+        for handler in handlers:
+            handler.setLevel(max(handler.level, self.disk_level))
+        self.flight_recorder = recorder
+        self.logger.addHandler(recorder)
+    
+    def is_enabled(self, level: int, component: Optional[str] = None) -> bool:
+        """
+        Indica si un mensaje de ese nivel llegaría a registrarse para el componente.
+        El nivel efectivo de cada componente se cachea (se invalida en set_level).
+
         Args:
-            message: Mensaje del evento
+            level: Nivel de logging (logging.DEBUG, logging.INFO...)
             component: Componente específico (opcional)
         """
+        effective = self._effective_levels.get(component)
+        if effective is None:
+            effective = self._cache_level(component)
+        return level >= effective
+
+    def _cache_level(self, component: Optional[str]) -> int:
+        """Calcula y cachea el nivel efectivo de un componente (sin crear su logger ni su archivo)."""
         if component:
-            self.get_component_logger(component).info(message)
+            logger = self.component_loggers.get(component) or logging.getLogger(f"{self.name}.{component}")
         else:
-            self.logger.info(message)
+            logger = self.logger
+        effective = logger.getEffectiveLevel()
+        if logging.root.manager.disable:
+            effective = max(effective, logging.root.manager.disable + 1)
+        self._effective_levels[component] = effective
+        return effective
+
+    def _update_debug_enabled(self) -> None:
+        """Recalcula debug_enabled a partir del logger principal y de los componentes creados."""
+        levels = [self.logger.getEffectiveLevel()]
+        levels += [logger.getEffectiveLevel() for logger in self.component_loggers.values()]
+        self.debug_enabled = min(levels) <= logging.DEBUG and not logging.root.manager.disable >= logging.DEBUG
+
+    def _log(self, level: int, message: Message, component: Optional[str], args: tuple) -> None:
+        """Registra un mensaje ya comprobado como activo, formateándolo solo ahora."""
+        if callable(message):
+            message = message()
+        logger = self.get_component_logger(component) if component else self.logger
+        # Con args, logging aplica message % args al emitir el registro; stacklevel=3 atribuye
+        # funcName y lineno a quien llamó a log_debug/log_event, no a este método
+        logger.log(level, message, *args, stacklevel=3)
+
+    def log_event(self, message: Message, component: Optional[str] = None, *args) -> None:
+        """
+        Registra un evento informativo.
+        
+        Args:
+            message: Mensaje del evento, plantilla para args o función que lo construye
+            component: Componente específico (opcional)
+            *args: Argumentos de la plantilla (se formatean solo si el nivel está activo)
+        """
+        effective = self._effective_levels.get(component)
+        if effective is None:
+            effective = self._cache_level(component)
+        if logging.INFO >= effective:
+            self._log(logging.INFO, message, component, args)
     
-    def log_debug(self, message: str, component: Optional[str] = None) -> None:
+    def log_debug(self, message: Message, component: Optional[str] = None, *args) -> None:
         """
         Registra un mensaje de debug.
         
         Args:
-            message: Mensaje de debug
+            message: Mensaje de debug, plantilla para args o función que lo construye
             component: Componente específico (opcional)
+            *args: Argumentos de la plantilla (se formatean solo si el nivel está activo)
         """
-        if component:
-            self.get_component_logger(component).debug(message)
-        else:
-            self.logger.debug(message)
+        effective = self._effective_levels.get(component)
+        if effective is None:
+            effective = self._cache_level(component)
+        if logging.DEBUG >= effective:
+            self._log(logging.DEBUG, message, component, args)
     
-    def log_warning(self, message: str, component: Optional[str] = None) -> None:
+    def log_warning(self, message: Message, component: Optional[str] = None, *args) -> None:
         """
         Registra una advertencia.
         
         Args:
-            message: Mensaje de advertencia
+            message: Mensaje de advertencia, plantilla para args o función que lo construye
             component: Componente específico (opcional)
+            *args: Argumentos de la plantilla (se formatean solo si el nivel está activo)
         """
-        if component:
-            self.get_component_logger(component).warning(message)
-        else:
-            self.logger.warning(message)
+        if self.is_enabled(logging.WARNING, component):
+            self._log(logging.WARNING, message, component, args)
     
     def log_error(self, message: str, component: Optional[str] = None, exc_info: bool = True) -> None:
         """
@@ -277,23 +469,30 @@ class AdvancedLogger:
             level: Nivel ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
             component: Componente específico (opcional)
         """
-        level_map = {
-            'DEBUG': logging.DEBUG,
-            'INFO': logging.INFO,
-            'WARNING': logging.WARNING,
-            'ERROR': logging.ERROR,
-            'CRITICAL': logging.CRITICAL
-        }
-        
-        log_level = level_map.get(level.upper(), logging.INFO)
+        log_level = self._parse_level(level)
         
         if component:
             self.get_component_logger(component).setLevel(log_level)
         else:
             self.logger.setLevel(log_level)
+        # Los niveles de los componentes dependen del principal: recalcular todos
+        self._effective_levels.clear()
+        self._update_debug_enabled()
         
         self.logger.info(f"Nivel de logging establecido: {level} para {component or 'general'}")
     
+    @staticmethod
+    def _parse_level(level: str) -> int:
+        """Convierte un nombre de nivel ('DEBUG', 'INFO'...) en su valor de logging (INFO si no se reconoce)."""
+        level_map = {
+            'DEBUG': logging.DEBUG,
+            'INFO': logging.INFO,
+            'WARNING': logging.WARNING,
+            'ERROR': logging.ERROR,
+            'CRITICAL': logging.CRITICAL
+        }
+        return level_map.get(level.upper(), logging.INFO)
+    
     def clear_logs(self, component: Optional[str] = None) -> None:
         """
         Limpia los archivos de log.
@@ -337,6 +536,72 @@ class AdvancedLogger:
         
         return stats
     
+    def get_queue_stats(self) -> Dict[str, Any]:
+        """
+        Estadísticas de la cola del modo asíncrono.
+
+        Returns:
+            Diccionario con política, ocupación y registros descartados (vacío en modo síncrono)
+        """
+        queue_handler = self.queue_handler
+        if queue_handler is None:
+            return {}
+        return {
+            'policy': queue_handler.policy,
+            'queued': queue_handler.queue.qsize(),
+            'max_size': queue_handler.queue.maxsize,
+            'dropped': queue_handler.dropped,
+            'sampled_out': queue_handler.sampled_out
+        }
+    
+    def flush(self) -> None:
+        """Espera a que el hilo de logging escriba todo lo encolado y vacía los handlers."""
+        queue_handler = self.queue_handler
+        if queue_handler is not None and queue_handler.listener is not None:
+            lost = queue_handler.dropped + queue_handler.sampled_out
+            if lost:
+                self.logger.warning(f"Cola de logging llena: {lost} registros descartados "
+                                    f"(política {queue_handler.policy})")
+                queue_handler.dropped = queue_handler.sampled_out = 0
+            # QueueListener marca task_done por registro: join() vuelve con la cola procesada
+            queue_handler.queue.join()
+            handlers = queue_handler.listener.handlers
+        else:
+            handlers = self.logger.handlers
+        for handler in handlers:
+            handler.flush()
+        for component_logger in self.component_loggers.values():
+            for handler in component_logger.handlers:
+                handler.flush()
+    
+    def close(self) -> None:
+        """
+        Vacía la cola y detiene el hilo de logging (modo asíncrono). Los handlers vuelven a
+        los loggers, así lo que se registre después se escribe de forma síncrona.
+        """
+        queue_handler = self.queue_handler
+        if queue_handler is None or queue_handler.listener is None:
+            return
+        self.flush()
+        handlers = queue_handler.listener.handlers
+        self._stop_listener(queue_handler)
+        self.logger.removeHandler(queue_handler)
+        component_handlers = queue_handler.component_handlers
+        for component_name, handler in component_handlers.items():
+            logging.getLogger(f"{self.name}.{component_name}").addHandler(handler)
+        for handler in handlers:
+            if handler not in component_handlers.values():
+                self.logger.addHandler(handler)
+        self.queue_handler = None
+    
+    @staticmethod
+    def _stop_listener(queue_handler: _BoundedQueueHandler) -> None:
+        """Detiene el listener de un handler de cola procesando lo pendiente."""
+        listener = queue_handler.listener
+        if listener is not None:
+            listener.stop()
+            queue_handler.listener = None
+    
     def __str__(self) -> str:
         """Representación en string del logger."""
         return f"AdvancedLogger(name='{self.name}', log_dir='{self.log_dir}')"
@@ -365,17 +630,18 @@ def get_logger(name: str = "PyGame") -> AdvancedLogger:
         _global_logger = AdvancedLogger(name)
     return _global_logger
 
-def setup_logging(name: str = "PyGame", log_dir: str = "logs") -> AdvancedLogger:
+def setup_logging(name: str = "PyGame", log_dir: str = "logs", async_mode: Optional[str] = None) -> AdvancedLogger:
     """
     Configura el sistema de logging global.
     
     Args:
         name: Nombre del logger
         log_dir: Directorio de logs
+        async_mode: Política de cola del modo asíncrono ("drop", "block", "sample") o "off"
         
     Returns:
         Instancia del AdvancedLogger configurado
     """
     global _global_logger
-    _global_logger = AdvancedLogger(name, log_dir)
+    _global_logger = AdvancedLogger(name, log_dir, async_mode)
     return _global_logger 
\ No newline at end of file
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Precarga de assets en segundo plano para PyGame Shooter
+Autor: Kava
+Fecha: 2024-12-19
+Descripción: Decodifica personajes, enemigos, proyectiles, UI y sonidos en un hilo mientras se
+muestra el menú principal y hace la conversión (convert_alpha) en el hilo principal por porciones.
+"""
+
+import os
+import queue
+import threading
+import time
+from typing import Callable, Iterator, List, Optional, Tuple
+
+import pygame
+
+from constants import CHARACTER_STATS, ENEMY_TYPES, ATTACK_TYPES, PLAYER_SIZE
+from utils.advanced_logger import get_logger
+from utils.image_loader import (decode_image, register_decoded_image, convert_decoded_image,
+                                discard_decoded_image, is_image_cached, is_animation_cached,
+                                resource_path, get_animation_source_paths,
+                                load_facing_animation_frames, load_cached_image)
+
+# Imágenes de UI usadas durante la partida (HUD y barras de vida de enemigos)
+UI_IMAGES = [
+    "assets/ui/Hearts_Red_1.png",
+    "assets/ui/Hearts_Red_5.png",
+    "assets/ui/Hearts_Blue_1.png",
+    "assets/ui/Health_03.png",
+    "assets/ui/Health_03_Bar01.png",
+    "assets/ui/Health_03_Bar02.png",
+    "assets/ui/Health_03_Bar03.png",
+]
+
+
+class PreloadJob:
+    """
+    Unidad de precarga: ficheros a decodificar en el hilo de carga y un generador que
+    termina el trabajo en el hilo principal (conversión y registro en cachés) cediendo
+    el control tras cada paso pequeño, para poder repartirlo entre varios frames.
+    """
+
+    __slots__ = ("name", "kind", "resolve_paths", "finalize", "is_cached", "paths", "decoded")
+
+    def __init__(self, name: str, kind: str, resolve_paths: Callable[[], List[str]],
+                 finalize: Callable[["PreloadJob"], Iterator[None]],
+                 is_cached: Optional[Callable[[], bool]] = None):
+        self.name = name
+        self.kind = kind  # 'animation', 'image' o 'sound'
+        self.resolve_paths = resolve_paths
+        self.finalize = finalize
+        # Si retorna True el asset ya está en caché y no se decodifica nada
+        self.is_cached = is_cached
+        self.paths: List[str] = []
+        self.decoded = []
+
+
+class AssetPreloader:
+    """
+    Precargador de assets con hilo de decodificación y finalización por porciones.
+
+    El hilo solo decodifica ficheros (pygame.image.load / pygame.mixer.Sound); todo lo que
+    depende del modo de vídeo (convert_alpha, escalado) se hace en step() dentro de un
+    presupuesto de tiempo por frame, para que el menú siga fluido mientras se carga.
+    """
+
+    def __init__(self, sound_manager=None, logger=None, frame_budget_ms: float = 4.0):
+        """
+        Inicializa el precargador.
+
+        Args:
+            sound_manager: SoundManager donde registrar los efectos (opcional)
+            logger: Instancia del logger para debug (opcional, usa AdvancedLogger por defecto)
+            frame_budget_ms: Tiempo máximo por frame dedicado a finalizar assets
+        """
+        self.logger = logger or get_logger("PyGame")
+        self.sound_manager = sound_manager
+        self.frame_budget_ms = frame_budget_ms
+        self.jobs: List[PreloadJob] = self._build_jobs()
+        self.completed = 0
+        self._ready: "queue.Queue[PreloadJob]" = queue.Queue()
+        self._current_job: Optional[PreloadJob] = None
+        self._current_steps: Optional[Iterator[None]] = None
+        self._thread: Optional[threading.Thread] = None
+        self._decoded_paths = set()
+        self._start_time = 0.0
+
+        self.logger.log_event(f"AssetPreloader inicializado con {len(self.jobs)} trabajos", "preloader")
+
+    # ------------------------------------------------------------------
+    # Manifiesto de assets
+    # ------------------------------------------------------------------
+    def _build_jobs(self) -> List[PreloadJob]:
+        """Construye la lista de trabajos a partir de las constantes del juego."""
+        jobs = []
+
+        # Animaciones de personajes (mismas claves y tamaños que Player y el menú de selección)
+        for stats in CHARACTER_STATS.values():
+            animations = [("Idle", stats["idle_frames"]), ("Run", stats["run_frames"]),
+                          (stats["attack_animation_key"], stats["attack_frames"])]
+            if "walk_frames" in stats:
+                animations.append(("Walk", stats["walk_frames"]))
+            for animation_name, num_frames in animations:
+                sizes = [PLAYER_SIZE, PLAYER_SIZE * 2] if animation_name == "Idle" else [PLAYER_SIZE]
+                jobs.append(self._animation_job(stats["image_folder"], animation_name, num_frames, sizes))
+
+        # Animaciones de enemigos (mismas claves que Enemy)
+        for stats in ENEMY_TYPES.values():
+            animations = [("Idle", stats["idle_frames"]),
+                          (stats.get("run_animation_key", "Run"), stats["run_frames"]),
+                          (stats.get("attack_animation_key", "Attack"), stats["attack_frames"])]
+            if "walk_frames" in stats:
+                animations.append(("Walk", stats["walk_frames"]))
+            for animation_name, num_frames in animations:
+                jobs.append(self._animation_job(stats["image_folder"], animation_name, num_frames, [stats["size"]]))
+
+        # Imágenes sueltas: proyectiles y UI
+        image_paths = [attack["image"] for attack in ATTACK_TYPES.values()] + UI_IMAGES
+        for path in dict.fromkeys(image_paths):
+            jobs.append(PreloadJob(path, "image", lambda path=path: [path], self._finalize_image,
+                                   lambda path=path: is_image_cached(path)))
+
+        # Efectos de sonido
+        if self.sound_manager is not None:
+            for sound_name, sound_path in self.sound_manager.SOUND_FILES.items():
+                jobs.append(PreloadJob(sound_name, "sound", lambda path=sound_path: [path], self._finalize_sound))
+
+        return jobs
+
+    def _animation_job(self, base_folder: str, animation_name: str, num_frames: int,
+                       sizes: List[int]) -> PreloadJob:
+        def finalize(job: PreloadJob) -> Iterator[None]:
+            try:
+                # Un convert_alpha por paso; después solo queda montar y escalar la animación
+                for path in job.paths:
+                    convert_decoded_image(path)
+                    yield
+                for size in sizes:
+                    load_facing_animation_frames(base_folder, animation_name, num_frames, size)
+                    yield
+            finally:
+                # Las imágenes que la carga no consumió (caché ya caliente) no deben quedarse en memoria
+                for path in job.paths:
+                    discard_decoded_image(path)
+
+        def is_cached() -> bool:
+            return all(is_animation_cached(base_folder, animation_name, num_frames, size) for size in sizes)
+
+        # Las rutas (PNG sueltos o páginas de atlas) se resuelven en el hilo de carga
+        return PreloadJob(f"{base_folder}:{animation_name}", "animation",
+                          lambda: get_animation_source_paths(base_folder, animation_name, num_frames),
+                          finalize, is_cached)
+
+    # ------------------------------------------------------------------
+    # Hilo de decodificación
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        """Lanza el hilo de decodificación (no hace nada si ya se lanzó)."""
+        if self._thread is not None:
+            return
+        self._start_time = time.perf_counter()
+        self._thread = threading.Thread(target=self._worker, name="AssetPreloader", daemon=True)
+        self._thread.start()
+        self.logger.log_event("Precarga de assets iniciada", "preloader")
+
+    def _worker(self) -> None:
+        """Decodifica los ficheros de cada trabajo y lo deja listo para el hilo principal."""
+        for job in self.jobs:
+            try:
+                if job.is_cached is not None and job.is_cached():
+                    # Ya en caché (p. ej. por un GameLoop anterior): no decodificar nada
+                    self._ready.put(job)
+                    continue
+                job.paths = job.resolve_paths()
+                for path in job.paths:
+                    if job.kind == "sound":
+                        job.decoded.append(self._decode_sound(job.name, path))
+                        continue
+                    # Las páginas de atlas las comparten varias animaciones: decodificar una vez
+                    if path in self._decoded_paths:
+                        continue
+                    self._decoded_paths.add(path)
+                    register_decoded_image(path, decode_image(path))
+            except Exception as e:
+                self.logger.log_error(f"Error decodificando {job.name}: {e}", "preloader")
+            self._ready.put(job)
+
+    def _decode_sound(self, sound_name: str, path: str):
+        if sound_name in self.sound_manager.MUSIC_NAMES:
+            return path if os.path.exists(resource_path(path)) else None
+        if not pygame.mixer.get_init() or not os.path.exists(resource_path(path)):
+            return None
+        return pygame.mixer.Sound(resource_path(path))
+
+    # ------------------------------------------------------------------
+    # Finalización en el hilo principal
+    # ------------------------------------------------------------------
+    def _finalize_image(self, job: PreloadJob) -> Iterator[None]:
+        try:
+            load_cached_image(job.name)
+            yield
+        finally:
+            discard_decoded_image(job.name)
+
+    def _finalize_sound(self, job: PreloadJob) -> Iterator[None]:
+        if job.decoded and job.decoded[0] is not None:
+            self.sound_manager.register_sound(job.name, job.decoded[0])
+        else:
+            self.logger.log_warning(f"Archivo de sonido no disponible: {job.name}", "preloader")
+        yield
+
+    def _advance(self, block: bool = False) -> bool:
+        """
+        Ejecuta un paso de finalización del trabajo actual (o toma el siguiente de la cola).
+
+        Returns:
+            False si no había nada listo para procesar
+        """
+        if self._current_steps is None:
+            try:
+                self._current_job = self._ready.get(block=block)
+            except queue.Empty:
+                return False
+            self._current_steps = self._current_job.finalize(self._current_job)
+        try:
+            next(self._current_steps)
+            return True
+        except StopIteration:
+            pass
+        except (Exception, SystemExit) as e:
+            # load_image lanza SystemExit si el fichero está corrupto
+            self.logger.log_error(f"Error finalizando {self._current_job.name}: {e}", "preloader")
+        self._current_job.decoded = []
+        self._current_job = None
+        self._current_steps = None
+        self.completed += 1
+        if self.is_done():
+            elapsed = time.perf_counter() - self._start_time
+            self.logger.log_performance("Precarga de assets", elapsed, "preloader")
+        return True
+
+    def step(self, budget_ms: Optional[float] = None) -> float:
+        """
+        Finaliza trabajos decodificados durante como máximo budget_ms milisegundos.
+        Pensado para llamarse una vez por frame mientras se muestra el menú.
+
+        Returns:
+            Progreso entre 0.0 y 1.0
+        """
+        if self._thread is None:
+            return self.progress
+        budget = (budget_ms if budget_ms is not None else self.frame_budget_ms) / 1000.0
+        start = time.perf_counter()
+        while time.perf_counter() - start < budget and not self.is_done():
+            if not self._advance():
+                break
+        return self.progress
+
+    def finish(self) -> None:
+        """Completa toda la precarga pendiente de forma bloqueante (antes de empezar a jugar)."""
+        self.start()
+        while not self.is_done():
+            self._advance(block=True)
+
+    @property
+    def progress(self) -> float:
+        """Fracción de trabajos completados (0.0 a 1.0)."""
+        if not self.jobs:
+            return 1.0
+        return self.completed / len(self.jobs)
+
+    def is_done(self) -> bool:
+        """Indica si todos los assets están en caché."""
+        return self.completed >= len(self.jobs)
+
+    def get_status(self) -> Tuple[int, int]:
+        """Retorna (trabajos completados, trabajos totales)."""
+        return self.completed, len(self.jobs)
+
+    def __str__(self) -> str:
+        """Representación en string del precargador."""
+        return f"AssetPreloader(completed={self.completed}/{len(self.jobs)})"
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Capa de fondo para PyGame Shooter
+Autor: Kava
+Fecha: 2024-12-19
+Descripción: Carga cada imagen de fondo una sola vez, la escala al tamaño de pantalla y la
+convierte al formato del display (sin alpha), para que partida, pausa y menús limpien la pantalla
+con un único blit y el render por rectángulos sucios la use como fuente para borrar.
+"""
+
+import os
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, BACKGROUND_IMAGES
+from utils.advanced_logger import get_logger
+from utils.image_loader import load_image, resource_path
+
+# Color con el que se sustituye un fondo que no se puede cargar
+FALLBACK_COLOR = (0, 0, 0)
+
+# (ruta, tamaño) -> Surface escalada y convertida
+_background_cache: Dict[Tuple[str, Tuple[int, int]], pygame.Surface] = {}
+
+
+def load_background(path: Optional[str], size: Tuple[int, int] = (SCREEN_WIDTH, SCREEN_HEIGHT),
+                    logger=None) -> pygame.Surface:
+    """
+    Retorna el fondo de path escalado a size y en formato de display, cargándolo solo la
+    primera vez. Debe llamarse con el modo de vídeo ya establecido.
+
+    Args:
+        path: Ruta de la imagen (None = fondo liso de FALLBACK_COLOR)
+        size: Tamaño de destino (el de la pantalla por defecto)
+        logger: Instancia del logger (opcional)
+
+    Returns:
+        Superficie opaca compartida: no debe modificarse
+    """
+    key = (path, tuple(size))
+    background = _background_cache.get(key)
+    if background is not None:
+        return background
+
+    if path is not None and os.path.exists(resource_path(path)):
+        image = load_image(path, alpha=False)
+        if image.get_size() != key[1]:
+            image = pygame.transform.scale(image, key[1])
+        background = image.convert()
+    else:
+        if path is not None:
+            (logger or get_logger("PyGame")).log_warning("Fondo no encontrado: %s", "background", path)
+        background = pygame.Surface(key[1]).convert()
+        background.fill(FALLBACK_COLOR)
+    _background_cache[key] = background
+    return background
+
+
+def level_background(level: int, size: Tuple[int, int] = (SCREEN_WIDTH, SCREEN_HEIGHT), logger=None) -> pygame.Surface:
+    """Fondo de un nivel: los de BACKGROUND_IMAGES se van alternando por nivel."""
+    path = BACKGROUND_IMAGES[(level - 1) % len(BACKGROUND_IMAGES)] if BACKGROUND_IMAGES else None
+    return load_background(path, size, logger)
+
+
+def clear_background_cache() -> None:
+    """Libera los fondos cacheados (p. ej. tras cambiar la resolución)."""
+    _background_cache.clear()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Colisiones por lotes para PyGame Shooter
+Autor: Kava
+Fecha: 2024-12-19
+Descripción: Broadphase AABB vectorizada con NumPy entre arrays de rectángulos (proyectiles y
+enemigos) y resolución de impactos con las mismas reglas que el bucle de colliderect original.
+"""
+
+from typing import List, Sequence, Tuple
+
+import numpy as np
+import pygame
+
+# Por debajo de este número de pares candidatos se usa broadcasting (matriz completa);
+# por encima, poda por intervalos ordenados en un eje
+BROADCAST_MAX_PAIRS = 64 * 1024
+
+
+def rects_to_array(rects: Sequence[pygame.Rect]) -> np.ndarray:
+    """Convierte una secuencia de pygame.Rect en un array (N, 4) de enteros [x, y, ancho, alto]."""
+    if not rects:
+        return np.empty((0, 4), dtype=np.int64)
+    return np.array([tuple(rect) for rect in rects], dtype=np.int64)
+
+
+def square_rects_array(x: np.ndarray, y: np.ndarray, size: np.ndarray) -> np.ndarray:
+    """
+    Construye el array (N, 4) de rectángulos cuadrados a partir de coordenadas en coma flotante.
+    Trunca hacia cero igual que pygame.Rect(x, y, size, size).
+    """
+    rects = np.empty((len(x), 4), dtype=np.int64)
+    rects[:, 0] = np.trunc(x)
+    rects[:, 1] = np.trunc(y)
+    rects[:, 2] = size
+    rects[:, 3] = size
+    return rects
+
+
+def _edges(rects: np.ndarray):
+    """
+    Bordes (izquierda, arriba, derecha, abajo) en int32 de los rectángulos no vacíos y sus
+    índices originales. Rect.colliderect nunca detecta colisión con un rectángulo vacío.
+    """
+    valid = np.flatnonzero((rects[:, 2] > 0) & (rects[:, 3] > 0))
+    rects = rects[valid].astype(np.int32)
+    left = rects[:, 0]
+    top = rects[:, 1]
+    return valid, left, top, left + rects[:, 2], top + rects[:, 3]
+
+
+def _overlaps_broadcast(rects_a: np.ndarray, rects_b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    valid_a, a_left, a_top, a_right, a_bottom = _edges(rects_a)
+    valid_b, b_left, b_top, b_right, b_bottom = _edges(rects_b)
+    # Mismas desigualdades estrictas que Rect.colliderect (bordes que se tocan no colisionan)
+    mask = a_top[:, None] < b_bottom
+    mask &= a_bottom[:, None] > b_top
+    mask &= a_left[:, None] < b_right
+    mask &= a_right[:, None] > b_left
+    # np.nonzero recorre la matriz por filas: pares ya ordenados por (a, b)
+    ia, ib = np.nonzero(mask)
+    return valid_a[ia], valid_b[ib]
+
+
+def _overlaps_sorted(rects_a: np.ndarray, rects_b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    valid_a, a_left, a_top, a_right, a_bottom = _edges(rects_a)
+    valid_b, b_left, b_top, b_right, b_bottom = _edges(rects_b)
+    if len(valid_a) == 0 or len(valid_b) == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+
+    # Podar en el eje en el que b está más repartido (en la pantalla vertical del juego, Y)
+    if np.ptp(b_left) >= np.ptp(b_top):
+        a_start, a_end, b_start, b_end = a_left, a_right, b_left, b_right
+    else:
+        a_start, a_end, b_start, b_end = a_top, a_bottom, b_top, b_bottom
+
+    # Ordenar b por su borde inicial en ese eje: los candidatos de cada a son los b con
+    # a.inicio - max_tamaño_b < b.inicio < a.fin, un intervalo contiguo del orden
+    order = np.argsort(b_start, kind="stable")
+    sorted_start = b_start[order]
+    max_extent = int((b_end - b_start).max())
+    lo = np.searchsorted(sorted_start, a_start - max_extent, side="right")
+    hi = np.searchsorted(sorted_start, a_end, side="left")
+    counts = np.maximum(hi - lo, 0)
+    total = int(counts.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+
+    # Expandir cada intervalo [lo, hi) en pares (a, posición en el orden de b)
+    ia = np.repeat(np.arange(len(valid_a)), counts)
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    ib = order[np.repeat(lo, counts) + offsets]
+
+    hit = ((a_top[ia] < b_bottom[ib]) & (a_bottom[ia] > b_top[ib]) &
+           (a_left[ia] < b_right[ib]) & (a_right[ia] > b_left[ib]))
+    ia = ia[hit]
+    ib = ib[hit]
+    # Mismo orden que el broadcasting: por a y, dentro de cada a, por b
+    pair_order = np.lexsort((ib, ia))
+    return valid_a[ia[pair_order]], valid_b[ib[pair_order]]
+
+
+def find_overlaps(rects_a: np.ndarray, rects_b: np.ndarray, method: str = "auto") -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encuentra todos los pares de rectángulos que se solapan entre dos arrays.
+
+    Args:
+        rects_a: Array (N, 4) [x, y, ancho, alto] (p. ej. proyectiles)
+        rects_b: Array (M, 4) [x, y, ancho, alto] (p. ej. enemigos)
+        method: 'broadcast', 'sorted' o 'auto' (según el número de pares N×M)
+
+    Returns:
+        (ia, ib): índices de los pares solapados, ordenados por ia y después por ib
+    """
+    if len(rects_a) == 0 or len(rects_b) == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+    if method == "auto":
+        method = "broadcast" if len(rects_a) * len(rects_b) <= BROADCAST_MAX_PAIRS else "sorted"
+    if method == "broadcast":
+        return _overlaps_broadcast(rects_a, rects_b)
+    if method == "sorted":
+        return _overlaps_sorted(rects_a, rects_b)
+    raise ValueError(f"Método de broadphase desconocido: {method}")
+
+
+def resolve_projectile_hits(ia: np.ndarray, ib: np.ndarray, piercing: Sequence[bool],
+                            piercing_hits: Sequence[int], damage: Sequence[int],
+                            enemy_health: Sequence[int], max_piercing_hits: int) -> Tuple[List[Tuple[int, int]], List[int]]:
+    """
+    Aplica las reglas de impacto del bucle original a los pares candidatos de find_overlaps.
+
+    Los proyectiles se procesan en orden y, para cada uno, los enemigos en orden de lista:
+    cada impacto resta damage a la salud del enemigo, un enemigo con salud <= 0 desaparece
+    para los proyectiles siguientes, un proyectil no perforante se detiene en su primer
+    impacto y uno perforante tras max_piercing_hits impactos (contando los de frames anteriores).
+
+    Args:
+        ia, ib: Pares (proyectil, enemigo) ordenados por proyectil y enemigo
+        piercing: Si cada proyectil es perforante
+        piercing_hits: Impactos previos de cada proyectil perforante
+        damage: Daño de cada proyectil
+        enemy_health: Salud actual de cada enemigo
+        max_piercing_hits: Impactos que aguanta un proyectil perforante
+
+    Returns:
+        (impactos, proyectiles consumidos): lista ordenada de (proyectil, enemigo) a aplicar
+        y lista de proyectiles que deben eliminarse
+    """
+    hits: List[Tuple[int, int]] = []
+    consumed: List[int] = []
+    if len(ia) == 0:
+        return hits, consumed
+
+    health = {}
+    dead = set()
+    # Recorrer por grupos de pares de cada proyectil: un proyectil deja de mirar
+    # candidatos en cuanto se detiene, sin iterar el resto de sus pares
+    group_starts = np.flatnonzero(np.r_[True, ia[1:] != ia[:-1]]).tolist()
+    group_ends = group_starts[1:] + [len(ia)]
+    projectiles = ia[group_starts].tolist()
+    enemies = ib.tolist()
+    for projectile, start, end in zip(projectiles, group_starts, group_ends):
+        projectile_hits = int(piercing_hits[projectile])
+        is_piercing = piercing[projectile]
+        projectile_damage = damage[projectile]
+        for enemy in enemies[start:end]:
+            if enemy in dead:
+                continue
+            hits.append((projectile, enemy))
+            remaining = health.get(enemy, enemy_health[enemy]) - projectile_damage
+            health[enemy] = remaining
+            if remaining <= 0:
+                dead.add(enemy)
+
+            if is_piercing:
+                projectile_hits += 1
+                if projectile_hits < max_piercing_hits:
+                    continue
+            consumed.append(projectile)
+            break
+    return hits, consumed
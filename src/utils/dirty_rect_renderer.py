@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Render por rectángulos sucios para PyGame Shooter
+Autor: Kava
+Fecha: 2024-12-19
+Descripción: En lugar de rellenar toda la pantalla y hacer flip() en cada frame, borra solo las
+zonas donde se dibujó en el frame anterior (restaurándolas desde un fondo cacheado) y pasa a
+pygame.display.update() los rectángulos del frame anterior y del actual. Si el área sucia supera
+un umbral, o hay demasiados rectángulos, hace un flip() completo, que entonces es más barato.
+"""
+
+from typing import Iterable, List, Optional
+
+import pygame
+
+
+class DirtyRectRenderer:
+    """
+    Seguimiento de rectángulos sucios entre frames.
+
+    Uso por frame: erase() antes de dibujar y present(rects) con los rectángulos que
+    retornan los draw() de las entidades y del HUD. invalidate() fuerza un frame completo
+    (tras menús, pausa, overlays o cambios de fondo).
+    """
+
+    def __init__(self, screen: pygame.Surface, background: Optional[pygame.Surface] = None,
+                 max_dirty_ratio: float = 0.35, max_rects: int = 300):
+        """
+        Inicializa el renderer.
+
+        Args:
+            screen: Superficie de la pantalla
+            background: Fondo con el que se borra (negro si es None)
+            max_dirty_ratio: Fracción del área de pantalla a partir de la cual se hace flip()
+            max_rects: Número de rectángulos a partir del cual se hace flip()
+        """
+        self.screen = screen
+        self.screen_rect = screen.get_rect()
+        self.max_dirty_area = int(self.screen_rect.width * self.screen_rect.height * max_dirty_ratio)
+        self.max_rects = max_rects
+        self.set_background(background)
+        self._previous: List[pygame.Rect] = []
+        self._full = True
+        # Estadísticas para el overlay de depuración y los benchmarks
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.last_dirty_ratio = 1.0
+
+    def set_background(self, background: Optional[pygame.Surface]) -> None:
+        """Cambia el fondo con el que se borra; el próximo frame se redibuja completo."""
+        if background is None:
+            background = pygame.Surface(self.screen_rect.size).convert()
+            background.fill((0, 0, 0))
+        self.background = background
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Hace que el próximo erase() borre toda la pantalla y el próximo present() haga flip()."""
+        self._full = True
+
+    def erase(self) -> None:
+        """Restaura el fondo bajo lo dibujado en el frame anterior (o en toda la pantalla)."""
+        screen, background = self.screen, self.background
+        if self._full:
+            screen.blit(background, (0, 0))
+            return
+        screen.blits([(background, rect, rect) for rect in self._previous], False)
+
+    def present(self, rects: Iterable[Optional[pygame.Rect]]) -> None:
+        """
+        Presenta el frame.
+
+        Args:
+            rects: Rectángulos dibujados en este frame (los None se ignoran)
+        """
+        screen_rect = self.screen_rect
+        current = [screen_rect.clip(rect) for rect in rects if rect]
+        current = [rect for rect in current if rect.width and rect.height]
+        dirty = self._previous + current
+        area = sum(rect.width * rect.height for rect in dirty)
+        self.last_dirty_ratio = area / (screen_rect.width * screen_rect.height)
+        if self._full or area > self.max_dirty_area or len(dirty) > self.max_rects:
+            pygame.display.flip()
+            self.full_frames += 1
+        else:
+            pygame.display.update(dirty)
+            self.partial_frames += 1
+        self._previous = current
+        self._full = False
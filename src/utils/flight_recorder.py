@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Grabador de vuelo para PyGame Shooter
+Autor: Kava
+Fecha: 2024-12-19
+Descripción: Guarda en memoria, en buffers circulares de tamaño fijo, los últimos registros de
+log (con nivel DEBUG) y las métricas de los últimos frames sin escribir nada a disco. Solo se
+vuelca a un archivo ante una excepción, al salir con errores registrados o con una tecla, para
+tener el contexto previo a un fallo sin pagar el log de debug en disco durante la partida.
+"""
+
+import logging
+import time
+import traceback
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+# Campos de cada muestra de record_frame(), en orden
+FRAME_FIELDS = ("sim_time", "state", "frame_ms", "enemies", "projectiles", "powerups", "score")
+
+
+class FlightRecorder(logging.Handler):
+    """
+    Handler de logging que guarda los registros recientes en memoria.
+
+    Los registros se guardan sin formatear (plantilla y argumentos); el texto solo se
+    construye al volcar. Se añade al logger con AdvancedLogger.attach_flight_recorder().
+    """
+
+    def __init__(self, dump_dir: str = "logs", max_records: int = 5000, max_frames: int = 600):
+        """
+        Inicializa el grabador.
+
+        Args:
+            dump_dir: Directorio donde escribir los volcados
+            max_records: Registros de log que se conservan
+            max_frames: Frames de métricas que se conservan
+        """
+        super().__init__(logging.DEBUG)
+        self.dump_dir = Path(dump_dir)
+        self.records = deque(maxlen=max_records)
+        self.frames = deque(maxlen=max_frames)
+        self.errors_seen = 0
+        self.dumps = 0
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        """Guarda el registro sin tomar el lock del handler (deque.append es atómico)."""
+        if record.levelno < self.level or not self.filter(record):
+            return False
+        self.emit(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        exc_text = None
+        if record.levelno >= logging.ERROR:
+            self.errors_seen += 1
+            if record.exc_info and record.exc_info[0] is not None:
+                exc_text = "".join(traceback.format_exception(*record.exc_info))
+        self.records.append((record.created, record.levelname, record.name, record.msg, record.args, exc_text))
+
+    def record_frame(self, *values) -> None:
+        """Guarda las métricas de un frame (valores en el orden de FRAME_FIELDS)."""
+        self.frames.append((time.time(),) + values)
+
+    @staticmethod
+    def _format_record(created, levelname, name, msg, args, exc_text) -> str:
+        try:
+            message = str(msg) % args if args else str(msg)
+        except (TypeError, ValueError):
+            message = f"{msg} {args}"
+        stamp = datetime.fromtimestamp(created).strftime("%H:%M:%S.%f")[:-3]
+        line = f"{stamp} {levelname:<8} {name} - {message}"
+        return line + "\n" + exc_text.rstrip() if exc_text else line
+
+    def dump(self, reason: str, exc_info=None) -> Optional[Path]:
+        """
+        Escribe el contenido de los buffers en un archivo nuevo del directorio de volcados.
+
+        Args:
+            reason: Motivo del volcado (se escribe en la cabecera)
+            exc_info: Tupla de sys.exc_info() de la excepción que lo provoca (opcional)
+
+        Returns:
+            Ruta del archivo escrito, o None si no se pudo escribir
+        """
+        now = datetime.now()
+        path = self.dump_dir / f"flight_{now:%Y%m%d_%H%M%S}_{self.dumps}.log"
+        try:
+            self.dump_dir.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(f"=== VOLCADO DEL GRABADOR DE VUELO ===\n")
+                f.write(f"Fecha: {now.isoformat(timespec='seconds')}\nMotivo: {reason}\n")
+                f.write(f"Errores registrados: {self.errors_seen}\n")
+                if exc_info is not None and exc_info[0] is not None:
+                    f.write("\n=== EXCEPCIÓN ===\n")
+                    f.write("".join(traceback.format_exception(*exc_info)))
+                f.write(f"\n=== ÚLTIMOS {len(self.records)} REGISTROS ===\n")
+                for record in list(self.records):
+                    f.write(self._format_record(*record) + "\n")
+                f.write(f"\n=== ÚLTIMOS {len(self.frames)} FRAMES ===\n")
+                f.write("hora," + ",".join(FRAME_FIELDS) + "\n")
+                for frame in list(self.frames):
+                    stamp = datetime.fromtimestamp(frame[0]).strftime("%H:%M:%S.%f")[:-3]
+                    values = [f"{value:.3f}" if isinstance(value, float) else str(value) for value in frame[1:]]
+                    f.write(stamp + "," + ",".join(values) + "\n")
+        except OSError:
+            return None
+        self.dumps += 1
+        return path
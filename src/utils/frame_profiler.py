@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Profiler de frames para PyGame Shooter
+Autor: Kava
+Fecha: 2024-12-19
+Descripción: Mide cada frame por fases (eventos, jugador, enemigos, colisiones, render, HUD,
+flip...) y guarda los tiempos en buffers circulares de tamaño fijo, de los que salen las medias
+y máximos móviles, el FPS y la gráfica de tiempo de frame del overlay de depuración (F1).
+"""
+
+import time
+from typing import Dict, Sequence
+
+import numpy as np
+
+# Fases que mide GameLoop, en el orden en que ocurren dentro de un frame
+FRAME_PHASES = ("events", "player", "enemies", "projectiles", "powerups", "collisions", "spawn",
+                "render", "hud", "flip")
+
+
+class _Section:
+    """Context manager reutilizable que suma el tiempo de una fase al frame actual."""
+
+    __slots__ = ("_totals", "_index", "_start")
+
+    def __init__(self, totals: list, index: int):
+        self._totals = totals
+        self._index = index
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self._totals[self._index] += time.perf_counter() - self._start
+        return False
+
+
+class FrameProfiler:
+    """
+    Profiler por fases con buffers circulares.
+
+    Una fase puede medirse varias veces por frame (p. ej. varios pasos de simulación):
+    los tiempos se suman y se guardan al cerrar el frame con end_frame().
+    """
+
+    def __init__(self, phases: Sequence[str] = FRAME_PHASES, capacity: int = 240):
+        """
+        Inicializa el profiler.
+
+        Args:
+            phases: Nombres de las fases a medir
+            capacity: Frames que se conservan en los buffers circulares
+        """
+        self.phases = tuple(phases)
+        self.capacity = capacity
+        # Fila por fase más la fila del frame completo, en milisegundos
+        self.samples = np.zeros((len(self.phases) + 1, capacity))
+        # Tiempo entre inicios de frame (incluye la espera de clock.tick) para el FPS
+        self.periods = np.zeros(capacity)
+        self.index = 0
+        self.count = 0
+        self._totals = [0.0] * len(self.phases)
+        self._sections = {name: _Section(self._totals, i) for i, name in enumerate(self.phases)}
+        self._frame_start = None
+        self._last_frame_start = None
+
+    def section(self, phase: str) -> _Section:
+        """Retorna el context manager que mide la fase indicada (`with profiler.section("hud"):`)."""
+        return self._sections[phase]
+
+    def begin_frame(self) -> None:
+        """Marca el inicio de un frame."""
+        now = time.perf_counter()
+        if self._last_frame_start is not None:
+            self.periods[self.index] = (now - self._last_frame_start) * 1000
+        else:
+            self.periods[self.index] = 0.0
+        self._last_frame_start = now
+        self._frame_start = now
+        # Descartar lo medido fuera de un frame (p. ej. pasos del modo sin ventana)
+        for i in range(len(self._totals)):
+            self._totals[i] = 0.0
+
+    def end_frame(self) -> None:
+        """Cierra el frame: guarda los tiempos de cada fase y del frame completo en los buffers."""
+        if self._frame_start is None:
+            return
+        column = self.samples[:, self.index]
+        column[:-1] = self._totals
+        column[-1] = (time.perf_counter() - self._frame_start) * 1000
+        column[:-1] *= 1000
+        self._frame_start = None
+        self.index = (self.index + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def pause(self) -> None:
+        """Olvida el inicio del último frame (tras un menú, para no contar la espera como frame)."""
+        self._last_frame_start = None
+        self._frame_start = None
+
+    def _filled(self, rows: np.ndarray) -> np.ndarray:
+        return rows[..., :self.count] if self.count < self.capacity else rows
+
+    def averages(self) -> Dict[str, float]:
+        """Media móvil en ms de cada fase y del frame completo ('frame')."""
+        if not self.count:
+            return dict.fromkeys(self.phases + ("frame",), 0.0)
+        means = self._filled(self.samples).mean(axis=1)
+        return dict(zip(self.phases + ("frame",), means.tolist()))
+
+    def maxima(self) -> Dict[str, float]:
+        """Máximo móvil en ms de cada fase y del frame completo ('frame')."""
+        if not self.count:
+            return dict.fromkeys(self.phases + ("frame",), 0.0)
+        maxima = self._filled(self.samples).max(axis=1)
+        return dict(zip(self.phases + ("frame",), maxima.tolist()))
+
+    def frame_times(self) -> np.ndarray:
+        """Tiempos de frame en ms, del más antiguo al más reciente."""
+        if self.count < self.capacity:
+            return self.samples[-1, :self.count].copy()
+        return np.roll(self.samples[-1], -self.index)
+
+    @property
+    def last_frame_ms(self) -> float:
+        """Tiempo en ms del último frame cerrado (0.0 si aún no hay ninguno)."""
+        if not self.count:
+            return 0.0
+        return float(self.samples[-1, self.index - 1])
+
+    @property
+    def fps(self) -> float:
+        """FPS medio según el tiempo entre inicios de frame."""
+        periods = self._filled(self.periods)
+        periods = periods[periods > 0]
+        if not len(periods):
+            return 0.0
+        return 1000.0 / float(periods.mean())
@@ -1,6 +1,28 @@
 import pygame
 import os
 import sys
+import json
+
+# Caché global de animaciones: (carpeta, animación, nº frames, alpha) -> lista de frames.
+# Todas las entidades comparten las mismas superficies, cada animación se decodifica una sola vez.
+_animation_cache = {}
+# Caché de frames pre-escalados: (clave de animación, (ancho, alto), volteado) -> lista de frames.
+_scaled_animation_cache = {}
+# Caché de conjuntos de frames por orientación (ver FacingFrames)
+_facing_animation_cache = {}
+
+# Atlas generados por tools/build_atlas.py: carpeta de personaje -> TextureAtlas (o None)
+ATLAS_DIR = os.path.join("assets", "atlases")
+_atlas_cache = {}
+
+# Imágenes sueltas (UI, proyectiles, fondos): (ruta, alpha) -> Surface convertida
+_image_cache = {}
+# Imágenes decodificadas en segundo plano (AssetPreloader): ruta -> (Surface, ya convertida)
+_decoded_images = {}
+
+# Índices de orientación para FacingFrames
+FACING_RIGHT = 0
+FACING_LEFT = 1
 
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
@@ -12,9 +34,56 @@ def resource_path(relative_path):
 
     return os.path.join(base_path, relative_path)
 
+def _decoded_key(path):
+    return os.path.normcase(os.path.abspath(resource_path(path)))
+
+def decode_image(path):
+    """Decodifica una imagen sin convertirla. Seguro para usar desde un hilo de carga."""
+    return pygame.image.load(resource_path(path))
+
+def register_decoded_image(path, surface):
+    """Deja una imagen ya decodificada para que el próximo load_image solo tenga que convertirla."""
+    _decoded_images[_decoded_key(path)] = (surface, False)
+
+def convert_decoded_image(path):
+    """Convierte (convert_alpha) una imagen pre-decodificada. Debe llamarse desde el hilo principal."""
+    key = _decoded_key(path)
+    entry = _decoded_images.get(key)
+    if entry is not None and not entry[1]:
+        _decoded_images[key] = (entry[0].convert_alpha(), True)
+
+def discard_decoded_image(path):
+    """Descarta la imagen pre-decodificada de path si sigue pendiente (p. ej. porque ya estaba en caché)."""
+    _decoded_images.pop(_decoded_key(path), None)
+
+def is_image_cached(path, alpha=True):
+    """Indica si load_cached_image(path, alpha) ya no necesita cargar nada."""
+    return (path, alpha) in _image_cache
+
+def is_animation_cached(base_folder, animation_name, num_frames, size, alpha=True):
+    """Indica si load_facing_animation_frames con estos argumentos ya no necesita cargar nada."""
+    key = (os.path.normpath(base_folder), animation_name, num_frames, alpha, _normalize_size(size))
+    return key in _facing_animation_cache
+
+def take_preloaded_image(path, alpha=True):
+    """
+    Retira la imagen precargada de path lista para usar (convertida), o retorna None
+    si el precargador no la ha decodificado.
+    """
+    entry = _decoded_images.pop(_decoded_key(path), None)
+    if entry is None:
+        return None
+    image, converted_alpha = entry
+    if alpha:
+        return image if converted_alpha else image.convert_alpha()
+    return image.convert()
+
 def load_image(path, alpha=True):
     full_path = resource_path(path)
     try:
+        image = take_preloaded_image(full_path, alpha)
+        if image is not None:
+            return image
         image = pygame.image.load(full_path)
         if alpha:
             image = image.convert_alpha()
@@ -25,25 +94,158 @@ def load_image(path, alpha=True):
         print(f"No se pudo cargar la imagen: {full_path}")
         raise SystemExit(message)
 
+def load_cached_image(path, alpha=True):
+    """Carga una imagen suelta una sola vez por proceso (UI, proyectiles, fondos)."""
+    key = (path, alpha)
+    image = _image_cache.get(key)
+    if image is None:
+        image = load_image(path, alpha)
+        _image_cache[key] = image
+    return image
+
 def load_animation_frames(base_folder, animation_name, num_frames, alpha=True):
+    """
+    Carga los frames de una animación usando la caché compartida del proceso.
+
+    La lista devuelta es compartida entre todas las entidades: no debe modificarse.
+    """
+    key = (os.path.normpath(base_folder), animation_name, num_frames, alpha)
+    frames = _animation_cache.get(key)
+    if frames is None:
+        frames = _load_animation_frames_from_disk(base_folder, animation_name, num_frames, alpha)
+        _animation_cache[key] = frames
+    return frames
+
+def _normalize_size(size):
+    if isinstance(size, (int, float)):
+        return (int(size), int(size))
+    return (int(size[0]), int(size[1]))
+
+def load_scaled_animation_frames(base_folder, animation_name, num_frames, size, alpha=True, flip_x=False):
+    """
+    Carga los frames de una animación ya escalados al tamaño de render de la entidad.
+
+    size puede ser un entero (sprite cuadrado) o una tupla (ancho, alto). El escalado
+    se hace una sola vez por (animación, tamaño), así draw() solo necesita un blit.
+    Con flip_x=True devuelve la variante espejada, generada a partir de la escalada.
+    """
+    size = _normalize_size(size)
+    key = ((os.path.normpath(base_folder), animation_name, num_frames, alpha), size, flip_x)
+    frames = _scaled_animation_cache.get(key)
+    if frames is None:
+        if flip_x:
+            source_frames = load_scaled_animation_frames(base_folder, animation_name, num_frames, size, alpha)
+            frames = [pygame.transform.flip(frame, True, False) for frame in source_frames]
+        else:
+            source_frames = load_animation_frames(base_folder, animation_name, num_frames, alpha)
+            frames = [pygame.transform.scale(frame, size) for frame in source_frames]
+        _scaled_animation_cache[key] = frames
+    return frames
+
+class FacingFrames:
+    """
+    Frames pre-escalados de una animación indexados por orientación.
+
+    frames[FACING_RIGHT] es la animación original y frames[FACING_LEFT] la espejada,
+    que solo se genera la primera vez que se pide y se conserva durante todo el proceso.
+    """
+
+    __slots__ = ("_args", "_variants")
+
+    def __init__(self, base_folder, animation_name, num_frames, size, alpha=True):
+        self._args = (base_folder, animation_name, num_frames, size, alpha)
+        self._variants = [load_scaled_animation_frames(*self._args), None]
+
+    def __getitem__(self, facing):
+        frames = self._variants[facing]
+        if frames is None:
+            frames = load_scaled_animation_frames(*self._args, flip_x=True)
+            self._variants[facing] = frames
+        return frames
+
+    def __len__(self):
+        return len(self._variants[FACING_RIGHT])
+
+def load_facing_animation_frames(base_folder, animation_name, num_frames, size, alpha=True):
+    """Retorna el FacingFrames compartido para (animación, tamaño)."""
+    size = _normalize_size(size)
+    key = (os.path.normpath(base_folder), animation_name, num_frames, alpha, size)
+    facing_frames = _facing_animation_cache.get(key)
+    if facing_frames is None:
+        facing_frames = FacingFrames(base_folder, animation_name, num_frames, size, alpha)
+        _facing_animation_cache[key] = facing_frames
+    return facing_frames
+
+def _atlas_index_path(base_folder):
+    return resource_path(os.path.join(ATLAS_DIR, os.path.basename(os.path.normpath(base_folder)), "atlas.json"))
+
+def get_character_atlas(base_folder):
+    """Retorna el atlas de una carpeta de personaje o None si no se ha generado."""
+    from utils.sprite_sheet import TextureAtlas
+
+    folder_key = os.path.normpath(base_folder)
+    if folder_key not in _atlas_cache:
+        index_path = _atlas_index_path(base_folder)
+        _atlas_cache[folder_key] = TextureAtlas(index_path) if os.path.exists(index_path) else None
+    return _atlas_cache[folder_key]
+
+def _resolve_frame_path(base_folder, animation_name, frame_number):
+    # Intentar cargar desde un subdirectorio (ej. assets/images/characters/guerrero/idle/Idle (1).png)
+    frame_path_in_subfolder = os.path.join(base_folder, animation_name.lower(), f"{animation_name} ({frame_number}).png")
+    if os.path.exists(resource_path(frame_path_in_subfolder)):
+        return frame_path_in_subfolder
+    # Intentar cargar directamente desde la carpeta base (ej. assets/images/characters/adventureguirl/Idle (1).png)
+    frame_path_in_base_folder = os.path.join(base_folder, f"{animation_name} ({frame_number}).png")
+    if os.path.exists(resource_path(frame_path_in_base_folder)):
+        return frame_path_in_base_folder
+    return None
+
+def get_animation_source_paths(base_folder, animation_name, num_frames):
+    """
+    Retorna los ficheros que hay que decodificar para cargar una animación:
+    las páginas del atlas si existe, o los PNG de cada frame.
+    """
+    index_path = _atlas_index_path(base_folder)
+    if os.path.exists(index_path):
+        with open(index_path, "r", encoding="utf-8") as f:
+            index_data = json.load(f)
+        if animation_name in index_data.get("animations", {}):
+            atlas_dir = os.path.dirname(index_path)
+            return [os.path.join(atlas_dir, page) for page in index_data.get("pages", [])]
+    paths = [_resolve_frame_path(base_folder, animation_name, i) for i in range(1, num_frames + 1)]
+    return [path for path in paths if path]
+
+def _load_animation_frames_from_disk(base_folder, animation_name, num_frames, alpha=True):
+    # Preferir el atlas (una apertura de fichero por página) si existe y tiene todos los frames
+    atlas = get_character_atlas(base_folder) if alpha else None
+    if atlas and atlas.has_animation(animation_name):
+        frames = atlas.get_animation_frames(animation_name, num_frames)
+        if len(frames) == num_frames:
+            return frames
+
     frames = []
     for i in range(1, num_frames + 1):
-        # Intentar cargar desde un subdirectorio (ej. assets/images/characters/guerrero/idle/Idle (1).png)
-        animation_folder_path = os.path.join(base_folder, animation_name.lower())
-        frame_path_in_subfolder = os.path.join(animation_folder_path, f"{animation_name} ({i}).png")
-        
-        # Intentar cargar directamente desde la carpeta base (ej. assets/images/characters/adventureguirl/Idle (1).png)
-        frame_path_in_base_folder = os.path.join(base_folder, f"{animation_name} ({i}).png")
-
+        frame_path = _resolve_frame_path(base_folder, animation_name, i)
         try:
-            if os.path.exists(resource_path(frame_path_in_subfolder)):
-                frames.append(load_image(frame_path_in_subfolder, alpha))
-            elif os.path.exists(resource_path(frame_path_in_base_folder)):
-                frames.append(load_image(frame_path_in_base_folder, alpha))
+            if frame_path:
+                frames.append(load_image(frame_path, alpha))
             else:
-                print(f"Advertencia: No se encontró el frame {i} para la animación {animation_name} en {base_folder}. Intentando {frame_path_in_subfolder} y {frame_path_in_base_folder}")
+                print(f"Advertencia: No se encontró el frame {i} para la animación {animation_name} en {base_folder}.")
                 continue
         except SystemExit:
             # load_image ya imprime un error, así que solo continuamos
             continue
     return frames
+
+def clear_animation_cache():
+    """Vacía la caché compartida de animaciones (p. ej. tras cambiar el modo de vídeo)."""
+    _animation_cache.clear()
+    _scaled_animation_cache.clear()
+    _facing_animation_cache.clear()
+    _atlas_cache.clear()
+    _image_cache.clear()
+    _decoded_images.clear()
+
+def get_animation_cache_size():
+    """Retorna el número de animaciones en caché (originales y pre-escaladas)."""
+    return len(_animation_cache) + len(_scaled_animation_cache)
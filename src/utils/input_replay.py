@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Grabación y reproducción de entrada para PyGame Shooter
+Autor: Kava
+Fecha: 2024-12-19
+Descripción: Graba por paso de simulación las teclas de movimiento pulsadas y los eventos
+de juego (clics con posición, teclas, salida) junto con la semilla aleatoria de la partida,
+y los reproduce exactamente para comparar tiempos de frame entre versiones.
+"""
+
+import gzip
+import json
+import os
+import random
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+from utils.advanced_logger import get_logger
+
+REPLAY_VERSION = 1
+
+# Teclas cuyo estado se graba en cada paso (las que consulta Player.update)
+RECORDED_KEYS = (pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s,
+                 pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN, pygame.K_SPACE)
+
+
+class ReplayKeys:
+    """Sustituto de pygame.key.get_pressed() con el estado grabado de RECORDED_KEYS."""
+
+    __slots__ = ("_pressed",)
+
+    def __init__(self, mask: int = 0):
+        self._pressed = frozenset(key for bit, key in enumerate(RECORDED_KEYS) if mask & (1 << bit))
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self._pressed
+
+
+def _keys_to_mask(keys) -> int:
+    """Comprime el estado de RECORDED_KEYS en un entero (un bit por tecla)."""
+    mask = 0
+    for bit, key in enumerate(RECORDED_KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+
+def _serialize_event(event: pygame.event.Event) -> Optional[list]:
+    """Convierte un evento de juego en una lista JSON compacta (None si no se graba)."""
+    if event.type == pygame.QUIT:
+        return ["q"]
+    if event.type == pygame.KEYDOWN:
+        return ["k", event.key]
+    if event.type == pygame.MOUSEBUTTONDOWN:
+        x, y = event.pos
+        return ["m", x, y, getattr(event, "button", 1)]
+    return None
+
+
+def _deserialize_event(data: list) -> pygame.event.Event:
+    """Reconstruye el evento de pygame grabado por _serialize_event."""
+    if data[0] == "q":
+        return pygame.event.Event(pygame.QUIT)
+    if data[0] == "k":
+        return pygame.event.Event(pygame.KEYDOWN, key=data[1], mod=0, unicode="", scancode=0)
+    if data[0] == "m":
+        return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(data[1], data[2]), button=data[3])
+    raise ValueError(f"Evento de replay desconocido: {data}")
+
+
+class InputRecorder:
+    """
+    Graba la entrada de una partida paso a paso.
+
+    Los eventos llegan una vez por frame (GameLoop._handle_events) y se asignan al
+    siguiente paso de simulación, que es cuando su efecto llega a la simulación; así
+    la reproducción no depende de cuántos pasos hubo en cada frame.
+    """
+
+    def __init__(self, path: str, seed: Optional[int] = None, logger=None):
+        """
+        Inicializa el grabador.
+
+        Args:
+            path: Fichero de replay a escribir (JSON comprimido con gzip)
+            seed: Semilla aleatoria de la partida (se genera una al empezar si es None)
+            logger: Instancia del logger para debug (opcional, usa AdvancedLogger por defecto)
+        """
+        self.logger = logger or get_logger("PyGame")
+        self.path = path
+        self.seed = seed
+        self.started = False
+        self.character: Optional[str] = None
+        self.level = 1
+        self.key_masks: List[int] = []
+        self.events: Dict[int, list] = {}
+        self._pending_events: list = []
+
+    def start(self, character: str, level: int = 1) -> int:
+        """
+        Empieza a grabar una partida y siembra el generador aleatorio global.
+        Si se llama de nuevo (otra partida), la grabación anterior se descarta.
+
+        Args:
+            character: Personaje de la partida
+            level: Nivel inicial
+
+        Returns:
+            Semilla usada
+        """
+        if self.seed is None:
+            self.seed = random.randrange(2 ** 32)
+        random.seed(self.seed)
+        self.started = True
+        self.character = character
+        self.level = level
+        self.key_masks = []
+        self.events = {}
+        self._pending_events = []
+        self.logger.log_event(f"Grabación de entrada iniciada (semilla={self.seed})", "replay")
+        return self.seed
+
+    def record_events(self, events) -> None:
+        """Guarda los eventos de juego de un frame para el siguiente paso."""
+        for event in events:
+            data = _serialize_event(event)
+            if data is not None:
+                self._pending_events.append(data)
+
+    def record_step(self, keys) -> None:
+        """Graba el estado de teclas de un paso y los eventos pendientes."""
+        if self._pending_events:
+            self.events[len(self.key_masks)] = self._pending_events
+            self._pending_events = []
+        self.key_masks.append(_keys_to_mask(keys))
+
+    def save(self) -> None:
+        """Escribe el replay en disco."""
+        if not self.started:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = {
+            "version": REPLAY_VERSION,
+            "seed": self.seed,
+            "character": self.character,
+            "level": self.level,
+            "keys": self.key_masks,
+            "events": {str(step): events for step, events in self.events.items()}
+        }
+        with gzip.open(self.path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        self.logger.log_event(f"Replay guardado en {self.path} ({len(self.key_masks)} pasos)", "replay")
+
+
+class InputReplayer:
+    """
+    Reproduce un fichero grabado por InputRecorder paso a paso.
+
+    Solo se graba la entrada de la partida: lo que se elige en los menús (mejoras de fin de
+    nivel, pausa) no forma parte del replay. El driver (headless.py --replay) continúa al
+    siguiente nivel sin mejoras, igual que al grabar en modo sin ventana.
+    """
+
+    def __init__(self, path: str):
+        """
+        Carga un replay.
+
+        Args:
+            path: Fichero de replay escrito por InputRecorder.save()
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != REPLAY_VERSION:
+            raise ValueError(f"Versión de replay no soportada: {data.get('version')}")
+        self.path = path
+        self.seed: int = data["seed"]
+        self.character: str = data["character"]
+        self.level: int = data.get("level", 1)
+        self.key_masks: List[int] = data["keys"]
+        self.events: Dict[int, list] = {int(step): events for step, events in data["events"].items()}
+
+    def start(self) -> None:
+        """Siembra el generador aleatorio global con la semilla grabada."""
+        random.seed(self.seed)
+
+    def frame(self, step: int) -> Tuple[ReplayKeys, List[pygame.event.Event]]:
+        """
+        Retorna la entrada del paso indicado.
+
+        Returns:
+            (teclas, eventos): estado de teclas para Player.update y eventos a pasar a
+            GameLoop._handle_events antes del paso
+        """
+        events = [_deserialize_event(data) for data in self.events.get(step, [])]
+        return ReplayKeys(self.key_masks[step]), events
+
+    def __len__(self) -> int:
+        """Número de pasos grabados."""
+        return len(self.key_masks)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Cola de render por capas para PyGame Shooter
+Autor: Kava
+Fecha: 2024-12-19
+Descripción: Durante el frame las entidades encolan pares (superficie, posición) en su capa y,
+al final, cada capa se envía con una sola llamada a Surface.fblits (o Surface.blits si la versión
+de pygame no la tiene) en lugar de un screen.blit por entidad desde Python. Las primitivas de
+pygame.draw (círculos de powerups, escudo...) se encolan como llamadas diferidas y se ejecutan
+tras los blits de su capa.
+"""
+
+from typing import Callable, List, Tuple
+
+import pygame
+
+# Capas en orden de dibujo (mismo orden que el render por entidad, con las barras de vida
+# por encima de todos los enemigos)
+LAYER_PLAYER = 0
+LAYER_ENEMIES = 1
+LAYER_HEALTH_BARS = 2
+LAYER_PROJECTILES = 3
+LAYER_POWERUPS = 4
+NUM_LAYERS = 5
+
+
+class RenderQueue:
+    """
+    Cola de blits agrupados por capa.
+
+    blits[capa] es una lista de (Surface, (x, y)) a la que se puede añadir directamente
+    (`queue.blits[LAYER_ENEMIES].append((image, (x, y)))`) en los bucles calientes.
+    """
+
+    def __init__(self, num_layers: int = NUM_LAYERS):
+        self.blits: List[List[Tuple[pygame.Surface, Tuple[float, float]]]] = [[] for _ in range(num_layers)]
+        self.draws: List[List[Tuple[Callable, tuple]]] = [[] for _ in range(num_layers)]
+
+    def add(self, surface: pygame.Surface, position, layer: int) -> None:
+        """Encola el blit de surface en position dentro de la capa indicada."""
+        self.blits[layer].append((surface, position))
+
+    def add_draw(self, layer: int, function: Callable, *args) -> None:
+        """Encola una llamada function(screen, *args) (p. ej. pygame.draw.circle) tras los blits de la capa."""
+        self.draws[layer].append((function, args))
+
+    def __len__(self) -> int:
+        """Número de blits encolados."""
+        return sum(len(layer) for layer in self.blits)
+
+    def flush(self, screen: pygame.Surface) -> None:
+        """Dibuja todas las capas en orden, con un único fblits/blits por capa, y vacía la cola."""
+        submit = getattr(screen, "fblits", None)
+        for blits, draws in zip(self.blits, self.draws):
+            if blits:
+                if submit is not None:
+                    submit(blits)
+                else:
+                    screen.blits(blits, False)
+                blits.clear()
+            if draws:
+                for function, args in draws:
+                    function(screen, *args)
+                draws.clear()
+
+    def clear(self) -> None:
+        """Descarta lo encolado sin dibujarlo."""
+        for layer in self.blits:
+            layer.clear()
+        for layer in self.draws:
+            layer.clear()
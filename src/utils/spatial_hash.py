@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Rejilla espacial uniforme para PyGame Shooter
+Autor: Kava
+Fecha: 2024-12-19
+Descripción: Divide el área de juego en celdas de tamaño fijo para responder rápidamente
+"qué objetos solapan este rectángulo" sin comparar cada proyectil con cada enemigo.
+"""
+
+from typing import Any, List
+
+import pygame
+
+
+class SpatialHashGrid:
+    """
+    Rejilla espacial uniforme sobre el área de juego.
+
+    Cada objeto se inserta con su rectángulo de colisión en todas las celdas que toca.
+    Los rectángulos que salen del área se asignan a las celdas del borde, así que las
+    consultas siguen siendo exactas fuera de pantalla (solo menos selectivas).
+    """
+
+    def __init__(self, width: int, height: int, cell_size: int):
+        """
+        Inicializa la rejilla.
+
+        Args:
+            width: Ancho del área de juego en píxeles
+            height: Alto del área de juego en píxeles
+            cell_size: Lado de cada celda (conviene que sea del orden del objeto más grande)
+        """
+        self.cell_size = cell_size
+        self.cols = max(1, -(-width // cell_size))
+        self.rows = max(1, -(-height // cell_size))
+        # Por celda, listas paralelas de rectángulos y objetos: las consultas usan
+        # Rect.collidelistall (en C) sobre los rectángulos de cada celda
+        self.cell_rects: List[List[pygame.Rect]] = [[] for _ in range(self.cols * self.rows)]
+        self.cell_objects: List[list] = [[] for _ in range(self.cols * self.rows)]
+        self.count = 0
+
+    def _cell_range(self, rect: pygame.Rect):
+        """Retorna (col0, col1, fila0, fila1) de las celdas que toca rect, limitadas al área."""
+        cell_size = self.cell_size
+        max_col = self.cols - 1
+        max_row = self.rows - 1
+        col0 = min(max(rect.left // cell_size, 0), max_col)
+        col1 = min(max((rect.right - 1) // cell_size, 0), max_col)
+        row0 = min(max(rect.top // cell_size, 0), max_row)
+        row1 = min(max((rect.bottom - 1) // cell_size, 0), max_row)
+        return col0, col1, row0, row1
+
+    def clear(self) -> None:
+        """Vacía todas las celdas."""
+        for cell in self.cell_rects:
+            cell.clear()
+        for cell in self.cell_objects:
+            cell.clear()
+        self.count = 0
+
+    def insert(self, obj: Any, rect: pygame.Rect) -> None:
+        """
+        Inserta un objeto con su rectángulo de colisión.
+
+        El rectángulo se guarda por referencia: si el objeto se mueve hay que
+        eliminarlo y volver a insertarlo (o reconstruir la rejilla).
+        """
+        col0, col1, row0, row1 = self._cell_range(rect)
+        cell_rects = self.cell_rects
+        cell_objects = self.cell_objects
+        cols = self.cols
+        for row in range(row0, row1 + 1):
+            base = row * cols
+            for index in range(base + col0, base + col1 + 1):
+                cell_rects[index].append(rect)
+                cell_objects[index].append(obj)
+        self.count += 1
+
+    def remove(self, obj: Any, rect: pygame.Rect) -> None:
+        """Elimina un objeto insertado con rect (que no debe haber cambiado desde insert)."""
+        col0, col1, row0, row1 = self._cell_range(rect)
+        removed = False
+        cols = self.cols
+        for row in range(row0, row1 + 1):
+            base = row * cols
+            for index in range(base + col0, base + col1 + 1):
+                objects = self.cell_objects[index]
+                for i, other in enumerate(objects):
+                    if other is obj:
+                        del objects[i]
+                        del self.cell_rects[index][i]
+                        removed = True
+                        break
+        if removed:
+            self.count -= 1
+
+    def rebuild(self, objects, rect_attr: str = "collision_box") -> None:
+        """
+        Vacía la rejilla e inserta todos los objetos (una vez por frame, tras moverlos).
+
+        Args:
+            objects: Objetos a insertar
+            rect_attr: Atributo con el pygame.Rect de colisión de cada objeto
+        """
+        self.clear()
+        for obj in objects:
+            self.insert(obj, getattr(obj, rect_attr))
+
+    def query(self, rect: pygame.Rect) -> list:
+        """
+        Retorna los objetos cuyo rectángulo solapa con rect (sin duplicados).
+
+        El orden es el de inserción dentro de cada celda, recorriendo las celdas por filas.
+        """
+        cell_size = self.cell_size
+        left, top, width, height = rect
+        col0 = left // cell_size
+        row0 = top // cell_size
+        col1 = (left + width - 1) // cell_size
+        row1 = (top + height - 1) // cell_size
+        if col0 < 0 or row0 < 0 or col1 >= self.cols or row1 >= self.rows:
+            # Fuera del área: limitar a las celdas del borde
+            col0, col1, row0, row1 = self._cell_range(rect)
+        if col0 == col1 and row0 == row1:
+            # Caso habitual (proyectiles pequeños): una sola celda, sin duplicados posibles
+            index = row0 * self.cols + col0
+            objects = self.cell_objects[index]
+            return [objects[i] for i in rect.collidelistall(self.cell_rects[index])]
+
+        # Varias celdas: un solo collidelistall sobre la unión y quitar duplicados
+        # (un objeto grande aparece en todas las celdas que toca)
+        rects = []
+        objects = []
+        cols = self.cols
+        for row in range(row0, row1 + 1):
+            base = row * cols
+            for index in range(base + col0, base + col1 + 1):
+                rects += self.cell_rects[index]
+                objects += self.cell_objects[index]
+        return list(dict.fromkeys([objects[i] for i in rect.collidelistall(rects)]))
+
+    def __len__(self) -> int:
+        """Número de objetos insertados."""
+        return self.count
+
+    def __str__(self) -> str:
+        """Representación en string de la rejilla."""
+        return f"SpatialHashGrid({self.cols}x{self.rows} celdas de {self.cell_size}px, {self.count} objetos)"
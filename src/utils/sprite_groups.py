@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Integración con pygame.sprite para PyGame Shooter
+Autor: Kava
+Fecha: 2024-12-19
+Descripción: Jugador, enemigos, proyectiles y powerups son DirtySprite (image/rect siempre al día).
+Este módulo mantiene grupos de pygame.sprite sincronizados con las listas del GameLoop, ofrece un
+renderer basado en LayeredDirty (RENDER_MODE = "sprites") y el paso de groupcollide a los pares
+(ia, ib) de utils.collision (COLLISION_ENGINE = "groups").
+"""
+
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pygame
+
+
+def sync_group(group: pygame.sprite.AbstractGroup, sprites: Iterable[pygame.sprite.Sprite]) -> None:
+    """
+    Deja en group exactamente los sprites dados, sin vaciarlo: quita los que ya no están y
+    añade los nuevos en el orden recibido (el orden del grupo sigue al de las listas).
+
+    Args:
+        group: Grupo a sincronizar
+        sprites: Sprites que deben estar en el grupo
+    """
+    sprites = list(sprites)
+    members = group.spritedict
+    current = set(sprites)
+    stale = [sprite for sprite in members if sprite not in current]
+    if stale:
+        group.remove(*stale)
+    new = [sprite for sprite in sprites if sprite not in members]
+    if new:
+        group.add(*new)
+
+
+def collide_boxes(a, b) -> bool:
+    """Función collided para spritecollide/groupcollide: usa las cajas de colisión, no los rect de dibujo."""
+    return a.get_collision_rect().colliderect(b.get_collision_rect())
+
+
+def group_overlaps(sprites_a: Sequence, group_a: pygame.sprite.AbstractGroup,
+                   sprites_b: Sequence, group_b: pygame.sprite.AbstractGroup) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pares solapados entre dos grupos con groupcollide, en el formato de utils.collision.find_overlaps.
+
+    Args:
+        sprites_a, sprites_b: Listas en el orden de los índices a devolver
+        group_a, group_b: Grupos sincronizados con esas listas
+
+    Returns:
+        (ia, ib): índices en sprites_a y sprites_b, ordenados por ia y después por ib
+    """
+    collisions = pygame.sprite.groupcollide(group_a, group_b, False, False, collide_boxes)
+    if not collisions:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+    index_b = {sprite: i for i, sprite in enumerate(sprites_b)}
+    ia: List[int] = []
+    ib: List[int] = []
+    for i, sprite in enumerate(sprites_a):
+        hits = collisions.get(sprite)
+        if hits:
+            for j in sorted(index_b[hit] for hit in hits):
+                ia.append(i)
+                ib.append(j)
+    return np.array(ia, dtype=np.intp), np.array(ib, dtype=np.intp)
+
+
+class SpriteGroupRenderer:
+    """
+    Render de la partida con un grupo LayeredDirty.
+
+    Misma interfaz que DirtyRectRenderer (set_background, invalidate, erase, present) más
+    draw_sprites(). LayeredDirty borra y redibuja los sprites y decide por sí mismo entre
+    actualizar rectángulos o hacer flip(); lo que se dibuja fuera del grupo (HUD, lote de
+    proyectiles NumPy, overlays) se pasa a present() y se repinta desde el fondo en el frame
+    siguiente.
+    """
+
+    def __init__(self, screen: pygame.Surface, background: Optional[pygame.Surface] = None):
+        """
+        Inicializa el renderer.
+
+        Args:
+            screen: Superficie de la pantalla
+            background: Fondo con el que se borra (negro si es None)
+        """
+        self.screen = screen
+        self.screen_rect = screen.get_rect()
+        self.group = pygame.sprite.LayeredDirty()
+        self._sprite_rects: List[pygame.Rect] = []
+        self.set_background(background)
+        # Estadísticas para los benchmarks (mismas que DirtyRectRenderer)
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.last_dirty_ratio = 1.0
+
+    def set_background(self, background: Optional[pygame.Surface]) -> None:
+        """Cambia el fondo con el que se borra; el próximo frame se redibuja completo."""
+        if background is None:
+            background = pygame.Surface(self.screen_rect.size).convert()
+            background.fill((0, 0, 0))
+        self.background = background
+        self.group.clear(self.screen, background)
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Hace que el próximo frame repinte toda la pantalla."""
+        self.group.repaint_rect(self.screen_rect)
+
+    def erase(self) -> None:
+        """Nada que hacer: LayeredDirty borra dentro de draw_sprites()."""
+
+    def draw_sprites(self, entities: Iterable) -> None:
+        """
+        Sincroniza el grupo con las entidades y lo dibuja.
+
+        Args:
+            entities: Entidades con atributo render_sprites (la propia entidad y sus sprites
+                acompañantes: barra de vida, escudo...)
+        """
+        sync_group(self.group, (sprite for entity in entities for sprite in entity.render_sprites))
+        self._sprite_rects = self.group.draw(self.screen)
+
+    def present(self, rects: Iterable[Optional[pygame.Rect]]) -> None:
+        """
+        Presenta el frame.
+
+        Args:
+            rects: Rectángulos dibujados fuera del grupo en este frame (los None se ignoran)
+        """
+        screen_rect = self.screen_rect
+        overlays = [screen_rect.clip(rect) for rect in rects if rect]
+        overlays = [rect for rect in overlays if rect.width and rect.height]
+        dirty = self._sprite_rects
+        if len(dirty) == 1 and dirty[0] == screen_rect:
+            # LayeredDirty ha redibujado la pantalla entera
+            pygame.display.flip()
+            self.full_frames += 1
+            self.last_dirty_ratio = 1.0
+        else:
+            dirty = dirty + overlays
+            pygame.display.update(dirty)
+            self.partial_frames += 1
+            self.last_dirty_ratio = sum(rect.width * rect.height for rect in dirty) / (screen_rect.width * screen_rect.height)
+        # Lo dibujado fuera del grupo se borra en el próximo draw() del grupo
+        for rect in overlays:
+            self.group.repaint_rect(rect)
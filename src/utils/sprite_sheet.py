@@ -9,8 +9,10 @@ Descripción: Manejo eficiente de spritesheets y animaciones con caché y loggin
 import pygame
 import os
 import sys
+import json
 from typing import List, Tuple, Optional, Dict
 from utils.advanced_logger import get_logger
+from utils.image_loader import take_preloaded_image
 
 # Añadir el directorio src al path para imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -41,7 +43,10 @@ class SpriteSheet:
         """Carga la imagen del spritesheet."""
         try:
             if os.path.exists(self.image_path):
-                self.sheet = pygame.image.load(self.image_path).convert_alpha()
+                # Reutilizar la carga hecha en segundo plano por AssetPreloader si la hay
+                self.sheet = take_preloaded_image(self.image_path)
+                if self.sheet is None:
+                    self.sheet = pygame.image.load(self.image_path).convert_alpha()
                 self.logger.log_debug(f"Spritesheet cargado: {self.image_path}", "spritesheet")
             else:
                 self.logger.log_error(f"Archivo de spritesheet no encontrado: {self.image_path}", "spritesheet")
@@ -162,6 +167,98 @@ class SpriteSheet:
         return f"SpriteSheet(path='{self.image_path}', cached_sprites={len(self.sprite_cache)}, sheet_size={self.sheet.get_size() if self.sheet else 'None'})"
 
 
+class TextureAtlas:
+    """
+    Atlas de animaciones generado por tools/build_atlas.py.
+    Cada página se carga como un SpriteSheet y los frames se recortan con get_sprite,
+    de modo que una animación completa se obtiene con una sola apertura de fichero por página.
+    """
+    
+    def __init__(self, index_path: str, logger=None):
+        """
+        Inicializa el atlas a partir de su índice JSON.
+        
+        Args:
+            index_path: Ruta al archivo atlas.json
+            logger: Instancia del logger para debug (opcional, usa AdvancedLogger por defecto)
+        """
+        self.logger = logger or get_logger("PyGame")
+        self.index_path = index_path
+        self.animations: Dict[str, Dict] = {}
+        self.pages: List[SpriteSheet] = []
+        
+        self._load_index()
+    
+    def _load_index(self) -> None:
+        """Carga el índice del atlas y las páginas que referencia."""
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index_data = json.load(f)
+            atlas_dir = os.path.dirname(self.index_path)
+            self.animations = index_data.get("animations", {})
+            self.pages = [SpriteSheet(os.path.join(atlas_dir, page), self.logger)
+                          for page in index_data.get("pages", [])]
+            self.logger.log_debug(f"Atlas cargado: {self.index_path} ({len(self.pages)} páginas)", "spritesheet")
+        except Exception as e:
+            self.logger.log_error(f"Error cargando atlas {self.index_path}: {e}", "spritesheet")
+            self.animations = {}
+            self.pages = []
+    
+    def has_animation(self, animation_name: str) -> bool:
+        """Indica si el atlas contiene la animación."""
+        return animation_name in self.animations
+    
+    def get_frame_duration(self, animation_name: str, default: float = 0.1) -> float:
+        """Retorna la duración por frame de una animación en segundos."""
+        return self.animations.get(animation_name, {}).get("duration", default)
+    
+    def get_frame(self, animation_name: str, frame_number: int) -> Optional[pygame.Surface]:
+        """
+        Obtiene un frame del atlas con su tamaño original.
+        
+        Los frames se guardan recortados; aquí se recoloca el recorte en una superficie
+        del tamaño original para que escalar el frame dé el mismo resultado que el PNG suelto.
+        
+        Args:
+            animation_name: Nombre de la animación (ej: 'Idle')
+            frame_number: Número de frame empezando en 1
+            
+        Returns:
+            Superficie del frame o None si no existe
+        """
+        frame = self.animations.get(animation_name, {}).get("frames", {}).get(str(frame_number))
+        if not frame or frame["page"] >= len(self.pages):
+            return None
+        
+        x, y, width, height = frame["rect"]
+        sprite = self.pages[frame["page"]].get_sprite(x, y, width, height,
+                                                      cache_key=f"{animation_name}_{frame_number}")
+        if sprite is None:
+            return None
+        
+        image = pygame.Surface(frame["source_size"], pygame.SRCALPHA, 32).convert_alpha()
+        image.blit(sprite, frame["offset"])
+        return image
+    
+    def get_animation_frames(self, animation_name: str, num_frames: int) -> List[pygame.Surface]:
+        """
+        Obtiene los frames 1..num_frames de una animación.
+        
+        Returns:
+            Lista de frames (puede tener menos de num_frames si faltan en el atlas)
+        """
+        frames = []
+        for frame_number in range(1, num_frames + 1):
+            image = self.get_frame(animation_name, frame_number)
+            if image is not None:
+                frames.append(image)
+        return frames
+    
+    def __str__(self) -> str:
+        """Representación en string del atlas."""
+        return f"TextureAtlas(index='{self.index_path}', pages={len(self.pages)}, animations={len(self.animations)})"
+
+
 class AnimationManager:
     """
     Gestor de animaciones basado en spritesheets.
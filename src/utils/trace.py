@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Canales de traza para PyGame Shooter
+Autor: Kava
+Fecha: 2024-12-19
+Descripción: Trazas de depuración por canales con nombre ("loop", "draw", "save"...) que se
+activan con la variable de entorno PYGAME_TRACE o con --trace. Un canal desactivado no formatea
+ni escribe nada; uno activo escribe en un sink con buffer (stdout o un archivo).
+
+Uso:
+    from utils.trace import get_channel
+    _trace_draw = get_channel("draw")
+    ...
+    if _trace_draw.enabled:  # en rutas calientes: ni siquiera se hace la llamada
+        _trace_draw("Dibujando enemigo en (%s,%s)", self.x, self.y)
+
+    PYGAME_TRACE=draw,save python src/main.py
+    python src/main.py --trace all --trace-file logs/trace.log
+"""
+
+import atexit
+import os
+import sys
+from typing import Dict, List, Optional, TextIO
+
+# Canales activos al arrancar: PYGAME_TRACE=loop,draw (o "all"); PYGAME_TRACE_FILE=ruta
+TRACE_ENV = "PYGAME_TRACE"
+TRACE_FILE_ENV = "PYGAME_TRACE_FILE"
+
+# Canales que usa el juego (se pueden crear otros con get_channel)
+TRACE_CHANNELS = {
+    "loop": "Estado del bucle principal en cada iteración",
+    "draw": "Dibujo de cada entidad (jugador, enemigos, proyectiles, powerups, barras de vida)",
+    "entity": "Creación de entidades",
+    "save": "Guardado y carga de partidas (incluye el contenido guardado)",
+    "menu": "Construcción y acciones de los menús",
+}
+
+
+class TraceSink:
+    """Acumula líneas en memoria y las escribe de golpe al llenarse el buffer o al hacer flush()."""
+
+    def __init__(self, stream: Optional[TextIO] = None, path: Optional[str] = None, max_lines: int = 512):
+        """
+        Inicializa el sink.
+
+        Args:
+            stream: Stream de salida (stdout por defecto)
+            path: Archivo donde escribir en lugar de stream (opcional)
+            max_lines: Líneas acumuladas antes de escribir
+        """
+        self.path = path
+        self._owns_stream = path is not None
+        if path is not None:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            stream = open(path, "a", encoding="utf-8")
+        self.stream = stream if stream is not None else sys.stdout
+        self.max_lines = max_lines
+        self._lines: List[str] = []
+
+    def write(self, line: str) -> None:
+        lines = self._lines
+        lines.append(line)
+        if len(lines) >= self.max_lines:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._lines:
+            return
+        text = "\n".join(self._lines) + "\n"
+        self._lines.clear()
+        try:
+            self.stream.write(text)
+            self.stream.flush()
+        except (OSError, ValueError):
+            pass
+
+    def close(self) -> None:
+        self.flush()
+        if self._owns_stream:
+            self.stream.close()
+
+
+class TraceChannel:
+    """
+    Canal de traza con nombre. Se llama como una función con una plantilla y sus
+    argumentos; la plantilla solo se formatea si el canal está activo.
+    """
+
+    __slots__ = ("name", "enabled")
+
+    def __init__(self, name: str, enabled: bool = False):
+        self.name = name
+        self.enabled = enabled
+
+    def __call__(self, message: str, *args) -> None:
+        if not self.enabled:
+            return
+        if args:
+            message = message % args
+        _sink.write(f"[{self.name}] {message}")
+
+    def __repr__(self) -> str:
+        return f"TraceChannel({self.name!r}, enabled={self.enabled})"
+
+
+_channels: Dict[str, TraceChannel] = {}
+_enabled_names: set = set()
+_all_enabled = False
+_sink = TraceSink()
+
+
+def get_channel(name: str) -> TraceChannel:
+    """
+    Obtiene (o crea) el canal con ese nombre. Siempre es el mismo objeto, así que se puede
+    guardar a nivel de módulo y configure() lo activa o desactiva después.
+    """
+    channel = _channels.get(name)
+    if channel is None:
+        channel = _channels[name] = TraceChannel(name, _all_enabled or name in _enabled_names)
+    return channel
+
+
+def configure(spec: Optional[str] = None, path: Optional[str] = None) -> List[str]:
+    """
+    Activa los canales indicados y desactiva el resto.
+
+    Args:
+        spec: Nombres separados por comas, "all" para todos o "" para ninguno
+              (por defecto, la variable de entorno PYGAME_TRACE)
+        path: Archivo donde escribir las trazas (por defecto PYGAME_TRACE_FILE o stdout)
+
+    Returns:
+        Nombres de los canales activados
+    """
+    global _all_enabled, _sink
+    if spec is None:
+        spec = os.environ.get(TRACE_ENV, "")
+    if path is None:
+        path = os.environ.get(TRACE_FILE_ENV) or None
+    names = {name.strip() for name in spec.split(",") if name.strip()}
+    _all_enabled = "all" in names
+    _enabled_names.clear()
+    _enabled_names.update(names - {"all"})
+    for name, channel in _channels.items():
+        channel.enabled = _all_enabled or name in _enabled_names
+    if path != _sink.path:
+        _sink.close()
+        _sink = TraceSink(path=path)
+    return sorted(TRACE_CHANNELS) if _all_enabled else sorted(_enabled_names)
+
+
+def flush() -> None:
+    """Escribe las trazas pendientes en el sink."""
+    _sink.flush()
+
+
+def _close_sink() -> None:
+    _sink.close()
+
+
+configure()
+atexit.register(_close_sink)
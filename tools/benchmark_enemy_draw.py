@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark del dibujado de enemigos
+Autor: Kava
+Fecha: 2024-12-19
+Descripción: Compara el coste de dibujar 200 enemigos escalando el frame en cada draw()
+frente a hacer blit de frames pre-escalados desde la caché de animaciones.
+"""
+
+import os
+import sys
+import time
+import random
+
+# Ejecutable sin ventana (máquinas de build)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Añadir el directorio src al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, ENEMY_TYPES, ENEMY_SIZE
+from utils.image_loader import load_animation_frames, load_scaled_animation_frames
+
+NUM_ENEMIES = 200
+NUM_FRAMES = 120
+
+
+def _build_positions(count):
+    random.seed(0)
+    return [(random.randint(0, SCREEN_WIDTH - ENEMY_SIZE), random.randint(0, SCREEN_HEIGHT - ENEMY_SIZE))
+            for _ in range(count)]
+
+
+def bench_scale_per_draw(screen, frames, positions):
+    """Ruta antigua: pygame.transform.scale del frame original en cada draw()."""
+    size = (ENEMY_SIZE, ENEMY_SIZE)
+    start = time.perf_counter()
+    for frame_index in range(NUM_FRAMES):
+        screen.fill((0, 0, 0))
+        image = frames[frame_index % len(frames)]
+        for pos in positions:
+            screen.blit(pygame.transform.scale(image, size), pos)
+    return time.perf_counter() - start
+
+
+def bench_prescaled(screen, frames, positions):
+    """Ruta nueva: blit directo del frame pre-escalado."""
+    start = time.perf_counter()
+    for frame_index in range(NUM_FRAMES):
+        screen.fill((0, 0, 0))
+        image = frames[frame_index % len(frames)]
+        for pos in positions:
+            screen.blit(image, pos)
+    return time.perf_counter() - start
+
+
+def main():
+    # Los assets usan rutas relativas a la raíz del repositorio
+    os.chdir(os.path.join(os.path.dirname(__file__), '..'))
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    stats = ENEMY_TYPES["ZOMBIE_MALE"]
+    raw_frames = load_animation_frames(stats["image_folder"], "Idle", stats["idle_frames"])
+    scaled_frames = load_scaled_animation_frames(stats["image_folder"], "Idle", stats["idle_frames"], ENEMY_SIZE)
+    positions = _build_positions(NUM_ENEMIES)
+
+    before = bench_scale_per_draw(screen, raw_frames, positions)
+    after = bench_prescaled(screen, scaled_frames, positions)
+
+    print(f"=== DIBUJADO DE {NUM_ENEMIES} ENEMIGOS ({NUM_FRAMES} frames) ===")
+    print(f"   Escalado por draw(): {before / NUM_FRAMES * 1000:.3f} ms/frame")
+    print(f"   Frames pre-escalados: {after / NUM_FRAMES * 1000:.3f} ms/frame")
+    print(f"   Mejora: x{before / after:.1f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
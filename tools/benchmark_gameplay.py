@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Benchmark de estrés del gameplay
+Autor: Kava
+Fecha: 2024-12-19
+Descripción: Ejecuta escenarios guionizados (muchos enemigos, miles de proyectiles, disparos
+perforantes y una oleada completa del nivel 10) sobre el GameLoop real sin ventana, midiendo
+cada paso de simulación y cada render. Informa en JSON de los percentiles p50/p95/p99 del
+tiempo de frame, el desglose por fase (GameLoop.UPDATE_PHASES y RENDER_PHASES) y el pico de
+memoria residente. Cada escenario se ejecuta en su propio proceso para que el pico de RSS
+sea el suyo.
+
+Uso:
+    python tools/benchmark_gameplay.py                      # todos los escenarios
+    python tools/benchmark_gameplay.py --scenario enemies_200 --frames 300
+    python tools/benchmark_gameplay.py --engine batch --output benchmark.json
+    python tools/benchmark_gameplay.py --render-mode dirty
+    python tools/benchmark_gameplay.py --render-mode sprites --collisions groups
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+# Ejecutable sin ventana (máquinas de build)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+# Añadir el directorio src al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+try:
+    import resource  # No existe en Windows
+except ImportError:
+    resource = None
+
+import numpy as np
+import pygame
+from constants import (SCREEN_WIDTH, SCREEN_HEIGHT, ENEMY_SIZE, SIMULATION_RATE, PROJECTILE_ENGINE, RENDER_MODE,
+                       COLLISION_ENGINE)
+from entities.projectile_batch import ProjectileBatch
+from game_loop_improved import GameLoop
+from utils.advanced_logger import setup_logging
+from utils.input_replay import ReplayKeys
+
+# enemies / projectiles: población que se mantiene en cada frame (se repone lo que muere o sale)
+# level / wave: partida real del nivel indicado con disparo automático, sin población forzada
+SCENARIOS = {
+    "enemies_50": {"enemies": 50},
+    "enemies_200": {"enemies": 200},
+    "enemies_1000": {"enemies": 1000},
+    "projectiles_500": {"enemies": 50, "projectiles": 500},
+    "projectiles_5000": {"enemies": 50, "projectiles": 5000},
+    "piercing_2000": {"enemies": 200, "projectiles": 2000, "attack_type": "piercing_shot"},
+    "level_10_wave": {"level": 10, "wave": True},
+}
+DEFAULT_FRAMES = 600
+WARMUP_FRAMES = 60
+PERCENTILES = (50, 95, 99)
+
+
+def _peak_rss_mb():
+    """Pico de memoria residente del proceso en MB (None si no se puede medir)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa en KB, macOS en bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _summary(samples_ms):
+    """Percentiles, media y máximo de una lista de tiempos en ms."""
+    if not samples_ms:
+        return {}
+    values = np.asarray(samples_ms)
+    summary = {f"p{p}": round(float(np.percentile(values, p)), 4) for p in PERCENTILES}
+    summary["mean"] = round(float(values.mean()), 4)
+    summary["max"] = round(float(values.max()), 4)
+    return summary
+
+
+class _PhaseTimer:
+    """Envuelve los métodos de fase de una instancia de GameLoop y acumula su tiempo por frame."""
+
+    def __init__(self, game, phases):
+        self.frame = dict.fromkeys(phases, 0.0)
+        self.samples = {phase: [] for phase in phases}
+        for phase in phases:
+            setattr(game, phase, self._wrap(phase, getattr(game, phase)))
+
+    def _wrap(self, phase, method):
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.frame[phase] += time.perf_counter() - start
+        return timed
+
+    def end_frame(self, record):
+        """Cierra el frame: guarda los tiempos (si record) y los reinicia."""
+        for phase, elapsed in self.frame.items():
+            if record:
+                self.samples[phase].append(elapsed * 1000)
+            self.frame[phase] = 0.0
+
+
+def _populate(game, config, rng):
+    """Repone enemigos y proyectiles hasta la población del escenario."""
+    missing = config.get("enemies", 0) - len(game.enemies)
+    for _ in range(max(0, missing)):
+        enemy = game.enemy_generator.acquire_enemy(rng.randint(0, SCREEN_WIDTH - ENEMY_SIZE),
+                                                   rng.randint(0, SCREEN_HEIGHT * 2 // 3),
+                                                   rng.choice(["ZOMBIE_MALE", "ZOMBIE_GIRL"]), "NORMAL", game.sim_time)
+        game.enemies.append(enemy)
+
+    source = game._projectile_source()
+    attack_type = config.get("attack_type", "normal")
+    live = len(game.projectile_batch) if game.projectile_batch is not None else len(game.projectiles)
+    for _ in range(max(0, config.get("projectiles", 0) - live)):
+        # Desde la franja inferior hacia arriba, atravesando la zona de enemigos
+        x = rng.uniform(0, SCREEN_WIDTH)
+        projectile = source.acquire(attack_type, x, rng.uniform(SCREEN_HEIGHT // 3, SCREEN_HEIGHT),
+                                    x + rng.uniform(-200, 200), 0)
+        if game.projectile_batch is None:
+            game.projectiles.append(projectile)
+
+
+def _autofire_event(game):
+    """Clic sobre el primer enemigo (o hacia arriba), como headless.py --autofire."""
+    if game.enemies:
+        enemy = game.enemies[0]
+        pos = (int(enemy.x + enemy.size // 2), int(enemy.y + enemy.size // 2))
+    else:
+        pos = (SCREEN_WIDTH // 2, 0)
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)
+
+
+def run_scenario(name, frames=DEFAULT_FRAMES, engine=PROJECTILE_ENGINE, seed=0, render_mode=RENDER_MODE,
+                 collisions=COLLISION_ENGINE):
+    """
+    Ejecuta un escenario en este proceso y retorna sus resultados.
+
+    Cada frame es un paso de simulación más un render, como el bucle principal a 60 FPS.
+    Los primeros WARMUP_FRAMES no se cuentan (cachés de sprites y pools en frío), salvo en
+    las oleadas, que se miden completas.
+    """
+    config = SCENARIOS[name]
+    rng = random.Random(seed)
+    random.seed(seed)
+    logger = setup_logging("PyGame", "logs")
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    game = GameLoop(screen, logger)
+    game.menus_enabled = False
+    if engine == "batch" and game.projectile_batch is None:
+        game.projectile_batch = ProjectileBatch(SCREEN_WIDTH, SCREEN_HEIGHT, logger=logger)
+    elif engine == "objects":
+        game.projectile_batch = None
+    game.set_render_mode(render_mode)
+    game.collision_engine = collisions
+    game.start_game("Kava", config.get("level", 1))
+
+    wave = config.get("wave", False)
+    warmup = WARMUP_FRAMES
+    if wave:
+        # Oleada completa: toda la duración del nivel, desde el primer frame
+        frames = int(game.level_duration * SIMULATION_RATE)
+        warmup = 0
+    else:
+        # Población forzada: el jugador no muere y el nivel no termina
+        game.player.lives = 10 ** 9
+        game.level_duration = 10 ** 9
+
+    update_timer = _PhaseTimer(game, GameLoop.UPDATE_PHASES)
+    render_timer = _PhaseTimer(game, GameLoop.RENDER_PHASES)
+    keys = ReplayKeys()
+    step_ms, render_ms, frame_ms = [], [], []
+    entity_counts = []
+    for frame in range(warmup + frames):
+        if game.game_state != "playing":
+            break
+        if wave:
+            game._handle_events([_autofire_event(game)])
+        else:
+            _populate(game, config, rng)
+        record = frame >= warmup
+
+        start = time.perf_counter()
+        game._step(keys)
+        step_end = time.perf_counter()
+        if game.game_state == "playing":
+            game._render_game()
+        end = time.perf_counter()
+
+        update_timer.end_frame(record)
+        render_timer.end_frame(record)
+        if record:
+            step_ms.append((step_end - start) * 1000)
+            render_ms.append((end - step_end) * 1000)
+            frame_ms.append((end - start) * 1000)
+            projectiles = len(game.projectile_batch) if game.projectile_batch is not None else len(game.projectiles)
+            entity_counts.append((len(game.enemies), projectiles))
+
+    counts = np.asarray(entity_counts) if entity_counts else np.zeros((1, 2))
+    result = {
+        "scenario": name,
+        "config": config,
+        "engine": "batch" if game.projectile_batch is not None else "objects",
+        "render_mode": render_mode,
+        "collisions": collisions,
+        "frames": len(frame_ms),
+        "frame_ms": _summary(frame_ms),
+        "update_ms": _summary(step_ms),
+        "render_ms": _summary(render_ms),
+        "phases_ms": {phase: _summary(samples)
+                      for timer in (update_timer, render_timer) for phase, samples in timer.samples.items()},
+        "mean_enemies": round(float(counts[:, 0].mean()), 1),
+        "mean_projectiles": round(float(counts[:, 1].mean()), 1),
+        "score": game.score,
+        "state": game.game_state,
+        "peak_rss_mb": _peak_rss_mb()
+    }
+    game.cleanup()
+    pygame.quit()
+    return result
+
+
+def _run_isolated(name, frames, engine, seed, render_mode, collisions):
+    """Ejecuta un escenario en un proceso nuevo y retorna su JSON."""
+    command = [sys.executable, os.path.abspath(__file__), "--scenario", name, "--frames", str(frames),
+               "--engine", engine, "--seed", str(seed), "--render-mode", render_mode,
+               "--collisions", collisions]
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    return json.loads(output)["scenarios"][name]
+
+
+def _print_table(results):
+    """Resumen legible en stderr (stdout queda para el JSON)."""
+    print(f"{'escenario':<18} {'frames':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'RSS MB':>8}", file=sys.stderr)
+    for name, result in results.items():
+        frame = result["frame_ms"]
+        rss = result["peak_rss_mb"]
+        print(f"{name:<18} {result['frames']:>6} {frame.get('p50', 0):8.3f} {frame.get('p95', 0):8.3f} "
+              f"{frame.get('p99', 0):8.3f} {rss if rss is None else round(rss, 1):>8}", file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de estrés del gameplay")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), action="append",
+                        help="Escenario a ejecutar (repetible; por defecto todos)")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES,
+                        help="Frames medidos por escenario (las oleadas duran el nivel completo)")
+    parser.add_argument("--engine", choices=["objects", "batch"], default=PROJECTILE_ENGINE,
+                        help="Motor de proyectiles")
+    parser.add_argument("--render-mode", choices=["full", "dirty", "sprites"], default=RENDER_MODE,
+                        help="Render completo, por rectángulos sucios o con un grupo LayeredDirty")
+    parser.add_argument("--collisions", choices=["arrays", "groups"], default=COLLISION_ENGINE,
+                        help="Motor de colisiones (NumPy y rejillas o groupcollide/spritecollide)")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla aleatoria")
+    parser.add_argument("--output", default=None, help="Guardar también el JSON en este fichero")
+    args = parser.parse_args(argv)
+
+    names = args.scenario or list(SCENARIOS)
+    if len(names) == 1:
+        # Los print de depuración del juego no deben mezclarse con el JSON
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            results = {names[0]: run_scenario(names[0], args.frames, args.engine, args.seed, args.render_mode,
+                                                     args.collisions)}
+    else:
+        results = {}
+        for name in names:
+            print(f"Ejecutando {name}...", file=sys.stderr)
+            results[name] = _run_isolated(name, args.frames, args.engine, args.seed, args.render_mode,
+                                          args.collisions)
+
+    report = {
+        "python": sys.version.split()[0],
+        "pygame": pygame.version.ver,
+        "engine": args.engine,
+        "render_mode": args.render_mode,
+        "collisions": args.collisions,
+        "seed": args.seed,
+        "scenarios": results
+    }
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    _print_table(results)
+    print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark del coste por llamada de AdvancedLogger
+Autor: Kava
+Fecha: 2024-12-19
+Descripción: Mide cuánto cuesta una llamada a log_debug con el nivel DEBUG activo (escribe a
+archivo) y desactivado, pasando un f-string ya construido, una plantilla con argumentos o una
+función, o protegida con `if logger.debug_enabled:`, frente a una simple lectura de atributo.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+# Añadir el directorio src al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.advanced_logger import AdvancedLogger
+
+NUM_CALLS = 100000
+
+
+def _per_call_ns(function, calls):
+    start = time.perf_counter()
+    function(calls)
+    return (time.perf_counter() - start) / calls * 1e9
+
+
+def bench(logger, calls):
+    """Retorna los ns por llamada de cada forma de registrar el mensaje de un enemigo."""
+    enemy_type, damage, health = "ZOMBIE_MALE", 1, 2
+
+    def attribute(n):
+        for _ in range(n):
+            logger.name
+
+    def eager(n):
+        for _ in range(n):
+            logger.log_debug(f"Enemigo {enemy_type} recibe {damage} de daño. Salud restante: {health}", "enemy")
+
+    def template(n):
+        for _ in range(n):
+            logger.log_debug("Enemigo %s recibe %s de daño. Salud restante: %s", "enemy", enemy_type, damage, health)
+
+    def deferred(n):
+        for _ in range(n):
+            logger.log_debug(lambda: f"Enemigo {enemy_type} recibe {damage} de daño. Salud restante: {health}", "enemy")
+
+    def guarded(n):
+        for _ in range(n):
+            if logger.debug_enabled:
+                logger.log_debug("Enemigo %s recibe %s de daño. Salud restante: %s", "enemy", enemy_type, damage, health)
+
+    def check(n):
+        for _ in range(n):
+            logger.is_enabled(10, "enemy")
+
+    return {
+        "Lectura de atributo (referencia)": _per_call_ns(attribute, calls),
+        "is_enabled(DEBUG, 'enemy')": _per_call_ns(check, calls),
+        "log_debug con f-string": _per_call_ns(eager, calls),
+        "log_debug con plantilla + args": _per_call_ns(template, calls),
+        "log_debug con función": _per_call_ns(deferred, calls),
+        "if debug_enabled: log_debug(...)": _per_call_ns(guarded, calls),
+    }
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_CALLS
+    with tempfile.TemporaryDirectory() as log_dir:
+        logger = AdvancedLogger("BenchmarkLogging", log_dir)
+        # Con DEBUG activo cada llamada escribe en enemy.log y en game.log: menos llamadas
+        enabled = bench(logger, max(1, calls // 10))
+        logger.set_level("INFO")
+        disabled = bench(logger, calls)
+        for handler in logger.logger.handlers + [h for l in logger.component_loggers.values() for h in l.handlers]:
+            handler.close()
+
+    print("=== COSTE POR LLAMADA (ns) ===\n")
+    print(f"   {'':<34} {'DEBUG activo':>14} {'desactivado':>14}")
+    for name in disabled:
+        print(f"   {name:<34} {enabled[name]:14.0f} {disabled[name]:14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark del lote de proyectiles NumPy
+Autor: Kava
+Fecha: 2024-12-19
+Descripción: Compara mover y descartar miles de proyectiles como objetos Projectile
+(update + is_off_screen por objeto) frente a ProjectileBatch (un paso vectorizado).
+"""
+
+import os
+import sys
+import time
+import random
+
+# Ejecutable sin ventana (máquinas de build)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Añadir el directorio src al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, ATTACK_TYPES
+from entities.projectile import Projectile
+from entities.projectile_batch import ProjectileBatch
+
+NUM_PROJECTILES = 5000
+NUM_FRAMES = 120
+
+
+def _build_shots(count):
+    """Disparos aleatorios (tipo de ataque, origen y objetivo) repetibles."""
+    random.seed(0)
+    attack_types = list(ATTACK_TYPES)
+    return [(random.choice(attack_types),
+             random.uniform(0, SCREEN_WIDTH), random.uniform(0, SCREEN_HEIGHT),
+             random.uniform(-SCREEN_WIDTH, 2 * SCREEN_WIDTH), random.uniform(-SCREEN_HEIGHT, 2 * SCREEN_HEIGHT))
+            for _ in range(count)]
+
+
+def bench_objects(shots):
+    """Ruta de objetos: una llamada a update() e is_off_screen() por proyectil."""
+    projectiles = []
+    for attack_type, x, y, target_x, target_y in shots:
+        props = ATTACK_TYPES[attack_type]
+        projectiles.append(Projectile(x, y, target_x, target_y, size=props["projectile_size"],
+                                      speed=props["projectile_speed"], image_path=props["image"],
+                                      piercing=props["piercing"], damage=props["damage"]))
+    start = time.perf_counter()
+    for _ in range(NUM_FRAMES):
+        for projectile in projectiles:
+            projectile.update()
+        projectiles = [p for p in projectiles if not p.is_off_screen(SCREEN_WIDTH, SCREEN_HEIGHT)]
+    return (time.perf_counter() - start) / NUM_FRAMES, len(projectiles)
+
+
+def bench_batch(shots):
+    """Ruta NumPy: mover, descartar y compactar en un paso por frame."""
+    batch = ProjectileBatch(SCREEN_WIDTH, SCREEN_HEIGHT)
+    for attack_type, x, y, target_x, target_y in shots:
+        batch.acquire(attack_type, x, y, target_x, target_y)
+    start = time.perf_counter()
+    for _ in range(NUM_FRAMES):
+        batch.step()
+    return (time.perf_counter() - start) / NUM_FRAMES, batch.count
+
+
+def main():
+    # Los assets usan rutas relativas a la raíz del repositorio
+    os.chdir(os.path.join(os.path.dirname(__file__), '..'))
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    num_projectiles = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_PROJECTILES
+    shots = _build_shots(num_projectiles)
+    objects_time, objects_left = bench_objects(shots)
+    batch_time, batch_left = bench_batch(shots)
+
+    print(f"=== MOVIMIENTO Y DESCARTE DE {num_projectiles} PROYECTILES ({NUM_FRAMES} frames) ===")
+    print(f"   Objetos Projectile: {objects_time * 1000:.3f} ms/frame ({objects_left} vivos al final)")
+    print(f"   ProjectileBatch: {batch_time * 1000:.3f} ms/frame ({batch_left} vivos al final)")
+    print(f"   Mejora: x{objects_time / batch_time:.1f}")
+    pygame.quit()
+    if objects_left != batch_left:
+        print("   ERROR: las dos rutas no descartan los mismos proyectiles")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark de la cola de render
+Autor: Kava
+Fecha: 2024-12-19
+Descripción: Compara dibujar 100, 500 y 2000 entidades con un screen.blit por entidad (draw())
+frente a encolarlas por capas y enviarlas con un fblits por capa (enqueue() + RenderQueue.flush()).
+Una de cada cuatro entidades es un enemigo con barra de vida; el resto son proyectiles.
+"""
+
+import os
+import sys
+import time
+import random
+
+# Ejecutable sin ventana (máquinas de build)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Añadir el directorio src al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, ATTACK_TYPES, ENEMY_TYPES, ENEMY_SIZE
+from entities.enemy import Enemy
+from entities.projectile import Projectile
+from utils.render_queue import RenderQueue
+
+SPRITE_COUNTS = (100, 500, 2000)
+NUM_FRAMES = 120
+
+
+def _build_entities(count):
+    """Entidades en posiciones aleatorias repetibles: 1 de cada 4 enemigo, el resto proyectiles."""
+    random.seed(0)
+    attack_types = list(ATTACK_TYPES)
+    enemy_types = list(ENEMY_TYPES)
+    entities = []
+    for i in range(count):
+        x = random.uniform(0, SCREEN_WIDTH - ENEMY_SIZE)
+        y = random.uniform(20, SCREEN_HEIGHT - ENEMY_SIZE)
+        if i % 4 == 0:
+            enemy = Enemy(x, y, random.choice(enemy_types))
+            enemy.health = random.randint(1, enemy.max_health)
+            entities.append(enemy)
+        else:
+            props = ATTACK_TYPES[random.choice(attack_types)]
+            entities.append(Projectile(x, y, x, y - 100, size=props["projectile_size"],
+                                       speed=props["projectile_speed"], image_path=props["image"]))
+    return entities
+
+
+def bench_per_entity(screen, entities):
+    """Ruta por entidad: cada draw() hace sus propios screen.blit."""
+    start = time.perf_counter()
+    for _ in range(NUM_FRAMES):
+        screen.fill((0, 0, 0))
+        for entity in entities:
+            entity.draw(screen)
+    return (time.perf_counter() - start) / NUM_FRAMES
+
+
+def bench_queue(screen, entities):
+    """Ruta en lote: enqueue() de cada entidad y un fblits por capa."""
+    queue = RenderQueue()
+    start = time.perf_counter()
+    for _ in range(NUM_FRAMES):
+        screen.fill((0, 0, 0))
+        for entity in entities:
+            entity.enqueue(queue)
+        queue.flush(screen)
+    return (time.perf_counter() - start) / NUM_FRAMES
+
+
+def main():
+    # Los assets usan rutas relativas a la raíz del repositorio
+    os.chdir(os.path.join(os.path.dirname(__file__), '..'))
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    submit = "fblits" if hasattr(screen, "fblits") else "blits"
+
+    print(f"=== COLA DE RENDER ({NUM_FRAMES} frames, envío con {submit}) ===")
+    for count in SPRITE_COUNTS:
+        entities = _build_entities(count)
+        # Calentar las cachés de sprites y tiras de vida antes de medir
+        bench_per_entity(screen, entities[:1])
+        per_entity = bench_per_entity(screen, entities)
+        batched = bench_queue(screen, entities)
+        print(f"   {count:5d} entidades: blit por entidad {per_entity * 1000:7.3f} ms/frame | "
+              f"cola por capas {batched * 1000:7.3f} ms/frame | x{per_entity / batched:.2f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark de la rejilla espacial de colisiones
+Autor: Kava
+Fecha: 2024-12-19
+Descripción: Compara la comprobación de colisiones proyectil-enemigo por fuerza bruta
+(P×E colliderect) con la rejilla espacial (reconstrucción + una consulta por proyectil).
+"""
+
+import os
+import sys
+import time
+import random
+
+# Añadir el directorio src al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, ENEMY_SIZE
+from utils.spatial_hash import SpatialHashGrid
+
+NUM_ENEMIES = 500
+NUM_PROJECTILES = 2000
+PROJECTILE_SIZE = 32
+NUM_FRAMES = 50
+
+
+class _Body:
+    """Objeto mínimo con caja de colisión (como Enemy)."""
+
+    def __init__(self, x, y, size):
+        self.collision_box = pygame.Rect(x, y, size, size)
+
+
+def _build_scene(num_enemies, num_projectiles):
+    random.seed(0)
+    enemies = [_Body(random.randint(0, SCREEN_WIDTH - ENEMY_SIZE), random.randint(0, SCREEN_HEIGHT - ENEMY_SIZE), ENEMY_SIZE)
+               for _ in range(num_enemies)]
+    projectile_rects = [pygame.Rect(random.randint(0, SCREEN_WIDTH - PROJECTILE_SIZE),
+                                    random.randint(0, SCREEN_HEIGHT - PROJECTILE_SIZE),
+                                    PROJECTILE_SIZE, PROJECTILE_SIZE)
+                        for _ in range(num_projectiles)]
+    return enemies, projectile_rects
+
+
+def bench_brute_force(enemies, projectile_rects, frames):
+    """Ruta antigua: cada proyectil contra cada enemigo."""
+    hits = 0
+    start = time.perf_counter()
+    for _ in range(frames):
+        hits = 0
+        for rect in projectile_rects:
+            for enemy in enemies:
+                if rect.colliderect(enemy.collision_box):
+                    hits += 1
+    return (time.perf_counter() - start) / frames, hits
+
+
+def bench_grid(enemies, projectile_rects, frames):
+    """Ruta nueva: reconstruir la rejilla y consultar cada proyectil."""
+    grid = SpatialHashGrid(SCREEN_WIDTH, SCREEN_HEIGHT, ENEMY_SIZE)
+    hits = 0
+    rebuild_time = 0.0
+    start = time.perf_counter()
+    for _ in range(frames):
+        rebuild_start = time.perf_counter()
+        grid.rebuild(enemies)
+        rebuild_time += time.perf_counter() - rebuild_start
+        hits = 0
+        for rect in projectile_rects:
+            hits += len(grid.query(rect))
+    return (time.perf_counter() - start) / frames, rebuild_time / frames, hits
+
+
+def main():
+    # Uso: python tools/benchmark_spatial_hash.py [nº enemigos] [nº proyectiles]
+    num_enemies = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_ENEMIES
+    num_projectiles = int(sys.argv[2]) if len(sys.argv) > 2 else NUM_PROJECTILES
+    enemies, projectile_rects = _build_scene(num_enemies, num_projectiles)
+
+    brute_frames = max(1, NUM_FRAMES // 10)
+    brute, brute_hits = bench_brute_force(enemies, projectile_rects, brute_frames)
+    grid_total, grid_rebuild, grid_hits = bench_grid(enemies, projectile_rects, NUM_FRAMES)
+
+    print(f"=== COLISIONES: {num_enemies} ENEMIGOS x {num_projectiles} PROYECTILES ===")
+    print(f"   Fuerza bruta: {brute * 1000:.3f} ms/frame ({brute_hits} solapes)")
+    print(f"   Rejilla espacial: {grid_total * 1000:.3f} ms/frame ({grid_hits} solapes)")
+    print(f"      Reconstrucción: {grid_rebuild * 1000:.3f} ms/frame")
+    print(f"      Consultas: {(grid_total - grid_rebuild) * 1000:.3f} ms/frame")
+    print(f"   Mejora: x{brute / grid_total:.1f}")
+    if brute_hits != grid_hits:
+        print("   ERROR: la rejilla no encuentra los mismos solapes que la fuerza bruta")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
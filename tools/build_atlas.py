@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Constructor de atlas de texturas para PyGame Shooter
+Autor: Kava
+Fecha: 2024-12-19
+Descripción: Empaqueta las animaciones de cada personaje de assets/images/characters en
+una o varias páginas de atlas recortadas más un índice JSON con rects, offsets y duraciones.
+El juego las carga con utils.sprite_sheet.TextureAtlas en lugar de abrir cada PNG.
+"""
+
+import os
+import re
+import sys
+import json
+
+import pygame
+
+CHARACTERS_DIR = os.path.join("assets", "images", "characters")
+ATLAS_DIR = os.path.join("assets", "atlases")
+ATLAS_INDEX_NAME = "atlas.json"
+MAX_PAGE_SIZE = 4096
+PADDING = 1
+DEFAULT_FRAME_DURATION = 0.1  # Igual que animation_speed de Player/Enemy
+
+FRAME_PATTERN = re.compile(r"^(?P<name>.+) \((?P<index>\d+)\)\.png$")
+
+
+def find_animation_frames(character_dir):
+    """
+    Localiza los frames de cada animación de un personaje.
+
+    Soporta las dos estructuras usadas en assets: frames en la carpeta del personaje
+    (zombiemale/Idle (1).png) o en subcarpetas por animación (guerrero/idle/Idle (1).png).
+
+    Returns:
+        Diccionario {animación: {nº frame: ruta}}
+    """
+    animations = {}
+    for root, _, files in os.walk(character_dir):
+        for file_name in files:
+            match = FRAME_PATTERN.match(file_name)
+            if not match:
+                continue
+            name = match.group("name")
+            index = int(match.group("index"))
+            # Igual que en runtime, la subcarpeta con el nombre de la animación tiene prioridad
+            frames = animations.setdefault(name, {})
+            if index not in frames or os.path.basename(root) == name.lower():
+                frames[index] = os.path.join(root, file_name)
+    return animations
+
+
+def _pack_shelves(sizes, max_size):
+    """
+    Empaquetado por estantes de rectángulos (ordenados por altura descendente).
+
+    Returns:
+        Lista de (página, x, y) en el mismo orden que sizes y lista de tamaños de página
+    """
+    order = sorted(range(len(sizes)), key=lambda i: sizes[i][1], reverse=True)
+    placements = [None] * len(sizes)
+    pages = []
+    page, x, y, shelf_height, used_width = 0, 0, 0, 0, 0
+
+    for i in order:
+        width, height = sizes[i]
+        if x + width > max_size:
+            # Nueva fila
+            x = 0
+            y += shelf_height + PADDING
+            shelf_height = 0
+        if y + height > max_size:
+            # Nueva página
+            pages.append((used_width, y + shelf_height))
+            page += 1
+            x, y, shelf_height, used_width = 0, 0, 0, 0
+        placements[i] = (page, x, y)
+        x += width + PADDING
+        shelf_height = max(shelf_height, height)
+        used_width = max(used_width, x - PADDING)
+    pages.append((used_width, y + shelf_height))
+    return placements, pages
+
+
+def build_character_atlas(character_dir, output_dir):
+    """
+    Construye el atlas de un personaje.
+
+    Args:
+        character_dir: Carpeta con los PNG del personaje
+        output_dir: Carpeta destino de las páginas y el índice
+
+    Returns:
+        Número de frames empaquetados
+    """
+    animations = find_animation_frames(character_dir)
+    if not animations:
+        return 0
+
+    entries = []
+    for name in sorted(animations):
+        for index in sorted(animations[name]):
+            image = pygame.image.load(animations[name][index])
+            trim_rect = image.get_bounding_rect()
+            if trim_rect.width == 0 or trim_rect.height == 0:
+                trim_rect = pygame.Rect(0, 0, 1, 1)
+            entries.append({
+                "animation": name,
+                "index": index,
+                "image": image.subsurface(trim_rect),
+                "offset": (trim_rect.x, trim_rect.y),
+                "source_size": image.get_size()
+            })
+
+    placements, page_sizes = _pack_shelves([entry["image"].get_size() for entry in entries], MAX_PAGE_SIZE)
+
+    os.makedirs(output_dir, exist_ok=True)
+    pages = [pygame.Surface(size, pygame.SRCALPHA, 32) for size in page_sizes]
+    index_data = {
+        "version": 1,
+        "source": character_dir.replace(os.sep, "/"),
+        "pages": [],
+        "animations": {}
+    }
+
+    for entry, (page, x, y) in zip(entries, placements):
+        pages[page].blit(entry["image"], (x, y))
+        width, height = entry["image"].get_size()
+        animation = index_data["animations"].setdefault(entry["animation"], {
+            "duration": DEFAULT_FRAME_DURATION,
+            "frames": {}
+        })
+        animation["frames"][str(entry["index"])] = {
+            "page": page,
+            "rect": [x, y, width, height],
+            "offset": list(entry["offset"]),
+            "source_size": list(entry["source_size"])
+        }
+
+    for page_number, page_surface in enumerate(pages):
+        page_name = f"atlas_{page_number}.png"
+        pygame.image.save(page_surface, os.path.join(output_dir, page_name))
+        index_data["pages"].append(page_name)
+
+    with open(os.path.join(output_dir, ATLAS_INDEX_NAME), "w", encoding="utf-8") as f:
+        json.dump(index_data, f, indent=1)
+
+    return len(entries)
+
+
+def build_all_atlases(characters_dir=CHARACTERS_DIR, atlas_dir=ATLAS_DIR):
+    """Construye el atlas de cada carpeta de personaje."""
+    total_frames = 0
+    for character in sorted(os.listdir(characters_dir)):
+        character_dir = os.path.join(characters_dir, character)
+        if not os.path.isdir(character_dir):
+            continue
+        frames = build_character_atlas(character_dir, os.path.join(atlas_dir, character))
+        total_frames += frames
+        print(f"Atlas de {character}: {frames} frames")
+    print(f"Atlas generados en {atlas_dir}: {total_frames} frames en total")
+    return total_frames
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2:
+        print("Uso: python tools/build_atlas.py [directorio_salida]")
+        sys.exit(1)
+
+    pygame.init()
+    build_all_atlases(atlas_dir=sys.argv[1] if len(sys.argv) == 2 else ATLAS_DIR)
+    pygame.quit()
@@ -3,6 +3,7 @@ import sys
 import subprocess
 import shutil
 import zipfile
+from build_atlas import build_all_atlases
 
 def get_current_version():
     with open("VERSION.txt", "r") as f:
@@ -44,6 +45,9 @@ def package_project(version):
     if os.path.exists(dist_dir):
         shutil.rmtree(dist_dir)
 
+    # Generar los atlas de personajes para que se incluyan con los assets
+    build_all_atlases()
+
     # Comando PyInstaller
     if sys.platform == "win32":
         data_sep = ";"
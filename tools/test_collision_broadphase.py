@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Prueba de la broadphase de colisiones por lotes
+Autor: Kava
+Fecha: 2024-12-19
+Descripción: Compara utils.collision (find_overlaps + resolve_projectile_hits) con el bucle
+anidado de colliderect que usaba GameLoop, en escenas aleatorias con proyectiles normales y
+perforantes, para los dos métodos de broadphase.
+"""
+
+import os
+import sys
+import random
+
+# Añadir el directorio src al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, ENEMY_SIZE, PROJECTILE_PIERCING_HITS
+from utils.collision import find_overlaps, rects_to_array, resolve_projectile_hits
+
+NUM_SCENES = 200
+
+
+def _random_scene(rng):
+    """Genera proyectiles (rect, perforante, impactos previos, daño) y enemigos (rect, salud)."""
+    num_projectiles = rng.randint(0, 120)
+    num_enemies = rng.randint(0, 40)
+    projectiles = []
+    for _ in range(num_projectiles):
+        size = rng.choice([10, 32])
+        piercing = rng.random() < 0.4
+        projectiles.append({
+            "rect": pygame.Rect(rng.randint(-20, SCREEN_WIDTH), rng.randint(-20, SCREEN_HEIGHT), size, size),
+            "piercing": piercing,
+            "piercing_hits": rng.randint(0, PROJECTILE_PIERCING_HITS - 1) if piercing else 0,
+            "damage": rng.choice([1, 2])
+        })
+    enemies = [{
+        "rect": pygame.Rect(rng.randint(0, SCREEN_WIDTH - ENEMY_SIZE), rng.randint(0, SCREEN_HEIGHT // 3), ENEMY_SIZE, ENEMY_SIZE),
+        "health": rng.randint(1, 4)
+    } for _ in range(num_enemies)]
+    return projectiles, enemies
+
+
+def reference_loop(projectiles, enemies):
+    """Bucle original de GameLoop._update_game (proyectiles en orden, enemigos en orden de lista)."""
+    hits = []
+    consumed = []
+    health = [enemy["health"] for enemy in enemies]
+    alive_enemies = list(range(len(enemies)))
+    for p_index, projectile in enumerate(projectiles):
+        piercing_hits = projectile["piercing_hits"]
+        for e_index in alive_enemies[:]:
+            if projectile["rect"].colliderect(enemies[e_index]["rect"]):
+                hits.append((p_index, e_index))
+                health[e_index] -= projectile["damage"]
+                if health[e_index] <= 0:
+                    alive_enemies.remove(e_index)
+                if projectile["piercing"]:
+                    piercing_hits += 1
+                    if piercing_hits >= PROJECTILE_PIERCING_HITS:
+                        consumed.append(p_index)
+                        break
+                else:
+                    consumed.append(p_index)
+                    break
+    return hits, consumed
+
+
+def batched(projectiles, enemies, method):
+    """Ruta nueva: broadphase NumPy + resolución de impactos."""
+    ia, ib = find_overlaps(rects_to_array([p["rect"] for p in projectiles]),
+                           rects_to_array([e["rect"] for e in enemies]), method)
+    return resolve_projectile_hits(ia, ib,
+                                   [p["piercing"] for p in projectiles],
+                                   [p["piercing_hits"] for p in projectiles],
+                                   [p["damage"] for p in projectiles],
+                                   [e["health"] for e in enemies],
+                                   PROJECTILE_PIERCING_HITS)
+
+
+def test_against_reference():
+    """Prueba que ambos métodos producen los mismos impactos que el bucle original."""
+    print("=== BROADPHASE VS BUCLE ORIGINAL ===\n")
+    rng = random.Random(1234)
+    total_hits = 0
+    failures = 0
+    for scene in range(NUM_SCENES):
+        projectiles, enemies = _random_scene(rng)
+        expected = reference_loop(projectiles, enemies)
+        total_hits += len(expected[0])
+        for method in ("broadcast", "sorted"):
+            result = batched(projectiles, enemies, method)
+            if result != expected:
+                failures += 1
+                print(f"❌ Escena {scene} ({method}): {result} != {expected}")
+    if failures:
+        print(f"\n❌ {failures} discrepancias")
+        return False
+    print(f"✅ {NUM_SCENES} escenas x 2 métodos idénticas al bucle original ({total_hits} impactos)")
+    return True
+
+
+def test_edge_cases():
+    """Prueba bordes que se tocan (no colisionan) y rectángulos vacíos, igual que colliderect."""
+    print("\n=== CASOS LÍMITE ===\n")
+    a = [pygame.Rect(0, 0, 10, 10), pygame.Rect(10, 0, 10, 10), pygame.Rect(5, 5, 0, 10), pygame.Rect(-5, -5, 6, 6)]
+    b = [pygame.Rect(10, 0, 5, 5), pygame.Rect(0, 0, 1, 1), pygame.Rect(3, 3, 10, 10)]
+    expected = sorted((i, j) for i, ra in enumerate(a) for j, rb in enumerate(b) if ra.colliderect(rb))
+    ok = True
+    for method in ("broadcast", "sorted"):
+        ia, ib = find_overlaps(rects_to_array(a), rects_to_array(b), method)
+        pairs = list(zip(ia.tolist(), ib.tolist()))
+        if pairs != expected:
+            ok = False
+            print(f"❌ {method}: {pairs} != {expected}")
+    if ok:
+        print(f"✅ Bordes y rectángulos vacíos: {expected}")
+    return ok
+
+
+if __name__ == "__main__":
+    results = [test_against_reference(), test_edge_cases()]
+    sys.exit(0 if all(results) else 1)